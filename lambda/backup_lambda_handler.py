@@ -1,15 +1,23 @@
 """AWS Lambda handler for processing X12 EDI documents."""
 
-import json
-from typing import Any, Dict, Optional
+import logging
+import os
+import time
+from functools import lru_cache
+from io import BytesIO
+from typing import Any, Dict, List, Optional
 
+import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from boto3.s3.transfer import TransferConfig
 
 from ..core.config import get_settings
-from ..core.exceptions import X12ProcessingError
+from ..core.exceptions import InputError, X12ProcessingError
 from ..input.s3_input import S3Input
 from ..input.local_input import LocalInput
+from ..parsers.tokenizer import find_segment
 from ..parsers.x12_277_parser import X12_277_Parser
 from ..parsers.x12_835_parser import X12_835_Parser
 
@@ -17,6 +25,15 @@ logger = Logger()
 tracer = Tracer()
 settings = get_settings()
 
+# Number of leading bytes scanned when auto-detecting the transaction type
+DETECT_WINDOW = 4096
+
+# Shared S3 client, created on first use and reused across warm invocations
+_s3_client = None
+
+# Outputs above 8 MB are uploaded as concurrent multipart chunks
+TRANSFER_CONFIG = TransferConfig(multipart_threshold=8 * 1024 * 1024, max_concurrency=4)
+
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
@@ -45,7 +62,9 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         Response dict with processing results
     """
     try:
-        logger.info("Processing X12 EDI document", extra={"event": event})
+        logger.info("Processing X12 EDI document")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Lambda event", extra={"event": event})
         
         # Check if this is an S3 event
         if "Records" in event and event["Records"]:
@@ -60,36 +79,49 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         input_source = event.get("input_source", "s3")
         transaction_type = event.get("transaction_type", "auto")
         
-        # Read input
-        x12_content = _read_input(event, input_source)
+        # Read input as raw bytes
+        x12_bytes = _read_input(event, input_source)
         
-        # Log the first 200 characters to verify content
-        logger.info(f"Read X12 content ({len(x12_content)} bytes). First 200 chars: {x12_content[:200]}")
+        # Log size at INFO; the first 200 characters are only sliced and
+        # decoded when DEBUG is enabled
+        logger.info("Read X12 content", extra={"bytes": len(x12_bytes)})
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("X12 content preview", extra={
+                "preview": x12_bytes[:200].decode("utf-8", "replace")
+            })
         
         # Auto-detect transaction type if needed
         if transaction_type == "auto":
-            transaction_type = _detect_transaction_type(x12_content)
+            transaction_type = _detect_transaction_type(x12_bytes)
             logger.info(f"Auto-detected transaction type: {transaction_type}")
         
-        # Parse document
+        # Parse document (parsers work on str, so decode once here)
         parser = _get_parser(transaction_type)
+        try:
+            x12_content = x12_bytes.decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise InputError(f"Failed to decode X12 content: {str(e)}")
         parsed_data = parser.parse(x12_content)
         
         # Validate if enabled
+        validation_errors = []
         if settings.ENABLE_VALIDATION:
             validation_errors = parser.validate(parsed_data)
             if validation_errors and settings.STRICT_MODE:
                 return {
                     "statusCode": 400,
-                    "body": json.dumps({
+                    "body": orjson.dumps({
                         "error": "Validation failed",
                         "validation_errors": validation_errors
-                    })
+                    }).decode()
                 }
-            parsed_data["validation_errors"] = validation_errors
         
-        # Write output (implementation depends on output handler)
-        output_location = _write_output(event, parsed_data)
+        # "_summary" only feeds the response; keep it out of the written output
+        summary = _create_summary(parsed_data, validation_errors)
+        del parsed_data["_summary"]
+        
+        # Write output; validation errors go to a separate *_errors.json
+        output_location = _write_output(event, parsed_data, validation_errors)
         
         logger.info("Successfully processed X12 document", extra={
             "transaction_type": transaction_type,
@@ -98,36 +130,36 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         
         return {
             "statusCode": 200,
-            "body": json.dumps({
+            "body": orjson.dumps({
                 "message": "Successfully processed X12 document",
                 "transaction_type": transaction_type,
                 "output_location": output_location,
-                "summary": _create_summary(parsed_data)
-            })
+                "summary": summary
+            }).decode()
         }
         
     except X12ProcessingError as e:
         logger.error(f"X12 processing error: {str(e)}", exc_info=True)
         return {
             "statusCode": 400,
-            "body": json.dumps({
+            "body": orjson.dumps({
                 "error": "X12 processing error",
                 "message": str(e)
-            })
+            }).decode()
         }
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
         return {
             "statusCode": 500,
-            "body": json.dumps({
+            "body": orjson.dumps({
                 "error": "Internal server error",
                 "message": str(e)
-            })
+            }).decode()
         }
 
 
-def _read_input(event: Dict[str, Any], source: str) -> str:
-    """Read input from specified source."""
+def _read_input(event: Dict[str, Any], source: str) -> bytes:
+    """Read raw input bytes from specified source."""
     if source == "s3":
         bucket = event.get("bucket")
         key = event.get("key")
@@ -135,7 +167,7 @@ def _read_input(event: Dict[str, Any], source: str) -> str:
             raise ValueError("S3 source requires 'bucket' and 'key'")
         
         input_handler = S3Input(bucket=bucket, key=key)
-        return input_handler.read()
+        return input_handler.read_bytes()
     
     elif source == "local":
         file_path = event.get("file_path")
@@ -143,25 +175,34 @@ def _read_input(event: Dict[str, Any], source: str) -> str:
             raise ValueError("Local source requires 'file_path'")
         
         input_handler = LocalInput(file_path=file_path)
-        return input_handler.read()
+        return input_handler.read_bytes()
     
     else:
         raise ValueError(f"Unsupported input source: {source}")
 
 
-def _detect_transaction_type(x12_content: str) -> str:
-    """Auto-detect X12 transaction type from ST segment."""
-    lines = x12_content.split('~')
-    for line in lines:
-        if line.strip().startswith('ST'):
-            elements = line.split('*')
-            if len(elements) >= 2:
-                return elements[1]
-    return "unknown"
+def _detect_transaction_type(x12_bytes: bytes) -> str:
+    """Auto-detect X12 transaction type from ST segment.
+    
+    The ST segment directly follows the ISA/GS envelope, so only the first
+    DETECT_WINDOW bytes are scanned instead of splitting the whole file. An
+    ST segment cut off by the window is looked up in the full content.
+    """
+    st_segment = find_segment(x12_bytes[:DETECT_WINDOW], b"ST", complete=True)
+    if st_segment is None:
+        st_segment = find_segment(x12_bytes, b"ST")
+    if st_segment is None:
+        return "unknown"
+    return st_segment.split(b"*", 2)[1].decode("utf-8")
 
 
+@lru_cache(maxsize=None)
 def _get_parser(transaction_type: str):
-    """Get appropriate parser for transaction type."""
+    """Get appropriate parser for transaction type.
+    
+    Parser instances hold no per-parse state, so one instance per type is
+    cached and reused across warm Lambda invocations.
+    """
     if transaction_type == "277":
         return X12_277_Parser()
     elif transaction_type == "835":
@@ -170,11 +211,20 @@ def _get_parser(transaction_type: str):
         raise ValueError(f"Unsupported transaction type: {transaction_type}")
 
 
-def _write_output(event: Dict[str, Any], data: Dict[str, Any]) -> str:
-    """Write output to specified destination."""
-    import boto3
-    from datetime import datetime
-    
+def _get_s3_client():
+    """Get the shared S3 client, creating it on first use."""
+    global _s3_client
+    if _s3_client is None:
+        _s3_client = boto3.client("s3")
+    return _s3_client
+
+
+def _write_output(
+    event: Dict[str, Any],
+    data: Dict[str, Any],
+    validation_errors: Optional[List[str]] = None
+) -> str:
+    """Write output and any validation errors to specified destination."""
     output_dest = event.get("output_destination", "s3")
     
     if output_dest == "s3":
@@ -182,45 +232,57 @@ def _write_output(event: Dict[str, Any], data: Dict[str, Any]) -> str:
         prefix = event.get("output_prefix", "output/")
         
         # Generate unique filename with timestamp
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
         transaction_type = data.get("transaction_type", "unknown")
         
         # Extract original filename from event if available
         original_key = event.get("key", "")
         if original_key:
-            original_filename = original_key.split("/")[-1].replace(".x12", "")
+            original_filename = original_key.rpartition("/")[2].removesuffix(".x12")
             output_key = f"{prefix}{original_filename}_{timestamp}.json"
         else:
             output_key = f"{prefix}{transaction_type}_{timestamp}.json"
         
-        # Write to S3
-        s3_client = boto3.client("s3")
-        s3_client.put_object(
-            Bucket=bucket,
-            Key=output_key,
-            Body=json.dumps(data, indent=2),
-            ContentType="application/json"
+        # Stream to S3 (single PUT below the multipart threshold)
+        body = BytesIO(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+        _get_s3_client().upload_fileobj(
+            body,
+            bucket,
+            output_key,
+            ExtraArgs={"ContentType": "application/json"},
+            Config=TRANSFER_CONFIG
         )
+        if validation_errors:
+            _get_s3_client().put_object(
+                Bucket=bucket,
+                Key=_errors_path(output_key),
+                Body=orjson.dumps({"validation_errors": validation_errors}),
+                ContentType="application/json"
+            )
         
         logger.info(f"Wrote output to s3://{bucket}/{output_key}")
         return f"s3://{bucket}/{output_key}"
     
     elif output_dest == "local":
         output_path = event.get("output_path", "/tmp/result.json")
-        with open(output_path, "w") as f:
-            json.dumps(data, f, indent=2)
+        with open(output_path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+        if validation_errors:
+            with open(_errors_path(output_path), "wb") as f:
+                f.write(orjson.dumps({"validation_errors": validation_errors}))
         return output_path
     
     return "in-memory"
 
 
-def _create_summary(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Create processing summary."""
-    transactions = parsed_data.get("transactions", [])
-    
-    return {
-        "transaction_type": parsed_data.get("transaction_type"),
-        "version": parsed_data.get("version"),
-        "transaction_count": len(transactions),
-        "has_validation_errors": bool(parsed_data.get("validation_errors"))
-    }
+def _errors_path(output_path: str) -> str:
+    """Return the validation errors location for an output path or key."""
+    return f"{os.path.splitext(output_path)[0]}_errors.json"
+
+
+def _create_summary(parsed_data: Dict[str, Any], validation_errors: List[str]) -> Dict[str, Any]:
+    """Create processing summary from the parser's precomputed _summary."""
+    summary = parsed_data["_summary"].copy()
+    summary["has_validation_errors"] = bool(validation_errors)
+    summary["validation_error_count"] = len(validation_errors)
+    return summary
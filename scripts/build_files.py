@@ -0,0 +1,63 @@
+"""
+Shared file collection helpers for the Lambda build scripts.
+
+Used by build_zip.py (code package) and build_layer.py (dependency layer)
+so both walk directories and read files the same way.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+def iter_files(root, prefix):
+    """
+    Yield (path, arcname) pairs for every file under root.
+
+    Uses os.scandir so each entry carries cached type information, and
+    builds archive names by string slicing rather than Path arithmetic.
+    __pycache__ directories and .pyc files are skipped; symlinked
+    directories are not followed (same as os.walk).
+
+    Args:
+        root: Directory to walk
+        prefix: Prefix prepended to each archive name (e.g. 'src/')
+    """
+    root = os.fspath(root)
+    root_len = len(root) + 1
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name != "__pycache__" and not entry.is_symlink():
+                        stack.append(entry.path)
+                elif not entry.name.endswith(".pyc"):
+                    yield entry.path, prefix + entry.path[root_len:]
+
+
+def prefetch(entries, workers=8, batch_size=64):
+    """
+    Yield (path, arcname, data) with file contents read by a thread pool.
+
+    File reads release the GIL, so up to `workers` reads overlap with
+    DEFLATE running on the calling thread. Entries are submitted in batches
+    and each batch is drained in order, keeping ZIP member order stable.
+
+    Args:
+        entries: Iterable of (path, arcname) pairs
+        workers: Number of reader threads
+        batch_size: Files read ahead per batch
+    """
+    entries = list(entries)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for start in range(0, len(entries), batch_size):
+            batch = entries[start : start + batch_size]
+            futures = [pool.submit(_read_bytes, path) for path, _ in batch]
+            for (path, arcname), future in zip(batch, futures):
+                yield path, arcname, future.result()
+
+
+def _read_bytes(path):
+    """Read a file's full contents."""
+    with open(path, "rb") as f:
+        return f.read()
@@ -24,10 +24,17 @@ Usage:
 Output:
     lambda_layer.zip - Ready for deployment as Lambda Layer
 """
-import os
 import zipfile
 from pathlib import Path
 
+from build_files import iter_files, prefetch
+
+# Already-compressed formats gain nothing from DEFLATE, so they are stored as-is
+STORED_SUFFIXES = ('.whl', '.zip', '.gz', '.bz2', '.xz', '.jar')
+
+# Compiled extensions (.so) shrink little beyond the fastest DEFLATE level
+FAST_DEFLATE_SUFFIXES = ('.so', '.pyd')
+
 
 def build_lambda_layer():
     """
@@ -61,19 +68,16 @@ def build_lambda_layer():
     with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
         # Add all dependencies inside python/ directory
         # This is the required structure for Lambda Layers
-        for root, dirs, files in os.walk(package_dir):
-            # Skip __pycache__ directories to reduce layer size
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-            
-            for file in files:
-                # Skip compiled Python files
-                if file.endswith('.pyc'):
-                    continue
-                    
-                file_path = Path(root) / file
-                # Place inside python/ directory as required by Lambda
-                arcname = Path('python') / file_path.relative_to(package_dir)
-                zf.write(file_path, arcname)
+        # Bytecode (__pycache__, .pyc) is skipped to reduce layer size
+        # File bytes are read ahead by prefetch() while this thread compresses
+        for file_path, arcname, data in prefetch(iter_files(package_dir, 'python/')):
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+            if file_path.endswith(STORED_SUFFIXES):
+                zf.writestr(zinfo, data, compress_type=zipfile.ZIP_STORED)
+            elif file_path.endswith(FAST_DEFLATE_SUFFIXES):
+                zf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED, compresslevel=1)
+            else:
+                zf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED)
     
     # Report final layer size
     size_mb = zip_path.stat().st_size / (1024 * 1024)
@@ -19,11 +19,37 @@ Usage:
     
 Output:
     lambda_function.zip - Code-only package for AWS Lambda (~1-2MB)
+    lambda_function.zip.hash - Source tree hash; the build is skipped when unchanged
 """
+import hashlib
 import os
 import zipfile
 from pathlib import Path
 
+from build_files import iter_files, prefetch
+
+
+def tree_hash(entries):
+    """
+    Hash the (arcname, mtime_ns, size) of every entry.
+    
+    Used as a cheap build cache key: any added, removed, resized or
+    re-saved file changes the digest without reading file contents.
+    
+    Args:
+        entries: Iterable of (path, arcname) pairs
+    
+    Returns:
+        Hex BLAKE2b digest of the sorted stat tuples
+    """
+    stats = []
+    for path, arcname in entries:
+        st = os.stat(path)
+        stats.append((arcname, st.st_mtime_ns, st.st_size))
+    stats.sort()
+    return hashlib.blake2b(repr(stats).encode()).hexdigest()
+
+
 def build_lambda_zip():
     """
     Build Lambda deployment ZIP file with CODE ONLY.
@@ -45,31 +71,34 @@ def build_lambda_zip():
     project_dir = Path(__file__).parent.parent
     lambda_dir = project_dir / "lambda"
     zip_path = lambda_dir / "lambda_function.zip"
+    hash_path = zip_path.with_suffix('.zip.hash')
+    src_dir = project_dir / "src"
+    
+    # Skip the rebuild when no source file changed since the last build
+    # Bytecode (__pycache__, .pyc) is skipped by iter_files
+    entries = list(iter_files(src_dir, 'src/'))
+    source_hash = tree_hash(entries)
+    if zip_path.exists() and hash_path.exists() and hash_path.read_text() == source_hash:
+        print(f"{zip_path.name} is up to date")
+        return
     
     # Remove old ZIP to ensure fresh build (avoid stale code issues)
     if zip_path.exists():
         zip_path.unlink()
+    hash_path.unlink(missing_ok=True)
     
     # Create ZIP with compression for smaller deployment package
     with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zf:
         # Add application source code from src/ directory
         # Structure: src/handlers/, src/parsers/, src/core/, src/input/
-        src_dir = project_dir / "src"
-        for root, dirs, files in os.walk(src_dir):
-            # Skip __pycache__ directories to avoid bytecode files
-            # Modified in-place to prevent os.walk from descending into them
-            dirs[:] = [d for d in dirs if d != '__pycache__']
-            
-            for file in files:
-                # Skip compiled Python files (.pyc)
-                if file.endswith('.pyc'):
-                    continue
-                    
-                file_path = Path(root) / file
-                # Preserve src/ directory structure in ZIP
-                arcname = file_path.relative_to(project_dir)
-                zf.write(file_path, arcname)
-                print(f"Added: {arcname}")
+        for file_path, arcname, data in prefetch(entries):
+            # Preserve src/ directory structure in ZIP (mtime/mode from the file)
+            zinfo = zipfile.ZipInfo.from_file(file_path, arcname)
+            zf.writestr(zinfo, data, compress_type=zipfile.ZIP_DEFLATED)
+            print(f"Added: {arcname}")
+    
+    # Record the source hash only once the ZIP is complete
+    hash_path.write_text(source_hash)
     
     # Report final package size
     size_mb = zip_path.stat().st_size / (1024 * 1024)
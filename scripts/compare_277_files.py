@@ -2,20 +2,45 @@
 """Compare our test file vs HDI test files."""
 
 import json
+import sys
+from functools import lru_cache
+
+from src.parsers.tokenizer import decode_segment, iter_segments
 from src.parsers.x12_277ca_parser import X12_277CA_Parser
 
-def test_file(filepath, description):
-    """Test a single file and show results."""
-    print(f"\n{'='*80}")
-    print(f"{description}")
-    print(f"File: {filepath}")
-    print(f"{'='*80}")
-    
-    parser = X12_277CA_Parser()
-    result = parser.parse(filepath)
+@lru_cache(maxsize=None)
+def _get_277ca_parser():
+    """Return a shared 277CA parser (parsers keep no per-parse state)."""
+    return X12_277CA_Parser()
+
+def test_file(filepath, description, stream=None):
+    """
+    Test a single file and show results.
+    
+    The report is built as a list of lines and written with one call, so
+    each file costs a single write instead of one per printed line.
+    
+    Args:
+        filepath: Path to the 277CA file
+        description: Heading shown above the report
+        stream: Text stream to write to (default: sys.stdout); pass an
+            io.StringIO to capture the report
+    """
+    out = []
+    out.append(f"\n{'='*80}\n")
+    out.append(f"{description}\n")
+    out.append(f"File: {filepath}\n")
+    out.append(f"{'='*80}\n")
+    
+    # Read the file once; the parser and the segment scan below share the bytes
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    
+    parser = _get_277ca_parser()
+    result = parser.parse(raw.decode('utf-8'))
     
     acks = result.get('acknowledgments', [])
-    print(f"\n✅ Acknowledgments found: {len(acks)}")
+    out.append(f"\n✅ Acknowledgments found: {len(acks)}\n")
     
     if acks:
         for i, ack in enumerate(acks, 1):
@@ -24,43 +49,52 @@ def test_file(filepath, description):
             amount = ack.get('billed_amount', 0)
             dos = ack.get('date_of_service', 'N/A')
             
-            print(f"\n  Acknowledgment #{i}:")
-            print(f"    Status: {status}")
-            print(f"    Patient ID: {patient_id}")
-            print(f"    Date of Service: {dos}")
-            print(f"    Billed Amount: ${amount}")
+            out.append(f"\n  Acknowledgment #{i}:\n")
+            out.append(f"    Status: {status}\n")
+            out.append(f"    Patient ID: {patient_id}\n")
+            out.append(f"    Date of Service: {dos}\n")
+            out.append(f"    Billed Amount: ${amount}\n")
             
             reasons = ack.get('rejection_reasons', [])
             if reasons:
-                print(f"    Rejection Reasons:")
+                out.append(f"    Rejection Reasons:\n")
                 for reason in reasons:
-                    print(f"      - {reason}")
-    
-    # Show raw segment structure
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    segments = [s.strip() for s in content.replace('\n', '').split('~') if s.strip()]
-    
-    # Find key segments
-    nm1_segments = [s for s in segments if s.startswith('NM1*')]
-    stc_segments = [s for s in segments if s.startswith('STC*')]
-    
-    print(f"\n  File Structure:")
-    print(f"    Total segments: {len(segments)}")
-    print(f"    NM1 segments: {len(nm1_segments)}")
-    print(f"    STC segments: {len(stc_segments)}")
+                    out.append(f"      - {reason}\n")
+    
+    # Show raw segment structure in a single pass over the bytes read above.
+    # Segments are classified by their first 4 bytes through a lookup table;
+    # only counts and the first 3 samples of each tracked type are kept.
+    counts = {b'NM1*': 0, b'STC*': 0}
+    samples = {b'NM1*': [], b'STC*': []}
+    total_segments = 0
+    
+    for segment in iter_segments(raw):
+        total_segments += 1
+        
+        bucket = samples.get(segment[:4])
+        if bucket is not None:
+            counts[segment[:4]] += 1
+            if len(bucket) < 3:
+                bucket.append(segment)
+    
+    nm1_segments = samples[b'NM1*']
+    stc_segments = samples[b'STC*']
+    out.append(f"\n  File Structure:\n")
+    out.append(f"    Total segments: {total_segments}\n")
+    out.append(f"    NM1 segments: {counts[b'NM1*']}\n")
+    out.append(f"    STC segments: {counts[b'STC*']}\n")
     
     if nm1_segments:
-        print(f"\n  Sample NM1 (Name) segments:")
-        for nm1 in nm1_segments[:3]:
-            print(f"    {nm1}")
+        out.append(f"\n  Sample NM1 (Name) segments:\n")
+        for nm1 in nm1_segments:
+            out.append(f"    {decode_segment(nm1)}\n")
     
     if stc_segments:
-        print(f"\n  Sample STC (Status) segments:")
-        for stc in stc_segments[:3]:
-            print(f"    {stc}")
+        out.append(f"\n  Sample STC (Status) segments:\n")
+        for stc in stc_segments:
+            out.append(f"    {decode_segment(stc)}\n")
     
+    (stream or sys.stdout).write(''.join(out))
     return result
 
 if __name__ == '__main__':
@@ -12,7 +12,7 @@ Callers:
 
 Callees:
     - pydantic.BaseSettings: Configuration validation framework
-    - functools.lru_cache: Settings instance caching
+    - functools.cache: Settings instance caching
 
 Environment Variables:
     ENVIRONMENT: Application environment (development/staging/production)
@@ -25,10 +25,10 @@ Environment Variables:
     STRICT_MODE: Fail on validation errors when True
 """
 
-from functools import lru_cache
-from typing import Literal
+from functools import cache
+from typing import Any, Literal
 
-from pydantic import BaseSettings
+from pydantic import BaseSettings, PrivateAttr
 
 
 class Settings(BaseSettings):
@@ -36,7 +36,7 @@ class Settings(BaseSettings):
 
     Uses Pydantic BaseSettings for automatic environment variable loading,
     type validation, and default value assignment. Settings are immutable
-    once loaded.
+    once loaded (assignment raises TypeError).
 
     Attributes:
         ENVIRONMENT: Runtime environment identifier
@@ -47,6 +47,8 @@ class Settings(BaseSettings):
         MAX_FILE_SIZE_MB: Maximum allowed file size in MB
         ENABLE_VALIDATION: Whether to validate X12 documents
         STRICT_MODE: Whether to fail on validation errors
+        max_file_size_bytes: MAX_FILE_SIZE_MB converted to bytes
+        is_production: True if ENVIRONMENT == 'production'
     """
 
     # Environment
@@ -65,45 +67,65 @@ class Settings(BaseSettings):
     ENABLE_VALIDATION: bool = True
     STRICT_MODE: bool = False
 
-    @property
-    def max_file_size_bytes(self) -> int:
-        """Convert max file size from MB to bytes.
+    # Derived values, computed once per instance (not pydantic fields)
+    _max_file_size_bytes: int = PrivateAttr()
+    _is_production: bool = PrivateAttr()
+
+    def __init__(self, **values: Any) -> None:
+        """Load settings and precompute derived values.
 
-        Returns:
-            int: Maximum file size in bytes (MB * 1024 * 1024)
+        max_file_size_bytes and is_production are read on every input
+        validation, so they are stored as private attributes instead of
+        being recomputed on each access. Private attributes survive pickling;
+        copy() recomputes them, since copy(update=...) may change the fields
+        they derive from.
+
+        Args:
+            **values: Field overrides (take precedence over the environment)
 
         Example:
-            >>> settings = Settings(MAX_FILE_SIZE_MB=50)
+            >>> settings = Settings(MAX_FILE_SIZE_MB=50, ENVIRONMENT='production')
             >>> settings.max_file_size_bytes
             52428800
+            >>> settings.is_production
+            True
         """
-        return self.MAX_FILE_SIZE_MB * 1024 * 1024
+        super().__init__(**values)
+        self._set_derived()
 
-    @property
-    def is_production(self) -> bool:
-        """Check if running in production environment.
+    def _set_derived(self) -> None:
+        """Compute the derived values from the current fields."""
+        self._max_file_size_bytes = self.MAX_FILE_SIZE_MB * 1024 * 1024
+        self._is_production = self.ENVIRONMENT == "production"
 
-        Returns:
-            bool: True if ENVIRONMENT == 'production', False otherwise
+    def copy(self, **kwargs: Any) -> "Settings":
+        """Copy settings (see BaseModel.copy), recomputing derived values."""
+        settings = super().copy(**kwargs)
+        settings._set_derived()
+        return settings
 
-        Example:
-            >>> settings = Settings(ENVIRONMENT='production')
-            >>> settings.is_production
-            True
-        """
-        return self.ENVIRONMENT == "production"
+    @property
+    def max_file_size_bytes(self) -> int:
+        """MAX_FILE_SIZE_MB converted to bytes."""
+        return self._max_file_size_bytes
+
+    @property
+    def is_production(self) -> bool:
+        """True if ENVIRONMENT == 'production'."""
+        return self._is_production
 
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = True
+        allow_mutation = False
 
 
-@lru_cache
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance.
 
-    Returns a singleton Settings instance using LRU cache. The settings
+    Returns a singleton Settings instance using functools.cache. The settings
     object is created once and reused across the application lifecycle.
     This improves performance and ensures consistency.
 
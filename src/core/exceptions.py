@@ -28,6 +28,8 @@ Example:
         logger.error(f"General error: {e}")
 """
 
+from typing import Any
+
 
 class X12ProcessingError(Exception):
     """Base exception for X12 processing errors.
@@ -40,9 +42,38 @@ class X12ProcessingError(Exception):
 
     Caught by:
         - src.handlers.lambda_handler: For general error handling
+
+    The message may be a str.format template with its values passed as
+    keyword context; formatting is deferred to __str__, so an error that is
+    caught and never logged is never formatted. The context stays available
+    on ``ctx`` for structured logging, and is kept when the error is
+    pickled. Subclasses declare empty __slots__.
+
+    Attributes:
+        template: Message, or format template when ctx is given
+        ctx: Keyword values for the template
+
+    Example:
+        raise FileSizeError("File size ({size} bytes) exceeds maximum", size=size)
     """
 
-    pass
+    __slots__ = ("template", "ctx")
+
+    def __init__(self, template: str = "", **ctx: Any) -> None:
+        super().__init__(template)
+        self.template = template
+        self.ctx = ctx
+
+    def __str__(self) -> str:
+        return self.template.format(**self.ctx) if self.ctx else self.template
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+    def __reduce__(self):
+        # BaseException pickles only args, which would drop ctx (e.g. errors
+        # returned from a ProcessPoolExecutor worker); carry it as state
+        return type(self), (self.template,), {"ctx": self.ctx}
 
 
 class X12ParseError(X12ProcessingError):
@@ -53,13 +84,14 @@ class X12ParseError(X12ProcessingError):
 
     Raised by:
         - src.parsers.x12_277_parser.X12_277_Parser.parse()
+        - src.parsers.x12_277ca_parser.X12_277CA_Parser.parse()
         - src.parsers.x12_835_parser.X12_835_Parser.parse()
 
     Example:
         raise X12ParseError("Failed to parse 277 document: Invalid ST segment")
     """
 
-    pass
+    __slots__ = ()
 
 
 class X12ValidationError(X12ProcessingError):
@@ -75,7 +107,7 @@ class X12ValidationError(X12ProcessingError):
         raise X12ValidationError("Missing required payer information")
     """
 
-    pass
+    __slots__ = ()
 
 
 class InputError(X12ProcessingError):
@@ -92,7 +124,7 @@ class InputError(X12ProcessingError):
         raise InputError(f"File not found: {file_path}")
     """
 
-    pass
+    __slots__ = ()
 
 
 class OutputError(X12ProcessingError):
@@ -107,7 +139,7 @@ class OutputError(X12ProcessingError):
         raise OutputError(f"Failed to write to S3: {error}")
     """
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(X12ProcessingError):
@@ -122,7 +154,7 @@ class ConfigurationError(X12ProcessingError):
         raise ConfigurationError("AWS_REGION not configured")
     """
 
-    pass
+    __slots__ = ()
 
 
 class FileSizeError(X12ProcessingError):
@@ -137,11 +169,13 @@ class FileSizeError(X12ProcessingError):
 
     Example:
         raise FileSizeError(
-            f"File size ({size} bytes) exceeds maximum ({max_size} bytes)"
+            "File size ({size} bytes) exceeds maximum ({max_size} bytes)",
+            size=size,
+            max_size=max_size,
         )
     """
 
-    pass
+    __slots__ = ()
 
 
 class S3Error(X12ProcessingError):
@@ -158,9 +192,10 @@ class S3Error(X12ProcessingError):
         - Object not found (404)
         - Access denied (403)
         - Network/connectivity issues
+        - Object changed or truncated during a multi-part read
 
     Example:
-        raise S3Error(f"S3 object not found: s3://{bucket}/{key}")
+        raise S3Error("S3 object not found: s3://{bucket}/{key}", bucket=bucket, key=key)
     """
 
-    pass
+    __slots__ = ()
@@ -14,16 +14,95 @@ Callees:
 Configuration:
     - Format: '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     - Date format: '%Y-%m-%d %H:%M:%S'
-    - Output: sys.stdout
+    - Output: sys.stdout, buffered in memory and written as one write+flush
+      per batch (every 100 records, on ERROR, at exit, and by flush_logs())
     - Suppressed loggers: boto3, botocore, urllib3 (set to WARNING)
 """
 
+import atexit
 import logging
+import logging.handlers
 import sys
 from typing import Optional
 
 from .config import get_settings
 
+# Level names accepted by setup_logging, resolved once at import
+_LEVEL_MAP = {
+    name: getattr(logging, name) for name in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+}
+
+# Buffered records per batch. Records still buffered when the process is
+# killed (e.g. a Lambda timeout) are lost, and each keeps its args alive until
+# written, so the buffer is kept small.
+_BUFFER_CAPACITY = 100
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """StreamHandler that writes to whatever sys.stdout is at emit time.
+
+    Like the standard library's last-resort stderr handler, the stream is
+    looked up on each use rather than bound at import, so output follows
+    sys.stdout when it is replaced (e.g. by pytest's capture) and a flush at
+    exit never writes to a stream closed in the meantime.
+    """
+
+    def __init__(self, level: int = logging.NOTSET):
+        logging.Handler.__init__(self, level)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+
+class _BatchMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that writes its buffer to the target stream in one go.
+
+    MemoryHandler.flush() hands records to the target one at a time, and
+    StreamHandler.emit() writes and flushes the stream for each of them. This
+    flush applies the target's level and filters to each record, formats the
+    ones it accepts, and writes them as one string with one stream flush,
+    all under the target's lock.
+    """
+
+    def flush(self) -> None:
+        with self.lock:
+            if not self.buffer or self.target is None:
+                return
+            target = self.target
+            try:
+                with target.lock:
+                    text = "".join(
+                        target.format(record) + target.terminator
+                        for record in self.buffer
+                        if record.levelno >= target.level and target.filter(record)
+                    )
+                    if text:
+                        stream = target.stream
+                        stream.write(text)
+                        stream.flush()
+            except Exception:
+                self.handleError(self.buffer[0])
+            finally:
+                self.buffer.clear()
+
+
+# Single stdout handler shared by every setup_logging call, so repeated calls
+# (e.g. from test fixtures) never create additional handlers
+_STREAM_HANDLER = _StdoutHandler()
+_STREAM_HANDLER.setFormatter(
+    logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+    )
+)
+
+# Records are buffered and written to stdout with one write+flush per batch
+# instead of per record; an ERROR (or worse) flushes immediately
+_BUFFERED_HANDLER = _BatchMemoryHandler(
+    capacity=_BUFFER_CAPACITY, flushLevel=logging.ERROR, target=_STREAM_HANDLER, flushOnClose=True
+)
+atexit.register(_BUFFERED_HANDLER.flush)
+
 
 def setup_logging(log_level: Optional[str] = None) -> None:
     """Configure application-wide logging.
@@ -36,7 +115,7 @@ def setup_logging(log_level: Optional[str] = None) -> None:
                   Valid values: DEBUG, INFO, WARNING, ERROR, CRITICAL
 
     Called by:
-        - Application initialization code
+        - src.handlers.lambda_handler.lambda_handler: On the first invocation
         - Test fixtures for log control
 
     Example:
@@ -47,13 +126,10 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     settings = get_settings()
     level = log_level or settings.LOG_LEVEL
 
-    # Configure root logger
-    logging.basicConfig(
-        level=getattr(logging, level),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    # Configure root logger (formatting happens on the stdout target). force
+    # replaces handlers installed earlier, e.g. by the Lambda runtime, so
+    # this is only called explicitly, never as an import side effect
+    logging.basicConfig(level=_LEVEL_MAP[level], handlers=[_BUFFERED_HANDLER], force=True)
 
     # Set specific loggers
     logging.getLogger("boto3").setLevel(logging.WARNING)
@@ -61,24 +137,27 @@ def setup_logging(log_level: Optional[str] = None) -> None:
     logging.getLogger("urllib3").setLevel(logging.WARNING)
 
 
-def get_logger(name: str) -> logging.Logger:
-    """Get a logger instance with the specified name.
+def flush_logs() -> None:
+    """Write any buffered log records to stdout.
 
-    Creates or retrieves a logger using Python's logging hierarchy.
-    Typically called with __name__ to create module-specific loggers.
-
-    Args:
-        name: Logger name, typically __name__ for module-level loggers
-
-    Returns:
-        logging.Logger: Configured logger instance for the given name
+    Lambda freezes the process between invocations, so handlers call this
+    before returning to make each invocation's logs visible immediately.
 
     Called by:
-        - All application modules for obtaining logger instances
-
-    Example:
-        >>> logger = get_logger(__name__)
-        >>> logger.info('Processing started')
-        >>> logger.error('Error occurred', exc_info=True)
+        - src.handlers.lambda_handler.lambda_handler: At the end of each invocation
     """
-    return logging.getLogger(name)
+    _BUFFERED_HANDLER.flush()
+
+
+# Get a logger instance with the specified name, typically __name__ for
+# module-level loggers. This is logging.getLogger itself rather than a wrapper
+# function, so obtaining a logger does not push an extra Python frame.
+#
+# Called by:
+#     - All application modules for obtaining logger instances
+#
+# Example:
+#     >>> logger = get_logger(__name__)
+#     >>> logger.info('Processing started')
+#     >>> logger.error('Error occurred', exc_info=True)
+get_logger = logging.getLogger
@@ -13,13 +13,89 @@ The reconciliation engine cross-references 277CA rejections with 835 remittances
 to identify claims that were rejected and never resubmitted.
 """
 
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import heapq
+from array import array
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import repeat
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from ..core.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Composite Patient/DOS/Amount key: (patient_id, dos, dollars), or
+# (patient_id, dos) / (patient_id, dollars) when one part is missing
+MatchKey = Tuple[Any, ...]
+
+# Column order read by ClaimReconciliationEngine.add_277ca_rejections_batch
+_REJECTION_COLUMNS = (
+    "patient_id",
+    "patient_name",
+    "date_of_service",
+    "billed_amount",
+    "charged_amount",
+    "transaction_date",
+    "rejection_reason",
+    "status_code",
+    "trace_number",
+)
+
+
+@dataclass(slots=True)
+class RejectionRecord:
+    """
+    A tracked 277CA rejection.
+
+    Stored with __slots__ instead of a per-record dict to keep the memory
+    footprint of a long-lived (warm Lambda) engine small.
+
+    Attributes:
+        rejection_date: 277CA transaction date as received
+        patient_id: Patient identifier
+        patient_name: Patient name
+        date_of_service: Service date or date range
+        billed_amount: Billed amount as received
+        rejection_reason: Payer rejection message
+        status_code: Claim status code
+        trace_number: Claim trace number (TRN)
+        resubmission_date: Payment date of the matching 835 claim, if any
+    """
+
+    rejection_date: Optional[str]
+    patient_id: Any
+    patient_name: Optional[str]
+    date_of_service: Optional[str]
+    billed_amount: Any
+    rejection_reason: Optional[str]
+    status_code: Optional[str]
+    trace_number: Optional[str]
+    resubmission_date: Optional[str] = None
+
+
+# RejectionRecord fields copied into each alert, read in one C-level call
+_alert_fields = attrgetter(
+    "patient_id",
+    "patient_name",
+    "date_of_service",
+    "billed_amount",
+    "rejection_date",
+    "rejection_reason",
+)
+
 
 class ClaimReconciliationEngine:
     """
@@ -29,6 +105,17 @@ class ClaimReconciliationEngine:
     - Track all 277CA rejections (front door rejections)
     - Monitor 835 payments for resubmitted claims
     - Alert on claims rejected >30 days ago with no 835 payment
+
+    The fields scanned by find_unsubmitted_claims are kept column-wise
+    (structure of arrays): row i of _dates/_cents belongs to _row_keys[i].
+    Rejection dates are parsed once on ingest into date ordinals, so the scan
+    is a comparison over packed arrays rather than per-record dict lookups
+    and strptime calls. Descriptive fields stay in rejections_cache (as
+    RejectionRecord objects) and are only read for rows that produce an alert.
+
+    Rows not yet matched to an 835 are indexed in _unresolved (an ordered
+    set), so scans only visit open rejections. Billed amounts are held as
+    integer cents, and the at-risk total is kept as a running integer tally.
     """
 
     def __init__(self, lookback_days: int = 60):
@@ -39,8 +126,40 @@ class ClaimReconciliationEngine:
             lookback_days: How far back to check for missing resubmissions
         """
         self.lookback_days = lookback_days
-        self.rejections_cache: Dict[str, Dict[str, Any]] = {}
-        self.payments_cache: Dict[str, Dict[str, Any]] = {}
+        self.rejections_cache: Dict[MatchKey, RejectionRecord] = {}
+        self.payments_cache: Dict[MatchKey, Dict[str, Any]] = {}
+
+        # Columnar scan state, one row per tracked rejection
+        self._row_of: Dict[MatchKey, int] = {}
+        self._row_keys: List[MatchKey] = []
+        self._dates = array("l")  # Rejection date ordinal (0 = missing or invalid)
+        self._cents = array("q")  # Billed amount in cents (0 when missing)
+        self._unresolved: Dict[int, None] = {}  # Rows not yet found in an 835
+        self._unresolved_cents = 0  # Sum of _cents over _unresolved
+
+    def reset(self, lookback_days: int = 60) -> "ClaimReconciliationEngine":
+        """
+        Clear all tracked rejections and payments in place.
+
+        Lets one engine be reused across warm Lambda invocations without
+        reallocating its caches and columns.
+
+        Args:
+            lookback_days: How far back to check for missing resubmissions
+
+        Returns:
+            This engine, for chaining
+        """
+        self.lookback_days = lookback_days
+        self.rejections_cache.clear()
+        self.payments_cache.clear()
+        self._row_of.clear()
+        self._row_keys.clear()
+        del self._dates[:]
+        del self._cents[:]
+        self._unresolved.clear()
+        self._unresolved_cents = 0
+        return self
 
     def add_277ca_rejections(self, parsed_277ca: Dict[str, Any]) -> None:
         """
@@ -50,61 +169,174 @@ class ClaimReconciliationEngine:
             parsed_277ca: Parsed 277CA data with rejections list
         """
         for rejection in parsed_277ca.get("rejections", []):
-            # Create composite key for matching (can't rely on claim ID alone)
-            match_key = self._create_match_key(rejection)
+            # Records without a patient ID can never be matched; skip them first
+            patient_id = rejection.get("patient_id")
+            if not patient_id:
+                continue
+
+            # Create composite key for matching (can't rely on claim ID alone);
+            # the amount is parsed once and shared by the key and the cents column
+            billed_amount = rejection.get("billed_amount")
+            cents = _to_cents(billed_amount)
+            match_key = _build_match_key(
+                patient_id,
+                rejection.get("date_of_service"),
+                _key_cents(cents, rejection.get("charged_amount")),
+            )
+
+            if match_key:
+                record = RejectionRecord(
+                    rejection_date=rejection.get("transaction_date"),
+                    patient_id=patient_id,
+                    patient_name=rejection.get("patient_name"),
+                    date_of_service=rejection.get("date_of_service"),
+                    billed_amount=billed_amount,
+                    rejection_reason=rejection.get("rejection_reason"),
+                    status_code=rejection.get("status_code"),
+                    trace_number=rejection.get("trace_number"),
+                )
+                self._track_rejection(match_key, record, cents)
+
+    def add_277ca_rejections_batch(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        """
+        Add 277CA rejections supplied column-wise.
+
+        Accepts the layout produced by pyarrow.Table.to_pydict() or
+        pandas.DataFrame.to_dict("list") without importing either library:
+        rows are read by zipping the columns, so no per-row dict is built or
+        probed with .get(). Missing columns are treated as all None.
+
+        Args:
+            columns: Mapping of field name (patient_id, patient_name,
+                date_of_service, billed_amount, charged_amount,
+                transaction_date, rejection_reason, status_code,
+                trace_number) to equal-length sequences
+        """
+        size = len(columns["patient_id"]) if "patient_id" in columns else 0
+        rows = zip(
+            *(
+                columns[name] if name in columns else repeat(None, size)
+                for name in _REJECTION_COLUMNS
+            )
+        )
+
+        for (
+            patient_id,
+            patient_name,
+            date_of_service,
+            billed_amount,
+            charged_amount,
+            rejection_date,
+            rejection_reason,
+            status_code,
+            trace_number,
+        ) in rows:
+            if not patient_id:
+                continue
+
+            cents = _to_cents(billed_amount)
+            match_key = _build_match_key(
+                patient_id, date_of_service, _key_cents(cents, charged_amount)
+            )
 
             if match_key:
-                self.rejections_cache[match_key] = {
-                    "rejection_date": rejection.get("transaction_date"),
-                    "patient_id": rejection.get("patient_id"),
-                    "patient_name": rejection.get("patient_name"),
-                    "date_of_service": rejection.get("date_of_service"),
-                    "billed_amount": rejection.get("billed_amount"),
-                    "rejection_reason": rejection.get("rejection_reason"),
-                    "status_code": rejection.get("status_code"),
-                    "trace_number": rejection.get("trace_number"),
-                    "found_in_835": False,
-                    "resubmission_date": None,
-                }
-
-                logger.info(
-                    f"Tracked 277CA rejection: Patient {rejection.get('patient_id')}, "
-                    f"Reason: {rejection.get('rejection_reason')}"
+                record = RejectionRecord(
+                    rejection_date=rejection_date,
+                    patient_id=patient_id,
+                    patient_name=patient_name,
+                    date_of_service=date_of_service,
+                    billed_amount=billed_amount,
+                    rejection_reason=rejection_reason,
+                    status_code=status_code,
+                    trace_number=trace_number,
                 )
+                self._track_rejection(match_key, record, cents)
+
+    def _track_rejection(self, match_key: MatchKey, record: RejectionRecord, cents: int) -> None:
+        """
+        Store a rejection record and update the scan columns.
+
+        A repeated key replaces the earlier rejection and reopens it.
+
+        Args:
+            match_key: Composite matching key
+            record: Rejection record to store
+            cents: Billed amount in cents
+        """
+        self.rejections_cache[match_key] = record
+
+        ordinal = _date_ordinal(record.rejection_date)
+        row = self._row_of.get(match_key)
+        if row is None:
+            row = self._row_of[match_key] = len(self._row_keys)
+            self._row_keys.append(match_key)
+            self._dates.append(ordinal)
+            self._cents.append(cents)
+        else:
+            if row in self._unresolved:
+                self._unresolved_cents -= self._cents[row]
+            self._dates[row] = ordinal
+            self._cents[row] = cents
+        self._unresolved[row] = None
+        self._unresolved_cents += cents
+
+        # %-style arguments: the message is only formatted if emitted
+        logger.info(
+            "Tracked 277CA rejection: Patient %s, Reason: %s",
+            record.patient_id,
+            record.rejection_reason,
+        )
 
     def add_835_payments(self, parsed_835: Dict[str, Any]) -> None:
         """
         Add 835 payments and mark matching rejections as resubmitted.
 
+        Only payments that match a tracked rejection are stored in
+        payments_cache; unmatched 835 claims (the common case) are skipped
+        without building a payment record.
+
         Args:
             parsed_835: Parsed 835 data with claims list
         """
+        # Nothing can match until a rejection is tracked
+        if not self._row_of:
+            return
+
         for claim in parsed_835.get("claims", []):
             # Create same composite key for matching
             match_key = self._create_match_key(claim)
 
-            if match_key:
-                # Store payment info
-                self.payments_cache[match_key] = {
-                    "payment_date": claim.get("payment_date"),
-                    "patient_id": claim.get("patient_id"),
-                    "paid_amount": claim.get("paid_amount"),
-                    "claim_status": claim.get("claim_status"),
-                }
-
-                # Check if this payment matches a previous rejection
-                if match_key in self.rejections_cache:
-                    self.rejections_cache[match_key]["found_in_835"] = True
-                    self.rejections_cache[match_key]["resubmission_date"] = claim.get(
-                        "payment_date"
-                    )
-
-                    logger.info(
-                        f"✅ Matched 835 payment to 277CA rejection: {match_key} - "
-                        "Claim was successfully resubmitted"
-                    )
-
-    def find_unsubmitted_claims(self, days_threshold: int = 30) -> List[Dict[str, Any]]:
+            # Check if this payment matches a previous rejection
+            row = self._row_of.get(match_key) if match_key else None
+            if row is None:
+                continue
+
+            # Store payment info
+            self.payments_cache[match_key] = {
+                "payment_date": claim.get("payment_date"),
+                "patient_id": claim.get("patient_id"),
+                "paid_amount": claim.get("paid_amount"),
+                "claim_status": claim.get("claim_status"),
+            }
+
+            if row in self._unresolved:
+                del self._unresolved[row]
+                self._unresolved_cents -= self._cents[row]
+            self.rejections_cache[match_key].resubmission_date = claim.get("payment_date")
+
+            logger.debug(
+                "✅ Matched 835 payment to 277CA rejection: %s - "
+                "Claim was successfully resubmitted",
+                match_key,
+            )
+
+    def find_unsubmitted_claims(
+        self,
+        days_threshold: int = 30,
+        *,
+        now: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
         """
         Identify rejected claims that haven't appeared in 835 after threshold days.
 
@@ -113,84 +345,114 @@ class ClaimReconciliationEngine:
 
         Args:
             days_threshold: Days since rejection to consider claim "lost"
+            now: Current time, so callers can share one clock reading
+                (default: datetime.now())
+            limit: Return only the N oldest alerts (default: all)
 
         Returns:
-            List of unsubmitted claim alerts
+            List of unsubmitted claim alerts, oldest first
+        """
+        return list(self.iter_unsubmitted_claims(days_threshold, now=now, limit=limit))
+
+    def iter_unsubmitted_claims(
+        self,
+        days_threshold: int = 30,
+        *,
+        now: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Dict[str, Any]]:
         """
-        alerts = []
-        current_date = datetime.now()
-        threshold_date = current_date - timedelta(days=days_threshold)
+        Yield unsubmitted claim alerts, oldest first.
 
-        for match_key, rejection in self.rejections_cache.items():
-            # Skip if already found in 835
-            if rejection["found_in_835"]:
-                continue
+        Candidates are ranked as (days, row) pairs first; each alert dict is
+        built only when it is consumed, so callers streaming alerts to
+        another system never hold the whole alert list.
 
-            # Parse rejection date
-            rejection_date_str = rejection.get("rejection_date")
-            if not rejection_date_str:
-                continue
+        Args:
+            days_threshold: Days since rejection to consider claim "lost"
+            now: Current time (default: datetime.now())
+            limit: Yield only the N oldest alerts (default: all)
 
-            try:
-                # Handle different date formats (YYYYMMDD or YYYY-MM-DD)
-                if "-" in rejection_date_str:
-                    rejection_date = datetime.strptime(rejection_date_str, "%Y-%m-%d")
-                else:
-                    rejection_date = datetime.strptime(rejection_date_str, "%Y%m%d")
-            except ValueError:
-                logger.warning(f"Invalid date format: {rejection_date_str}")
-                continue
+        Yields:
+            Unsubmitted claim alerts
+        """
+        today = (now or datetime.now()).toordinal()
+        # A rejection dated on or before this day is at least days_threshold old
+        threshold = today - days_threshold
 
-            # Check if rejection is old enough to be concerning
-            if rejection_date < threshold_date:
-                days_since_rejection = (current_date - rejection_date).days
-
-                alert = {
-                    "severity": "HIGH" if days_since_rejection > 45 else "MEDIUM",
-                    "match_key": match_key,
-                    "patient_id": rejection["patient_id"],
-                    "patient_name": rejection["patient_name"],
-                    "date_of_service": rejection["date_of_service"],
-                    "billed_amount": rejection["billed_amount"],
-                    "rejection_date": rejection["rejection_date"],
-                    "rejection_reason": rejection["rejection_reason"],
-                    "days_since_rejection": days_since_rejection,
-                    "estimated_revenue_loss": rejection.get("billed_amount", 0),
-                    "action_required": (
-                        "Review rejection reason and resubmit corrected claim. "
-                        "This claim will NEVER appear in 835 until resubmitted."
-                    ),
-                }
-
-                alerts.append(alert)
-
-                logger.warning(
-                    f"⚠️  UNSUBMITTED CLAIM DETECTED: Patient {alert['patient_id']}, "
-                    f"${alert['billed_amount']}, {days_since_rejection} days old"
-                )
+        # Scan open rejections only; records are only touched for yielded rows
+        pending = _scan_pending(self._dates, self._unresolved, threshold, today)
+
+        # Oldest first (highest priority): pairs are (-days, row), so plain
+        # tuple ordering ranks them with no key callback; ties keep row order
+        if limit is None:
+            pending.sort()
+        else:
+            pending = heapq.nsmallest(limit, pending)
+
+        for neg_days, row in pending:
+            yield self._build_alert(-neg_days, row)
+
+    def _build_alert(self, days_since_rejection: int, row: int) -> Dict[str, Any]:
+        """
+        Build the alert dict for an unsubmitted rejection.
+
+        Args:
+            days_since_rejection: Age of the rejection in days
+            row: Row index of the rejection
+
+        Returns:
+            Unsubmitted claim alert
+        """
+        match_key = self._row_keys[row]
+        patient_id, patient_name, date_of_service, billed, rejected_on, reason = _alert_fields(
+            self.rejections_cache[match_key]
+        )
 
-        # Sort by days since rejection (oldest first - highest priority)
-        alerts.sort(key=lambda x: x["days_since_rejection"], reverse=True)
+        alert = {
+            "severity": "HIGH" if days_since_rejection > 45 else "MEDIUM",
+            "match_key": "|".join(map(str, match_key)),
+            "patient_id": patient_id,
+            "patient_name": patient_name,
+            "date_of_service": date_of_service,
+            "billed_amount": billed,
+            "rejection_date": rejected_on,
+            "rejection_reason": reason,
+            "days_since_rejection": days_since_rejection,
+            "estimated_revenue_loss": billed,
+            "action_required": (
+                "Review rejection reason and resubmit corrected claim. "
+                "This claim will NEVER appear in 835 until resubmitted."
+            ),
+        }
 
-        return alerts
+        logger.warning(
+            "⚠️  UNSUBMITTED CLAIM DETECTED: Patient %s, $%s, %s days old",
+            patient_id,
+            billed,
+            days_since_rejection,
+        )
+
+        return alert
 
     def get_reconciliation_summary(self) -> Dict[str, Any]:
         """
         Generate summary statistics for revenue reconciliation.
 
+        Runs in constant time: counts come from the sizes of the row and
+        unresolved indexes, and the at-risk amount from the running tally.
+
         Returns:
             Summary dict with counts and financial impact
         """
-        total_rejections = len(self.rejections_cache)
-        resubmitted = sum(1 for r in self.rejections_cache.values() if r["found_in_835"])
-        unsubmitted = total_rejections - resubmitted
-
-        # Calculate potential revenue at risk
-        potential_loss = sum(
-            float(r.get("billed_amount", 0) or 0)
-            for r in self.rejections_cache.values()
-            if not r["found_in_835"]
-        )
+        # Resubmitted = tracked rows no longer in the unresolved index; deriving
+        # it avoids a separate counter that could drift from the index
+        total_rejections = len(self._row_keys)
+        unsubmitted = len(self._unresolved)
+        resubmitted = total_rejections - unsubmitted
+
+        # Potential revenue at risk (running tally, converted from cents once)
+        potential_loss = self._unresolved_cents / 100
 
         return {
             "total_rejections_tracked": total_rejections,
@@ -203,7 +465,7 @@ class ClaimReconciliationEngine:
             "tracking_period_days": self.lookback_days,
         }
 
-    def _create_match_key(self, transaction: Dict[str, Any]) -> Optional[str]:
+    def _create_match_key(self, transaction: Dict[str, Any]) -> Optional[MatchKey]:
         """
         Create composite matching key for cross-referencing.
 
@@ -214,73 +476,219 @@ class ClaimReconciliationEngine:
             transaction: 277CA rejection or 835 claim data
 
         Returns:
-            Composite key string or None if insufficient data
+            Composite key tuple or None if insufficient data
         """
-        patient_id = transaction.get("patient_id")
-        date_of_service = transaction.get("date_of_service")
-        amount = transaction.get("billed_amount") or transaction.get("charged_amount")
-
         # Need at least patient ID and one other identifier
+        patient_id = transaction.get("patient_id")
         if not patient_id:
             return None
 
+        cents = _key_cents(
+            _to_cents(transaction.get("billed_amount")), transaction.get("charged_amount")
+        )
+        return _build_match_key(patient_id, transaction.get("date_of_service"), cents)
+
+
+def _scan_pending(
+    dates: Sequence[int], rows: Iterable[int], threshold: int, today: int
+) -> List[Tuple[int, int]]:
+    """
+    Select rows whose rejection day is on or before the threshold day.
+
+    Kept free of engine state and dict lookups: it reads only an int column
+    and int row numbers, so it can be compiled as-is (e.g. Numba nopython)
+    should the scan ever dominate.
+
+    Args:
+        dates: Rejection date ordinals by row (0 = unparseable)
+        rows: Row numbers to consider
+        threshold: Latest qualifying date ordinal
+        today: Current date ordinal
+
+    Returns:
+        (-days since rejection, row) pairs, negated so that ascending order
+        is oldest first
+    """
+    return [(dates[row] - today, row) for row in rows if 0 < dates[row] <= threshold]
+
+
+def _to_cents(amount: Any) -> int:
+    """
+    Convert a monetary amount to integer cents.
+
+    Args:
+        amount: Amount as a number or numeric string (None/empty means 0)
+
+    Returns:
+        Amount in cents, rounded to the nearest cent
+    """
+    return round(float(amount or 0) * 100)
+
+
+def _key_cents(billed_cents: int, charged_amount: Any) -> int:
+    """
+    Select the amount used in a match key, shared by the 277CA and 835 sides.
+
+    The billed amount is used unless it is missing or zero (e.g. "0.00"),
+    in which case the charged amount is used.
+
+    Args:
+        billed_cents: Billed amount already converted with _to_cents
+        charged_amount: Charged amount as a number or numeric string
+
+    Returns:
+        Amount in cents for _build_match_key
+    """
+    return billed_cents or _to_cents(charged_amount)
+
+
+def _build_match_key(patient_id: Any, date_of_service: Any, cents: int) -> Optional[MatchKey]:
+    """
+    Build the composite (Patient, DOS, Amount) matching key.
+
+    Keys are tuples rather than "|"-joined strings, so building one allocates
+    no new string; alerts render the joined form only when they are emitted.
+
+    Args:
+        patient_id: Patient identifier (already checked to be present)
+        date_of_service: Service date or YYYYMMDD-YYYYMMDD range
+        cents: Billed/charged amount in cents (0 when missing)
+
+    Returns:
+        Composite key tuple or None if only the patient ID is known
+    """
+    patient_id = str(patient_id)
+    if date_of_service:
         # Normalize date format (handle ranges like "20050831-20050906")
-        if date_of_service and "-" in str(date_of_service):
-            date_parts = str(date_of_service).split("-")
-            if len(date_parts) == 2 and len(date_parts[0]) == 8:
-                # It's a date range (YYYYMMDD-YYYYMMDD), use start date
-                date_of_service = date_parts[0]
+        # A single hyphen at index 8 marks a range (YYYYMMDD-YYYYMMDD); keep the
+        # start date by slicing instead of splitting into a list
+        date_of_service = str(date_of_service)
+        if date_of_service.find("-") == 8 and date_of_service.find("-", 9) == -1:
+            date_of_service = date_of_service[:8]
+
+        if cents:
+            # Normalize amount (whole dollars, decimals truncated, for matching)
+            return (patient_id, date_of_service, int(cents / 100))
+        return (patient_id, date_of_service)
+
+    return (patient_id, int(cents / 100)) if cents else None
+
+
+@lru_cache(maxsize=4096)
+def _date_ordinal(value: Optional[str]) -> int:
+    """
+    Parse a rejection date into a proleptic Gregorian ordinal.
 
-        # Create composite key
-        key_parts = [str(patient_id)]
+    A 277CA batch carries few distinct transaction dates, so results are
+    memoized and each distinct value is parsed (and warned about) once.
+    Plain YYYYMMDD values are built with integer slicing, which avoids the
+    format handling cost of strptime.
 
-        if date_of_service:
-            key_parts.append(str(date_of_service))
+    Args:
+        value: Date as YYYYMMDD or YYYY-MM-DD
+
+    Returns:
+        Date ordinal, or 0 if the date is missing or invalid
+    """
+    if not value:
+        return 0
+
+    try:
+        if len(value) == 8 and value.isdigit():
+            return date(int(value[:4]), int(value[4:6]), int(value[6:])).toordinal()
+
+        # Handle other date formats (YYYY-MM-DD or irregular YYYYMMDD)
+        date_format = "%Y-%m-%d" if "-" in value else "%Y%m%d"
+        return datetime.strptime(value, date_format).toordinal()
+    except ValueError:
+        logger.warning("Invalid date format: %s", value)
+        return 0
+
+
+# Idle engines kept for reuse by generate_reconciliation_report, so warm
+# invocations do not allocate a fresh engine per report
+_ENGINE_POOL: List[ClaimReconciliationEngine] = []
 
-        if amount:
-            # Normalize amount (remove decimals for matching)
-            key_parts.append(str(int(float(amount))))
 
-        return "|".join(key_parts) if len(key_parts) >= 2 else None
+def _acquire_engine(lookback_days: int = 60) -> ClaimReconciliationEngine:
+    """Take an empty engine from the pool, or create one if the pool is empty."""
+    try:
+        engine = _ENGINE_POOL.pop()
+    except IndexError:
+        return ClaimReconciliationEngine(lookback_days)
+    engine.lookback_days = lookback_days
+    return engine
+
+
+def _release_engine(engine: ClaimReconciliationEngine) -> None:
+    """
+    Reset an engine and return it to the pool.
+
+    The reset happens here rather than on acquire, so an idle pooled engine
+    holds no patient data from the previous report.
+    """
+    _ENGINE_POOL.append(engine.reset(engine.lookback_days))
 
 
 def generate_reconciliation_report(
     rejections_277ca: List[Dict[str, Any]],
     payments_835: List[Dict[str, Any]],
     days_threshold: int = 30,
+    on_alert: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> Dict[str, Any]:
     """
     Convenience function to generate full reconciliation report.
 
+    Alerts are consumed from iter_unsubmitted_claims and the alert counts are
+    updated as they arrive. When on_alert is given, each alert is handed to it
+    (e.g. to publish to SNS/Kinesis) instead of being collected, keeping
+    memory bounded for large backlogs.
+
     Args:
         rejections_277ca: List of parsed 277CA rejection transactions
         payments_835: List of parsed 835 claim transactions
         days_threshold: Days before flagging as unsubmitted
+        on_alert: Optional callback receiving each alert; when set, the
+            report's unsubmitted_claims list is left empty
 
     Returns:
         Full reconciliation report with alerts and summary
     """
-    engine = ClaimReconciliationEngine()
-
-    # Add data (simulating database lookups)
-    engine.add_277ca_rejections({"rejections": rejections_277ca})
-    engine.add_835_payments({"claims": payments_835})
-
-    # Generate alerts and summary
-    unsubmitted_alerts = engine.find_unsubmitted_claims(days_threshold)
-    summary = engine.get_reconciliation_summary()
+    engine = _acquire_engine()
+    try:
+        # Read the clock once for both the alert ages and the report timestamp
+        now = datetime.now()
+
+        # Add data (simulating database lookups)
+        engine.add_277ca_rejections({"rejections": rejections_277ca})
+        engine.add_835_payments({"claims": payments_835})
+
+        # Stream alerts, keeping running counts
+        unsubmitted_alerts: List[Dict[str, Any]] = []
+        emit = on_alert or unsubmitted_alerts.append
+        alert_count = high_severity_count = 0
+        for alert in engine.iter_unsubmitted_claims(days_threshold, now=now):
+            alert_count += 1
+            if alert["severity"] == "HIGH":
+                high_severity_count += 1
+            emit(alert)
+
+        summary = engine.get_reconciliation_summary()
+    finally:
+        _release_engine(engine)
 
     report = {
-        "report_date": datetime.now().isoformat(),
+        "report_date": now.isoformat(),
         "unsubmitted_claims": unsubmitted_alerts,
         "summary": summary,
-        "alert_count": len(unsubmitted_alerts),
-        "high_severity_count": sum(1 for a in unsubmitted_alerts if a["severity"] == "HIGH"),
+        "alert_count": alert_count,
+        "high_severity_count": high_severity_count,
     }
 
     logger.info(
-        f"Reconciliation Report: {report['alert_count']} unsubmitted claims, "
-        f"${summary['potential_revenue_at_risk']:.2f} at risk"
+        "Reconciliation Report: %s unsubmitted claims, $%.2f at risk",
+        report["alert_count"],
+        summary["potential_revenue_at_risk"],
     )
 
     return report
@@ -1,14 +1,20 @@
 """AWS Lambda handler for processing X12 EDI documents."""
 
 # Standard library imports
-import json
-from datetime import datetime
-from typing import Any, Dict
+import atexit
+import hashlib
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 # Third-party imports
-import boto3
+import orjson
 from aws_lambda_powertools import Logger, Tracer
 from aws_lambda_powertools.utilities.typing import LambdaContext
+from boto3.s3.transfer import TransferConfig
 
 # Application imports - using absolute imports for enterprise standards
 # Absolute imports are preferred over relative imports (PEP 8) for:
@@ -17,9 +23,12 @@ from aws_lambda_powertools.utilities.typing import LambdaContext
 # - Improved IDE support and static analysis
 # - Easier refactoring and module relocation
 from src.core.config import get_settings
-from src.core.exceptions import X12ProcessingError
+from src.core.exceptions import InputError, X12ProcessingError
+from src.core.logging_config import flush_logs, setup_logging
 from src.input.local_input import LocalInput
-from src.input.s3_input import S3Input
+from src.input.s3_input import S3Input, get_s3_client
+from src.parsers.base_parser import BaseX12Parser
+from src.parsers.tokenizer import find_segment, sniff_delimiters, split_elements
 from src.parsers.x12_277_parser import X12_277_Parser
 from src.parsers.x12_277ca_parser import X12_277CA_Parser
 from src.parsers.x12_835_parser import X12_835_Parser
@@ -29,6 +38,39 @@ logger = Logger()
 tracer = Tracer()
 settings = get_settings()
 
+# One shared parser per transaction type, created at import so warm invocations
+# skip parser setup; parsers hold no per-document state (see BaseX12Parser)
+_PARSERS = {
+    "277": X12_277_Parser(),  # Claim status notifications
+    "277CA": X12_277CA_Parser(),  # Claim acknowledgment (rejections)
+    "835": X12_835_Parser(),  # Payment/remittance advice
+}
+
+# Transaction types refined by the implementation guide in ST03, as
+# (guide marker, type) pairs per ST01 code; other codes map to themselves
+_GUIDE_TYPES = {
+    "277": (("X214", "277CA"),),  # 005010X214 = Claim Acknowledgment
+}
+
+# Set once the first invocation has installed the buffered root log handler.
+# Done on invocation rather than at import, since setup_logging replaces every
+# root handler and importing this module must not reconfigure the caller's
+# logging (e.g. test capture handlers).
+_logging_configured = False
+
+# Upper bound on records of one S3 event processed concurrently
+BATCH_MAX_WORKERS = 32
+
+# Batch workers, kept across warm invocations. Separate from the S3 read pool
+# in src.input.s3_input, since batch workers block on ranged-GET tasks there.
+_BATCH_POOL = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS, thread_name_prefix="x12-batch")
+atexit.register(_BATCH_POOL.shutdown, wait=False)
+
+# Outputs above 8 MB are uploaded as concurrent 8 MB multipart chunks
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024, multipart_chunksize=8 * 1024 * 1024, max_concurrency=8
+)
+
 
 @logger.inject_lambda_context
 @tracer.capture_lambda_handler
@@ -49,6 +91,10 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         "output_path": "/path"     # For local output
     }
 
+    S3 trigger events carrying several Records are processed as a batch:
+    each object is read, parsed and written on its own worker thread, and
+    the response lists one result per record.
+
     Args:
         event: Lambda event dict
         context: Lambda context
@@ -56,8 +102,75 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
     Returns:
         Response dict with processing results
     """
+    global _logging_configured
+    if not _logging_configured:
+        # Application modules log through the standard library, buffered on
+        # the root logger and flushed at the end of each invocation
+        setup_logging()
+        _logging_configured = True
+
+    try:
+        records = event.get("Records")
+        if records and len(records) > 1:
+            return _process_batch(event, records)
+
+        status_code, body = _process_document(event)
+        return {"statusCode": status_code, "body": orjson.dumps(body).decode()}
+    finally:
+        # Application logs are buffered; write them out before Lambda freezes
+        flush_logs()
+
+
+def _process_batch(event: Dict[str, Any], records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Process every record of a multi-record S3 event concurrently.
+
+    Each record is handled as a single-record event. Per-document time is
+    dominated by S3 GET/PUT latency, so worker threads overlap the round
+    trips; process pools are not used because Lambda lacks the shared
+    memory (/dev/shm) that multiprocessing pools require.
+
+    Args:
+        event: Lambda event containing a Records list
+        records: S3 event records to process
+
+    Returns:
+        Response dict with one result per record. statusCode is 200 only if
+        every record succeeded, otherwise the highest record status.
+    """
+    logger.info(f"Processing batch of {len(records)} S3 records")
+
+    base = {name: value for name, value in event.items() if name != "Records"}
+    record_events = [{**base, "Records": [record]} for record in records]
+
+    outcomes = list(_BATCH_POOL.map(_process_document, record_events))
+
+    return {
+        "statusCode": max(status_code for status_code, _ in outcomes),
+        "body": orjson.dumps(
+            {
+                "message": f"Processed {len(outcomes)} X12 documents",
+                "results": [{"statusCode": status_code, **body} for status_code, body in outcomes],
+            }
+        ).decode(),
+    }
+
+
+def _process_document(event: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+    """
+    Read, parse, validate and write a single X12 document.
+
+    Args:
+        event: Lambda event for one document (see lambda_handler)
+
+    Returns:
+        Tuple of (HTTP status code, response body dict)
+    """
     try:
-        logger.info("Processing X12 EDI document", extra={"event": event})
+        logger.info("Processing X12 EDI document")
+        # The full event is only serialized when DEBUG logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Lambda event", extra={"event": event})
 
         # Check if this is an S3 event trigger (vs direct invocation)
         # S3 events have a "Records" array with S3 object metadata
@@ -74,41 +187,58 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         input_source = event.get("input_source", "s3")  # Default to S3 in Lambda
         transaction_type = event.get("transaction_type", "auto")  # Auto-detect if not specified
 
-        # Read X12 content from source (S3 or local file system)
-        x12_content = _read_input(event, input_source)
-
-        # Log content preview for debugging (helps identify line ending issues)
-        logger.info(
-            f"Read X12 content ({len(x12_content)} bytes). First 200 chars: {x12_content[:200]}"
-        )
-
-        # Auto-detect transaction type from ST segment if not provided
-        if transaction_type == "auto":
-            transaction_type = _detect_transaction_type(x12_content)
+        input_handler = _open_input(event, input_source)
+
+        # Auto-detect transaction type from the ST segment if not provided.
+        # Only the first few KB are fetched for this, so unsupported documents
+        # are rejected before the full download
+        detected = transaction_type == "auto"
+        if detected:
+            transaction_type = _detect_transaction_type(input_handler.read_prefix(), partial=True)
+            if transaction_type != "unknown":
+                _get_parser(transaction_type)  # Unsupported types fail here
+
+        # Read raw X12 bytes from source (S3 or local file system); after
+        # read_prefix() S3 input only fetches the bytes past the prefix
+        x12_bytes = input_handler.read_bytes()
+
+        # Log size at INFO; the content preview (helps identify line ending
+        # issues) is only sliced and decoded when DEBUG logging is enabled
+        logger.info(f"Read X12 content ({len(x12_bytes)} bytes)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"First 200 chars: {x12_bytes[:200].decode('utf-8', 'replace')}")
+
+        if detected:
+            # The ST segment may lie past the prefix after a long envelope, or
+            # be cut off by it
+            if transaction_type == "unknown":
+                transaction_type = _detect_transaction_type(x12_bytes)
             logger.info(f"Auto-detected transaction type: {transaction_type}")
 
         # Get appropriate parser and parse the X12 document
+        # Parsers work on str, so the content is decoded once, only after the
+        # transaction type is known to be supported
         parser = _get_parser(transaction_type)
-        parsed_data = parser.parse(x12_content)
+        parsed_data = parser.parse(_decode_content(x12_bytes))
 
         # Validate parsed data if validation is enabled in settings
+        validation_errors: List[str] = []
         if settings.ENABLE_VALIDATION:
             validation_errors = parser.validate(parsed_data)
 
             # In strict mode, fail the request if validation errors exist
             if validation_errors and settings.STRICT_MODE:
-                return {
-                    "statusCode": 400,
-                    "body": json.dumps(
-                        {"error": "Validation failed", "validation_errors": validation_errors}
-                    ),
-                }
+                return 400, {"error": "Validation failed", "validation_errors": validation_errors}
 
-            # Include validation errors in output for non-strict mode
-            parsed_data["validation_errors"] = validation_errors
+        # The parser's precomputed "_summary" entry only feeds the response;
+        # take it off the result so the written output keeps its schema
+        summary = _create_summary(parsed_data, validation_errors)
+        del parsed_data["_summary"]
 
-        # Write parsed data to output destination (S3, local, or in-memory)
-        output_location = _write_output(event, parsed_data)
+        # Write parsed data to output destination (S3, local, or in-memory);
+        # in non-strict mode any validation errors go to a separate errors
+        # document instead of inflating the main output
+        output_location = _write_output(event, parsed_data, validation_errors)
 
         # Log successful processing with key metadata
         logger.info(
@@ -117,45 +247,37 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
         )
 
         # Return success response with summary (not full parsed data)
-        return {
-            "statusCode": 200,
-            "body": json.dumps(
-                {
-                    "message": "Successfully processed X12 document",
-                    "transaction_type": transaction_type,
-                    "output_location": output_location,
-                    "summary": _create_summary(parsed_data),  # Lightweight summary for response
-                }
-            ),
+        return 200, {
+            "message": "Successfully processed X12 document",
+            "transaction_type": transaction_type,
+            "output_location": output_location,
+            # Lightweight summary for response
+            "summary": summary,
         }
 
     except X12ProcessingError as e:
         logger.error(f"X12 processing error: {str(e)}", exc_info=True)
-        return {
-            "statusCode": 400,
-            "body": json.dumps({"error": "X12 processing error", "message": str(e)}),
-        }
+        return 400, {"error": "X12 processing error", "message": str(e)}
     except Exception as e:
         logger.error(f"Unexpected error: {str(e)}", exc_info=True)
-        return {
-            "statusCode": 500,
-            "body": json.dumps({"error": "Internal server error", "message": str(e)}),
-        }
+        return 500, {"error": "Internal server error", "message": str(e)}
 
 
-def _read_input(event: Dict[str, Any], source: str) -> str:
+def _open_input(event: Dict[str, Any], source: str) -> Union[S3Input, LocalInput]:
     """
-    Read X12 EDI content from the specified input source.
+    Create the input handler for the specified input source.
 
     Supports reading from S3 buckets or local file system. The appropriate
-    input handler is instantiated based on the source type.
+    input handler is instantiated based on the source type; both provide
+    read_prefix() for detection and read_bytes() for the raw X12 EDI content
+    with normalized line endings, so nothing is decoded up front.
 
     Args:
         event: Lambda event containing source parameters (bucket, key, or file_path)
         source: Input source type - "s3" or "local"
 
     Returns:
-        str: Raw X12 EDI content with normalized line endings
+        S3Input or LocalInput handler
 
     Raises:
         ValueError: If required parameters are missing or source type is unsupported
@@ -168,8 +290,7 @@ def _read_input(event: Dict[str, Any], source: str) -> str:
             raise ValueError("S3 source requires 'bucket' and 'key'")
 
         # Use S3Input handler which handles line ending normalization
-        input_handler = S3Input(bucket=bucket, key=key)
-        return input_handler.read()
+        return S3Input(bucket=bucket, key=key)
 
     elif source == "local":
         # Extract file path from event
@@ -178,14 +299,13 @@ def _read_input(event: Dict[str, Any], source: str) -> str:
             raise ValueError("Local source requires 'file_path'")
 
         # Use LocalInput handler for file system access
-        input_handler = LocalInput(file_path=file_path)
-        return input_handler.read()
+        return LocalInput(file_path=file_path)
 
     else:
         raise ValueError(f"Unsupported input source: {source}")
 
 
-def _detect_transaction_type(x12_content: str) -> str:
+def _detect_transaction_type(x12_bytes: bytes, partial: bool = False) -> str:
     """
     Auto-detect X12 transaction type from the ST (Transaction Set Header) segment.
 
@@ -199,39 +319,67 @@ def _detect_transaction_type(x12_content: str) -> str:
     - 005010X214: 277CA (Claim Acknowledgment - rejections)
     - 005010X212: 277 (Claim Status - status inquiries)
 
+    Detection is one bytes.find for the ST segment plus a _GUIDE_TYPES
+    lookup, so adding transaction families or guides does not add scans.
+
     Args:
-        x12_content: Raw X12 EDI content
+        x12_bytes: Raw X12 EDI content as bytes
+        partial: x12_bytes is only a prefix of the document; an ST segment
+            without its terminator is then treated as not found, since the
+            prefix may have cut off its code or version
 
     Returns:
         str: Transaction type code (e.g., "277CA", "277", "835") or "unknown" if not found
     """
-    # Split on segment terminator (~) to process each segment
-    lines = x12_content.split("~")
+    # Delimiters come from fixed ISA offsets; senders may use other than * and ~
+    separator, terminator = sniff_delimiters(x12_bytes)
+
+    # Find the first ST segment with bytes.find; only that segment is decoded
+    st_segment = find_segment(x12_bytes, b"ST", terminator, separator, complete=partial)
+    if st_segment is None:
+        return "unknown"
+
+    # Split on element separator to extract transaction code and version
+    elements = split_elements(st_segment, separator)
 
-    # Find the ST segment which identifies the transaction type
-    for line in lines:
-        if line.strip().startswith("ST"):
-            # Split on element separator (*) to extract transaction code and version
-            elements = line.split("*")
-            if len(elements) >= 2:
-                # Second element (index 1) is the transaction set identifier
-                transaction_code = elements[1]
+    # Second element (index 1) is the transaction set identifier
+    transaction_code = elements[1]
 
-                # For 277, check version to determine if it's CA (Acknowledgment) or CS (Status)
-                if transaction_code == "277" and len(elements) >= 4:
-                    version = elements[3]
-                    if "X214" in version:  # 005010X214 = Claim Acknowledgment
-                        return "277CA"
-                    # else fall through to return "277" (Status)
+    # Some codes are refined by version, e.g. 277 into CA (Acknowledgment)
+    # or CS (Status); codes without an entry map to themselves
+    guides = _GUIDE_TYPES.get(transaction_code)
+    if guides and len(elements) >= 4:
+        version = elements[3]
+        for marker, transaction_type in guides:
+            if marker in version:
+                return transaction_type
 
-                return transaction_code
+    return transaction_code
 
-    return "unknown"
+
+def _decode_content(x12_bytes: bytes) -> str:
+    """
+    Decode raw X12 content for the parsers.
+
+    Args:
+        x12_bytes: Raw X12 EDI content as bytes
+
+    Returns:
+        str: Decoded X12 EDI content
+
+    Raises:
+        InputError: If the content is not valid UTF-8
+    """
+    try:
+        return x12_bytes.decode("utf-8")
+    except UnicodeDecodeError as e:
+        logger.error(f"Error decoding X12 content: {str(e)}")
+        raise InputError(f"Failed to decode X12 content: {str(e)}")
 
 
 def _get_parser(transaction_type: str):
     """
-    Factory function to instantiate the appropriate X12 parser based on transaction type.
+    Return the shared X12 parser for a transaction type.
 
     Supported transaction types:
     - 277: Health Care Claim Status Notification (005010X212)
@@ -247,36 +395,37 @@ def _get_parser(transaction_type: str):
     Raises:
         ValueError: If transaction type is not supported
     """
-    if transaction_type == "277":
-        # Instantiate parser for claim status notifications
-        return X12_277_Parser()
-    elif transaction_type == "277CA":
-        # Instantiate parser for claim acknowledgment (rejections)
-        return X12_277CA_Parser()
-    elif transaction_type == "835":
-        # Instantiate parser for payment/remittance advice
-        return X12_835_Parser()
-    else:
+    parser = _PARSERS.get(transaction_type)
+    if parser is None:
         raise ValueError(f"Unsupported transaction type: {transaction_type}")
+    return parser
 
 
-def _write_output(event: Dict[str, Any], data: Dict[str, Any]) -> str:
+def _write_output(
+    event: Dict[str, Any], data: Dict[str, Any], validation_errors: Optional[List[str]] = None
+) -> str:
     """
     Write parsed X12 data to the specified output destination.
 
     Supports writing to S3 buckets or local file system. For S3 output,
-    generates a unique filename with timestamp to prevent overwrites.
+    generates a unique filename with timestamp to prevent overwrites, plus a
+    short hash of the full source key so same-named objects under different
+    prefixes in one batch do not overwrite each other.
+    Validation errors, if any, are written next to the output as a separate
+    "<name>_errors.json" document.
 
     Args:
         event: Lambda event containing output parameters (bucket, prefix, path)
         data: Parsed X12 data to write (dict will be serialized to JSON)
+        validation_errors: Validation errors to write alongside the output
 
     Returns:
         str: Output location (S3 URI, file path, or "in-memory")
 
     Note:
-        Uses json.dumps with default=str to handle date/datetime objects
-        that may be present in parsed X12 data.
+        Serialized with BaseX12Parser.to_json (orjson), which encodes
+        date/datetime values natively (ISO 8601). S3 output is compact JSON;
+        only local output is pretty-printed.
     """
     # Determine output destination (default to S3 for Lambda environment)
     output_dest = event.get("output_destination", "s3")
@@ -287,48 +436,79 @@ def _write_output(event: Dict[str, Any], data: Dict[str, Any]) -> str:
         prefix = event.get("output_prefix", "output/")  # Default to output/ directory
 
         # Generate unique filename with UTC timestamp to prevent overwrites
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
         transaction_type = data.get("transaction_type", "unknown")
 
         # Preserve original filename if available from S3 trigger event
         original_key = event.get("key", "")
         if original_key:
-            # Extract filename without path and .x12 extension
-            original_filename = original_key.split("/")[-1].replace(".x12", "")
-            output_key = f"{prefix}{original_filename}_{timestamp}.json"
+            # Extract filename without path and .x12 extension; the basename
+            # alone is not unique across prefixes, so the hash of the full
+            # key tells records of one batch apart within the same second
+            original_filename = original_key.rpartition("/")[2].removesuffix(".x12")
+            key_hash = hashlib.sha256(original_key.encode()).hexdigest()[:8]
+            output_key = f"{prefix}{original_filename}_{key_hash}_{timestamp}.json"
         else:
             # Fallback to transaction type if no original filename
             output_key = f"{prefix}{transaction_type}_{timestamp}.json"
 
-        # Write JSON to S3 with proper content type
-        s3_client = boto3.client("s3")
-        s3_client.put_object(
-            Bucket=bucket,
-            Key=output_key,
-            Body=json.dumps(data, indent=2, default=str),  # default=str handles date objects
-            ContentType="application/json",
+        # Write compact JSON to S3 (no indent: pretty-printing inflates the
+        # payload ~30%). upload_fileobj sends a single PUT below the multipart
+        # threshold and concurrent multipart chunks above it.
+        body = BaseX12Parser.to_json(data)
+        get_s3_client(settings.AWS_REGION).upload_fileobj(
+            BytesIO(body),
+            bucket,
+            output_key,
+            ExtraArgs={"ContentType": "application/json"},
+            Config=TRANSFER_CONFIG,
         )
 
+        if validation_errors:
+            errors_key = _errors_path(output_key)
+            get_s3_client(settings.AWS_REGION).put_object(
+                Bucket=bucket,
+                Key=errors_key,
+                Body=orjson.dumps({"validation_errors": validation_errors}),
+                ContentType="application/json",
+            )
+            logger.info(f"Wrote validation errors to s3://{bucket}/{errors_key}")
+
         logger.info(f"Wrote output to s3://{bucket}/{output_key}")
         return f"s3://{bucket}/{output_key}"
 
     elif output_dest == "local":
         # Write to local file system (used for testing)
         output_path = event.get("output_path", "/tmp/result.json")
-        with open(output_path, "w") as f:
-            json.dumps(data, f, indent=2)
+        # Single write of pre-serialized bytes; the buffered writer passes
+        # large payloads straight to the OS and completes partial writes
+        with open(output_path, "wb") as f:
+            f.write(BaseX12Parser.to_json(data, indent=True))
+        if validation_errors:
+            with open(_errors_path(output_path), "wb") as f:
+                f.write(
+                    orjson.dumps(
+                        {"validation_errors": validation_errors}, option=orjson.OPT_INDENT_2
+                    )
+                )
         return output_path
 
     # Return in-memory for other cases (no persistent storage)
     return "in-memory"
 
 
-def _create_summary(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
+def _errors_path(output_path: str) -> str:
+    """Return the validation errors location for an output path or key."""
+    return f"{os.path.splitext(output_path)[0]}_errors.json"
+
+
+def _create_summary(parsed_data: Dict[str, Any], validation_errors: List[str]) -> Dict[str, Any]:
     """
     Create a concise summary of the parsed X12 data for API response.
 
     Extracts key metadata without including the full parsed data structure,
-    making the Lambda response lightweight and informative.
+    making the Lambda response lightweight and informative. Transaction type,
+    version and count are precomputed by the parser in the "_summary" entry.
 
     Args:
         parsed_data: Complete parsed X12 data dictionary
@@ -336,14 +516,9 @@ def _create_summary(parsed_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         dict: Summary containing transaction type, version, count, and validation status
     """
-    # Get transaction list to count how many transactions were processed
-    transactions = parsed_data.get("transactions", [])
-
-    return {
-        "transaction_type": parsed_data.get("transaction_type"),  # e.g., "277", "835"
-        "version": parsed_data.get("version"),  # X12 version (e.g., "005010X212")
-        "transaction_count": len(transactions),  # Number of transactions in the document
-        "has_validation_errors": bool(
-            parsed_data.get("validation_errors")
-        ),  # Quick validation check
-    }
+    # Copy the precomputed transaction_type/version/transaction_count entry
+    # and add the one per-request field; bool() of the error list is O(1)
+    summary = parsed_data["_summary"].copy()
+    summary["has_validation_errors"] = bool(validation_errors)
+    summary["validation_error_count"] = len(validation_errors)
+    return summary
@@ -78,6 +78,10 @@ class BaseInput(ABC):
         """
         Get size of input content in bytes.
 
+        This default reads and re-encodes the whole content; handlers that
+        know their size up front (file stat, S3 ContentLength, upload bytes)
+        override it with a constant-time lookup.
+
         Returns:
             Size in bytes
         """
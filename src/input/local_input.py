@@ -1,5 +1,6 @@
 """Local filesystem input handler."""
 
+import mmap
 import os
 from pathlib import Path
 
@@ -26,6 +27,7 @@ class LocalInput(BaseInput):
         self.file_path = Path(file_path)
         self.encoding = encoding
         self.settings = get_settings()
+        self._validated = False  # Set once validate_source() has passed
 
     def validate_source(self) -> bool:
         """
@@ -50,17 +52,82 @@ class LocalInput(BaseInput):
         file_size = self.file_path.stat().st_size
         if file_size > self.settings.max_file_size_bytes:
             raise FileSizeError(
-                f"File size ({file_size} bytes) exceeds maximum "
-                f"({self.settings.max_file_size_bytes} bytes)"
+                "File size ({size} bytes) exceeds maximum ({max_size} bytes)",
+                size=file_size,
+                max_size=self.settings.max_file_size_bytes,
             )
 
         logger.info(f"Validated local file: {self.file_path} ({file_size} bytes)")
+        self._validated = True
         return True
 
+    def _ensure_validated(self) -> None:
+        """Run validate_source() unless an earlier read already did."""
+        if not self._validated:
+            self.validate_source()
+
+    def read_prefix(self, n_bytes: int = 4096) -> bytes:
+        """
+        Read the first bytes of the local file, e.g. to sniff the transaction type.
+
+        The file is validated once; a following read_bytes() or read() skips
+        the existence, permission and size checks.
+
+        Args:
+            n_bytes: Number of leading bytes to read
+
+        Returns:
+            Up to n_bytes of content with line endings normalized to \n
+
+        Raises:
+            InputError: If reading fails
+        """
+        self._ensure_validated()
+        try:
+            with open(self.file_path, "rb") as f:
+                prefix = f.read(n_bytes)
+        except OSError as e:
+            raise InputError(f"Failed to read file: {str(e)}")
+        return prefix.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    def read_bytes(self) -> bytes:
+        """
+        Read raw X12 content from local file without decoding it.
+
+        Line endings are normalized to \n, as text-mode reading would.
+
+        Returns:
+            File content as bytes
+
+        Raises:
+            InputError: If reading fails
+        """
+        try:
+            self._ensure_validated()
+
+            logger.info(f"Reading local file: {self.file_path}")
+            with open(self.file_path, "rb") as f:
+                content = f.read()
+
+            logger.info(f"Successfully read {len(content)} bytes from {self.file_path}")
+
+        except (OSError, IOError) as e:
+            logger.error(f"Error reading file {self.file_path}: {str(e)}")
+            raise InputError(f"Failed to read file: {str(e)}")
+
+        if b"\r" in content:
+            content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        return content
+
     def read(self) -> str:
         """
         Read X12 content from local file.
 
+        The file is memory-mapped and decoded straight from the mapping, so
+        no intermediate bytes copy of the whole file is made; the mapped
+        pages are file-backed and can be dropped by the OS. Line endings are
+        normalized to \n, as in read_bytes().
+
         Returns:
             File content as string
 
@@ -68,20 +135,36 @@ class LocalInput(BaseInput):
             InputError: If reading fails
         """
         try:
-            self.validate_source()
+            self._ensure_validated()
 
             logger.info(f"Reading local file: {self.file_path}")
-            with open(self.file_path, "r", encoding=self.encoding) as f:
-                content = f.read()
+            with open(self.file_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    content = ""  # Empty files cannot be mapped
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = str(mm, self.encoding)
 
             logger.info(f"Successfully read {len(content)} characters from {self.file_path}")
-            self._content = content
-            return content
 
         except (OSError, IOError) as e:
             logger.error(f"Error reading file {self.file_path}: {str(e)}")
             raise InputError(f"Failed to read file: {str(e)}")
 
+        if "\r" in content:
+            content = content.replace("\r\n", "\n").replace("\r", "\n")
+        self._content = content
+        return content
+
+    def get_size(self) -> int:
+        """
+        Get file size in bytes from the filesystem, without reading the file.
+
+        Returns:
+            Size in bytes (as stored, before line ending normalization)
+        """
+        return self.file_path.stat().st_size
+
     def get_metadata(self) -> dict:
         """
         Get file metadata.
@@ -1,8 +1,12 @@
 """AWS S3 input handler."""
 
-from typing import Optional
+import atexit
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Optional
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from ..core.config import get_settings
@@ -12,11 +16,62 @@ from .base_input import BaseInput
 
 logger = get_logger(__name__)
 
+# Objects larger than one part are fetched as concurrent ranged GETs
+DEFAULT_PART_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Bytes fetched by read_prefix(); the ISA, GS and ST headers fit well within it
+DEFAULT_PREFIX_SIZE = 4096
+
+# Connection pool size of the shared client; covers every ranged-GET worker
+S3_MAX_POOL_CONNECTIONS = 32
+
+# Worker threads for ranged GETs, shared by all S3Input instances so warm
+# invocations reuse threads and the total stays bounded under batching.
+# Tasks on this pool never submit to it, so waiting on them cannot deadlock.
+_IO_POOL = ThreadPoolExecutor(max_workers=S3_MAX_POOL_CONNECTIONS, thread_name_prefix="x12-s3")
+atexit.register(_IO_POOL.shutdown, wait=False)
+
+
+@lru_cache(maxsize=None)
+def get_s3_client(region: str) -> Any:
+    """
+    Get the shared S3 client for a region, creating it on first use.
+
+    boto3 clients are thread-safe, so one client per region is reused by all
+    S3Input instances and output writers. In a warm Lambda container this
+    keeps the connection pool and credential cache across invocations
+    instead of rebuilding them for every request.
+
+    Args:
+        region: AWS region name
+
+    Returns:
+        boto3 S3 client
+    """
+    return boto3.client(
+        "s3",
+        region_name=region,
+        config=Config(
+            max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+            retries={"mode": "adaptive"},
+            tcp_keepalive=True,
+        ),
+    )
+
 
 class S3Input(BaseInput):
     """Input handler for AWS S3 objects."""
 
-    def __init__(self, bucket: str, key: str, region: Optional[str] = None):
+    def __init__(
+        self,
+        bucket: str,
+        key: str,
+        region: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        client: Optional[Any] = None,
+    ):
         """
         Initialize S3 input.
 
@@ -24,15 +79,23 @@ class S3Input(BaseInput):
             bucket: S3 bucket name
             key: S3 object key
             region: AWS region (uses config if not specified)
+            part_size: Byte range fetched per GET for large objects
+            max_concurrency: Maximum concurrent ranged GETs
+            client: boto3 S3 client (default: the shared client for the region)
         """
         super().__init__(f"s3://{bucket}/{key}")
         self.bucket = bucket
         self.key = key
         self.settings = get_settings()
         self.region = region or self.settings.AWS_REGION
+        self.part_size = part_size
+        self.max_concurrency = max_concurrency
+        self._head: Optional[dict] = None  # Cached head_object response
+        self._prefix: Optional[bytes] = None  # Raw bytes fetched by read_prefix()
+        self._size: Optional[int] = None  # Object size from the prefix Content-Range
+        self._etag: Optional[str] = None  # ETag of the first ranged GET; pins later parts
 
-        # Initialize S3 client
-        self.s3_client = boto3.client("s3", region_name=self.region)
+        self.s3_client = client or get_s3_client(self.region)
 
     def validate_source(self) -> bool:
         """
@@ -46,27 +109,206 @@ class S3Input(BaseInput):
         """
         try:
             # Get object metadata
-            response = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
-
-            # Check file size
-            file_size = response["ContentLength"]
-            if file_size > self.settings.max_file_size_bytes:
-                raise FileSizeError(
-                    f"S3 object size ({file_size} bytes) exceeds maximum "
-                    f"({self.settings.max_file_size_bytes} bytes)"
-                )
+            self._head = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+        except ClientError as e:
+            error_code = e.response.get("Error", {}).get("Code", "Unknown")
+            raise self._access_error(error_code) or S3Error(f"S3 error ({error_code}): {str(e)}")
+
+        # Check file size
+        file_size = self._head["ContentLength"]
+        self._check_size(file_size)
+
+        logger.info(f"Validated S3 object: s3://{self.bucket}/{self.key} ({file_size} bytes)")
+        return True
+
+    def _check_size(self, file_size: int) -> None:
+        """Raise FileSizeError if the object exceeds MAX_FILE_SIZE_MB."""
+        if file_size > self.settings.max_file_size_bytes:
+            raise FileSizeError(
+                "S3 object size ({size} bytes) exceeds maximum ({max_size} bytes)",
+                size=file_size,
+                max_size=self.settings.max_file_size_bytes,
+            )
 
-            logger.info(f"Validated S3 object: s3://{self.bucket}/{self.key} ({file_size} bytes)")
-            return True
+    def _access_error(self, error_code: str) -> Optional[S3Error]:
+        """Map a missing-object or access-denied error code to an S3Error."""
+        if error_code in ("404", "NoSuchKey"):
+            return S3Error(
+                "S3 object not found: s3://{bucket}/{key}", bucket=self.bucket, key=self.key
+            )
+        if error_code in ("403", "AccessDenied"):
+            return S3Error(
+                "Access denied to S3 object: s3://{bucket}/{key}",
+                bucket=self.bucket,
+                key=self.key,
+            )
+        return None
+
+    def read_prefix(self, n_bytes: int = DEFAULT_PREFIX_SIZE) -> bytes:
+        """
+        Read the first bytes of the S3 object with a single ranged GET.
 
+        Enough to sniff delimiters and the transaction type without
+        downloading the whole object. The fetched bytes and the object size
+        are kept, so a following read_bytes() starts after the prefix instead
+        of fetching it again, and an oversized object is rejected here.
+
+        Args:
+            n_bytes: Number of leading bytes to fetch
+
+        Returns:
+            Up to n_bytes of content with line endings normalized to \n
+
+        Raises:
+            S3Error: If reading fails
+            FileSizeError: If the object exceeds MAX_FILE_SIZE_MB
+        """
+        try:
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=self.key, Range=f"bytes=0-{n_bytes - 1}"
+            )
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "Unknown")
-            if error_code == "404":
-                raise S3Error(f"S3 object not found: s3://{self.bucket}/{self.key}")
-            elif error_code == "403":
-                raise S3Error(f"Access denied to S3 object: s3://{self.bucket}/{self.key}")
+            if error_code != "InvalidRange":
+                logger.error(f"Error reading S3 object prefix: {str(e)}")
+                raise self._access_error(error_code) or S3Error(
+                    f"Failed to read S3 object: {str(e)}"
+                )
+            # Ranged GETs of an empty object are rejected as unsatisfiable
+            self._prefix, self._size = b"", 0
+            return b""
+
+        self._size = int(response["ContentRange"].rpartition("/")[2])
+        self._check_size(self._size)
+        self._etag = response.get("ETag")
+        self._prefix = response["Body"].read()
+        return self._prefix.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+    def read_bytes(self) -> bytes:
+        """
+        Read raw X12 content from S3 object without decoding it.
+
+        No HEAD request is made: the first part is fetched with a ranged GET
+        whose Content-Range reports the object size, which is then checked
+        against MAX_FILE_SIZE_MB. Objects within one part need a single
+        request; larger ones fetch their remaining parts concurrently, since a
+        single GET stream is bandwidth-capped. After read_prefix() only the
+        bytes past the prefix are fetched.
+
+        Returns:
+            Object content as bytes with line endings normalized to \n
+
+        Raises:
+            S3Error: If reading fails
+            FileSizeError: If the object exceeds MAX_FILE_SIZE_MB
+        """
+        logger.info(f"Reading S3 object: s3://{self.bucket}/{self.key}")
+
+        if self._prefix is not None:
+            size, content = self._size, self._prefix
+        else:
+            try:
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket, Key=self.key, Range=f"bytes=0-{self.part_size - 1}"
+                )
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                if error_code != "InvalidRange":
+                    logger.error(f"Error reading S3 object: {str(e)}")
+                    raise self._access_error(error_code) or S3Error(
+                        f"Failed to read S3 object: {str(e)}"
+                    )
+                # Ranged GETs of an empty object are rejected as unsatisfiable
+                size, content = 0, b""
             else:
-                raise S3Error(f"S3 error ({error_code}): {str(e)}")
+                size = int(response["ContentRange"].rpartition("/")[2])
+                self._check_size(size)
+                self._etag = response.get("ETag")
+                content = response["Body"].read()
+
+        if size > len(content):
+            # A failed later part (even InvalidRange, e.g. the object shrank
+            # after the first GET) fails the read rather than returning b""
+            try:
+                content = self._read_ranges(size, content)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                logger.error(f"Error reading S3 object: {str(e)}")
+                raise self._access_error(error_code) or S3Error(
+                    f"Failed to read S3 object: {str(e)}"
+                )
+
+        # CRITICAL: Normalize line endings to Unix style (\n) for X12 parsing
+        # Issue: Windows files uploaded to S3 have \r\n line endings
+        # LinuxForHealth X12 parser is sensitive to line ending format and fails
+        # with Windows line endings, even though X12 standard uses segment
+        # terminators (~) not line breaks. This normalization ensures consistent
+        # parsing regardless of the source file's line ending format.
+        # Order matters: replace \r\n first, then \r to handle all cases:
+        # - Windows (\r\n) → \n
+        # - Old Mac (\r) → \n
+        # - Unix (\n) → \n (unchanged)
+        # CR and LF are single bytes in UTF-8, so this is safe before decoding.
+        content = content.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+        logger.info(f"Successfully read {len(content)} bytes from s3://{self.bucket}/{self.key}")
+        return content
+
+    def _read_ranges(self, size: int, first_part: bytes) -> bytes:
+        """
+        Fetch the rest of an object as concurrent ranged GETs.
+
+        Each part is written into its slot of a preallocated buffer, so parts
+        may complete in any order. Every part is requested with IfMatch on the
+        ETag of the first GET, so an object overwritten mid-read fails with
+        PreconditionFailed instead of splicing two versions together.
+
+        Args:
+            size: Object size in bytes
+            first_part: Bytes already fetched from the start of the object
+
+        Returns:
+            Object content as bytes
+
+        Raises:
+            ClientError: If any ranged GET fails
+            S3Error: If a part's body length does not match its range
+        """
+        buf = bytearray(size)
+        buf[: len(first_part)] = first_part
+        ranges = [
+            (start, min(start + self.part_size, size) - 1)
+            for start in range(len(first_part), size, self.part_size)
+        ]
+
+        extra_args = {"IfMatch": self._etag} if self._etag else {}
+
+        def fetch(byte_range):
+            first, last = byte_range
+            response = self.s3_client.get_object(
+                Bucket=self.bucket, Key=self.key, Range=f"bytes={first}-{last}", **extra_args
+            )
+            body = response["Body"].read()
+            # A slice assignment of the wrong length would resize buf and
+            # shift every later part, so check before writing
+            if len(body) != last - first + 1:
+                raise S3Error(
+                    "Read {got} bytes for range {first}-{last} of s3://{bucket}/{key}",
+                    got=len(body),
+                    first=first,
+                    last=last,
+                    bucket=self.bucket,
+                    key=self.key,
+                )
+            buf[first : last + 1] = body
+
+        # Submit in waves of max_concurrency to cap this read's share of the
+        # shared pool; list() surfaces the first failed part's exception here
+        for start in range(0, len(ranges), self.max_concurrency):
+            list(_IO_POOL.map(fetch, ranges[start : start + self.max_concurrency]))
+
+        logger.info(f"Fetched {len(ranges) + 1} byte ranges from s3://{self.bucket}/{self.key}")
+        return bytes(buf)
 
     def read(self) -> str:
         """
@@ -77,50 +319,53 @@ class S3Input(BaseInput):
 
         Raises:
             S3Error: If reading fails
+            InputError: If the content is not valid UTF-8
         """
         try:
-            self.validate_source()
-
-            logger.info(f"Reading S3 object: s3://{self.bucket}/{self.key}")
-
-            # Fetch object from S3 and decode to UTF-8 string
-            response = self.s3_client.get_object(Bucket=self.bucket, Key=self.key)
-            content = response["Body"].read().decode("utf-8")
-
-            # CRITICAL: Normalize line endings to Unix style (\n) for X12 parsing
-            # Issue: Windows files uploaded to S3 have \r\n line endings
-            # LinuxForHealth X12 parser is sensitive to line ending format and fails
-            # with Windows line endings, even though X12 standard uses segment
-            # terminators (~) not line breaks. This normalization ensures consistent
-            # parsing regardless of the source file's line ending format.
-            # Order matters: replace \r\n first, then \r to handle all cases:
-            # - Windows (\r\n) → \n
-            # - Old Mac (\r) → \n
-            # - Unix (\n) → \n (unchanged)
-            content = content.replace("\r\n", "\n").replace("\r", "\n")
-
-            logger.info(
-                f"Successfully read {len(content)} characters from s3://{self.bucket}/{self.key}"
-            )
-            self._content = content
-            return content
-
-        except ClientError as e:
-            logger.error(f"Error reading S3 object: {str(e)}")
-            raise S3Error(f"Failed to read S3 object: {str(e)}")
+            content = self.read_bytes().decode("utf-8")
         except UnicodeDecodeError as e:
             logger.error(f"Error decoding S3 object content: {str(e)}")
             raise InputError(f"Failed to decode S3 object content: {str(e)}")
 
+        self._content = content
+        return content
+
+    def get_size(self) -> int:
+        """
+        Get object size in bytes from its metadata, without downloading it.
+
+        Reuses the head_object response cached by validate_source() or
+        get_metadata(), if any.
+
+        Returns:
+            Size in bytes
+
+        Raises:
+            S3Error: If the object metadata cannot be read
+        """
+        if self._head is None:
+            try:
+                self._head = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+            except ClientError as e:
+                error_code = e.response.get("Error", {}).get("Code", "Unknown")
+                raise self._access_error(error_code) or S3Error(
+                    f"S3 error ({error_code}): {str(e)}"
+                )
+        return self._head["ContentLength"]
+
     def get_metadata(self) -> dict:
         """
         Get S3 object metadata.
 
+        Reuses the head_object response cached by validate_source(), if any.
+
         Returns:
             Dictionary with object metadata
         """
         try:
-            response = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+            if self._head is None:
+                self._head = self.s3_client.head_object(Bucket=self.bucket, Key=self.key)
+            response = self._head
             return {
                 "bucket": self.bucket,
                 "key": self.key,
@@ -1,5 +1,7 @@
 """HTTP upload input handler."""
 
+import codecs
+from functools import partial
 from typing import BinaryIO
 
 from ..core.config import get_settings
@@ -9,6 +11,9 @@ from .base_input import BaseInput
 
 logger = get_logger(__name__)
 
+# Bytes read from an upload stream per decode step
+STREAM_CHUNK_SIZE = 1024 * 1024
+
 
 class UploadInput(BaseInput):
     """Input handler for HTTP file uploads."""
@@ -45,8 +50,9 @@ class UploadInput(BaseInput):
         file_size = len(self.file_content)
         if file_size > self.settings.max_file_size_bytes:
             raise FileSizeError(
-                f"Upload size ({file_size} bytes) exceeds maximum "
-                f"({self.settings.max_file_size_bytes} bytes)"
+                "Upload size ({size} bytes) exceeds maximum ({max_size} bytes)",
+                size=file_size,
+                max_size=self.settings.max_file_size_bytes,
             )
 
         logger.info(f"Validated upload: {self.filename} ({file_size} bytes)")
@@ -76,6 +82,15 @@ class UploadInput(BaseInput):
             logger.error(f"Error decoding upload content: {str(e)}")
             raise InputError(f"Failed to decode upload content: {str(e)}")
 
+    def get_size(self) -> int:
+        """
+        Get upload size in bytes without decoding the content.
+
+        Returns:
+            Size in bytes
+        """
+        return len(self.file_content)
+
     def get_metadata(self) -> dict:
         """
         Get upload metadata.
@@ -85,7 +100,7 @@ class UploadInput(BaseInput):
         """
         return {
             "filename": self.filename,
-            "size": len(self.file_content),
+            "size": self.get_size(),
             "encoding": self.encoding,
         }
 
@@ -155,16 +170,23 @@ class StreamingUploadInput(BaseInput):
 
             logger.info(f"Reading streaming upload: {self.filename}")
 
-            # Read stream content
-            content_bytes = self.file_stream.read()
-
-            # Check size
-            if len(content_bytes) > self.settings.max_file_size_bytes:
-                raise FileSizeError(
-                    f"Stream size exceeds maximum ({self.settings.max_file_size_bytes} bytes)"
-                )
-
-            content = content_bytes.decode(self.encoding)
+            # Decode the stream chunk by chunk, so the whole upload is never
+            # held as bytes and str at once; the incremental decoder carries
+            # multi-byte characters split across chunk boundaries. The size
+            # limit is enforced as bytes arrive, before reading any further.
+            decoder = codecs.getincrementaldecoder(self.encoding)()
+            parts = []
+            size = 0
+            for chunk in iter(partial(self.file_stream.read, STREAM_CHUNK_SIZE), b""):
+                size += len(chunk)
+                if size > self.settings.max_file_size_bytes:
+                    raise FileSizeError(
+                        "Stream size exceeds maximum ({max_size} bytes)",
+                        max_size=self.settings.max_file_size_bytes,
+                    )
+                parts.append(decoder.decode(chunk))
+            parts.append(decoder.decode(b"", final=True))
+            content = "".join(parts)
 
             logger.info(f"Successfully read {len(content)} characters from stream")
             self._content = content
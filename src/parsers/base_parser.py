@@ -1,13 +1,47 @@
 """Base parser interface for X12 documents."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple, Union
 
+import orjson
 from linuxforhealth.x12.io import X12ModelReader
+from pydantic import BaseModel
+
+
+def _model_to_dict(value: Any) -> Any:
+    """
+    Convert a LinuxForHealth model tree to plain dicts, dropping None fields.
+
+    Produces the same result as model.dict(exclude_none=True) for these
+    models (same keys and key order), but reads each model's __dict__
+    directly instead of going through pydantic's per-field include/exclude
+    and alias handling, which is about twice as fast on 835 models.
+
+    Args:
+        value: Model, list, dict or scalar value
+
+    Returns:
+        Value with every nested model converted to a dict
+    """
+    if isinstance(value, BaseModel):
+        return {
+            key: _model_to_dict(item) for key, item in value.__dict__.items() if item is not None
+        }
+    if isinstance(value, list):
+        return [_model_to_dict(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _model_to_dict(item) for key, item in value.items()}
+    return value
 
 
 class BaseX12Parser(ABC):
-    """Abstract base class for X12 parsers."""
+    """Abstract base class for X12 parsers.
+
+    Parser instances are shared: handlers create one per transaction type
+    and reuse it across invocations and worker threads. Implementations must
+    therefore be stateless between parse() calls - keep per-document state
+    in locals or the returned result, never on self.
+    """
 
     def __init__(self):
         """Initialize the parser."""
@@ -43,6 +77,41 @@ class BaseX12Parser(ABC):
         """
         pass
 
+    def attach_summary(self, result: Dict[str, Any]) -> None:
+        """
+        Store the response summary fields on a parse result.
+
+        The parser already holds the transaction list, so the count is taken
+        here once instead of by each handler walking the result again. The
+        entry is for the response only; handlers remove it before writing
+        the result, so persisted output does not carry it.
+
+        Args:
+            result: Parse result with transaction_type and version set
+        """
+        result["_summary"] = {
+            "transaction_type": result["transaction_type"],
+            "version": result["version"],
+            "transaction_count": len(result.get("transactions", ())),
+        }
+
+    @staticmethod
+    def to_json(result: Dict[str, Any], indent: bool = False) -> bytes:
+        """
+        Serialize a parse result to JSON.
+
+        Uses orjson, which encodes dicts, lists and date/datetime values in C;
+        default=str covers remaining types such as Decimal.
+
+        Args:
+            result: Parse result (or any part of it)
+            indent: Pretty-print with two-space indentation
+
+        Returns:
+            UTF-8 encoded JSON
+        """
+        return orjson.dumps(result, option=orjson.OPT_INDENT_2 if indent else None, default=str)
+
     def parse_with_linuxforhealth(self, x12_content: str) -> List[Dict[str, Any]]:
         """
         Parse X12 content using LinuxForHealth library.
@@ -51,32 +120,107 @@ class BaseX12Parser(ABC):
             x12_content: Raw X12 EDI content
 
         Returns:
-            List of parsed transaction models
+            List of parsed transaction models as dicts, without None fields
         """
         models = []
         with X12ModelReader(x12_content) as reader:
             for model in reader.models():
-                models.append(model.dict(exclude_none=True))
+                models.append(_model_to_dict(model))
         return models
 
     def get_transaction_info(self, x12_content: str) -> Dict[str, str]:
         """
         Extract transaction type and version from X12 content.
 
+        Reads only up to the end of the first ST segment, so classifying a
+        document costs a few hundred bytes of scanning, not a second pass.
+        X12_277CA_Parser.parse() calls it first to reject other transactions.
+
         Args:
             x12_content: Raw X12 EDI content
 
         Returns:
             Dictionary with transaction_code and version
         """
-        # Parse ST segment to get transaction type
-        lines = x12_content.split("~")
-        for line in lines:
-            if line.strip().startswith("ST"):
-                elements = line.split("*")
+        # Locate the first ST segment with str.find rather than splitting the
+        # whole document; ST follows the ISA/GS envelope, so this stops early.
+        # A match only counts at a segment boundary (start of content or after
+        # "~", ignoring whitespace), not inside element data.
+        idx = x12_content.find("ST*")
+        while idx != -1:
+            if not x12_content[x12_content.rfind("~", 0, idx) + 1 : idx].strip():
+                end = x12_content.find("~", idx)
+                elements = x12_content[idx : end if end != -1 else None].split("*", 4)
                 if len(elements) >= 3:
                     return {
                         "transaction_code": elements[1],
                         "version": elements[3] if len(elements) > 3 else "unknown",
                     }
+                break
+            idx = x12_content.find("ST*", idx + 1)
         return {"transaction_code": "unknown", "version": "unknown"}
+
+    @staticmethod
+    def _as_list(value: Any) -> List[Dict[str, Any]]:
+        """
+        Normalize a loop or segment that may be a dict or a list of dicts.
+
+        Args:
+            value: A list, a single dict, or None/absent
+
+        Returns:
+            The list itself, the dict wrapped in a list, or [] otherwise
+
+        Note:
+            Checked with exact type tests, as in _safe_get.
+        """
+        if type(value) is list:
+            return value
+        return [value] if type(value) is dict else []
+
+    @staticmethod
+    def _first(value: Any) -> Dict[str, Any]:
+        """
+        Take the first entry of a loop that may be a dict or a list of dicts.
+
+        Args:
+            value: A list, a single dict, or None/absent
+
+        Returns:
+            The first list entry or the dict itself, or {} otherwise
+
+        Note:
+            Checked with exact type tests, as in _as_list.
+        """
+        if type(value) is list:
+            value = value[0] if value else None
+        return value if type(value) is dict else {}
+
+    @staticmethod
+    def _safe_get(
+        dictionary: Dict, key_path: Union[str, Tuple[str, ...]], default: Any = ""
+    ) -> Any:
+        """
+        Safely get a nested dictionary value.
+
+        Args:
+            dictionary: Dictionary to read from
+            key_path: Tuple of keys, or a dot-separated string of keys. Strings
+                are split on every call, so call sites in per-claim or
+                per-service-line code pass module-level tuples.
+            default: Value returned when a key is missing or the value is None
+
+        Returns:
+            The nested value, or default
+
+        Note:
+            Model data from parse_with_linuxforhealth is plain dicts, so levels
+            are checked with an exact type test rather than isinstance().
+        """
+        keys = key_path.split(".") if isinstance(key_path, str) else key_path
+        value = dictionary
+        for key in keys:
+            if type(value) is not dict:
+                return default
+            value = value.get(key, default)
+        return value if value is not None else default
@@ -0,0 +1,203 @@
+"""Byte-level X12 segment tokenizer.
+
+Splits raw X12 content into segments without first building a decoded copy
+of the whole document. All scanning is done with C-level ``bytes`` methods,
+and callers decode only the segments they actually need.
+
+Scanning deliberately stays on ``bytes.find``/``split``/``translate``: these
+already run as C loops, so a JIT-compiled byte scanner (e.g. Numba) would
+add numpy/llvmlite to the Lambda layer and a compile step at cold start
+without a measurable gain on typical file sizes. Python-level per-byte or
+per-offset loops are slower than a single ``split`` and should be avoided.
+Delimiters are likewise read from fixed ISA offsets (sniff_delimiters)
+rather than discovered by scanning.
+
+Callers:
+    - src.handlers.lambda_handler: Transaction type detection
+    - scripts.compare_277_files: Segment sampling for file comparison
+    - tests.debug.debug_277ca: Segment inspection
+    - tests.integration.test_277_hdi_files: Streamed segment counting
+
+Example:
+    >>> with open("claims.x12", "rb") as f:
+    ...     buf = f.read()
+    >>> nm1 = [decode_segment(s) for s in iter_segments(buf) if s.startswith(b"NM1*")]
+"""
+
+from typing import Iterator, List, Optional, Tuple
+
+SEGMENT_TERMINATOR = b"~"
+ELEMENT_SEPARATOR = b"*"
+_ELEMENT_SEPARATOR_STR = ELEMENT_SEPARATOR.decode("ascii")
+
+# Read size used by iter_file_segments
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+# The ISA segment is fixed-width: the element separator is its 4th byte and
+# the segment terminator immediately follows its 16 elements at offset 105
+ISA_LENGTH = 106
+
+
+def sniff_delimiters(buf: bytes) -> Tuple[bytes, bytes]:
+    """
+    Read the element separator and segment terminator from the ISA header.
+
+    Both sit at fixed offsets of the fixed-width ISA segment, so this is two
+    byte lookups rather than a scan. Content without a complete ISA header
+    gets the default ``*`` and ``~``.
+
+    Args:
+        buf: Raw X12 content as bytes
+
+    Returns:
+        Tuple of (element separator, segment terminator)
+    """
+    buf = buf.lstrip()
+    if buf.startswith(b"ISA") and len(buf) >= ISA_LENGTH:
+        return buf[3:4], buf[ISA_LENGTH - 1 : ISA_LENGTH]
+    return ELEMENT_SEPARATOR, SEGMENT_TERMINATOR
+
+
+def iter_segments(buf: bytes, terminator: bytes = SEGMENT_TERMINATOR) -> Iterator[bytes]:
+    """
+    Yield raw segments from X12 content.
+
+    Line breaks are removed and surrounding whitespace is stripped; empty
+    segments (e.g. after the final terminator) are skipped.
+
+    Args:
+        buf: Raw X12 content as bytes
+        terminator: Segment terminator byte (default: ~)
+
+    Yields:
+        Segment bytes without the terminator
+    """
+    if b"\n" in buf:
+        buf = buf.translate(None, b"\n")
+
+    for raw in buf.split(terminator):
+        segment = raw.strip()
+        if segment:
+            yield segment
+
+
+def iter_file_segments(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+    """
+    Yield raw segments from an X12 file, reading it in chunks.
+
+    Unlike iter_segments, the file is never held in memory as a whole: each
+    chunk is split on the terminator and only the trailing partial segment
+    is carried into the next read, so memory stays O(chunk_size). The
+    terminator is sniffed from the ISA header in the first chunk.
+
+    Args:
+        path: Path to the X12 file
+        chunk_size: Number of bytes read per chunk (default: 1 MiB)
+
+    Yields:
+        Segment bytes without the terminator, as from iter_segments
+    """
+    with open(path, "rb") as f:
+        chunk = f.read(max(chunk_size, ISA_LENGTH))
+        _, terminator = sniff_delimiters(chunk)
+        residual = b""
+
+        while chunk:
+            if b"\n" in chunk:
+                chunk = chunk.translate(None, b"\n")
+            parts = (residual + chunk).split(terminator)
+            residual = parts.pop()
+            for raw in parts:
+                segment = raw.strip()
+                if segment:
+                    yield segment
+            chunk = f.read(chunk_size)
+
+    residual = residual.strip()
+    if residual:
+        yield residual
+
+
+def find_segment(
+    buf: bytes,
+    seg_id: bytes,
+    terminator: bytes = SEGMENT_TERMINATOR,
+    separator: bytes = ELEMENT_SEPARATOR,
+    complete: bool = False,
+) -> Optional[bytes]:
+    """
+    Return the first segment with the given identifier.
+
+    Scans with ``bytes.find`` and stops at the first match, so the rest of
+    the document is never split or copied. A match only counts when it
+    starts a segment (at the beginning of buf or after a terminator,
+    ignoring whitespace), so e.g. b"ST" does not match inside element data.
+
+    Args:
+        buf: Raw X12 content as bytes
+        seg_id: Segment identifier to look for (e.g. b"ST")
+        terminator: Segment terminator byte (default: ~)
+        separator: Element separator byte (default: *)
+        complete: Require the segment's terminator. Set this when buf is a
+            prefix of the document, so a segment cut off by the end of the
+            prefix is reported as not found instead of returned truncated.
+
+    Returns:
+        Segment bytes without the terminator, or None if not found
+    """
+    needle = seg_id + separator
+    idx = buf.find(needle)
+    while idx != -1:
+        boundary = buf.rfind(terminator, 0, idx) + 1
+        if not buf[boundary:idx].strip():
+            end = buf.find(terminator, idx)
+            if end == -1:
+                return None if complete else buf[idx:]
+            return buf[idx:end]
+        idx = buf.find(needle, idx + 1)
+    return None
+
+
+def segment_id(segment: bytes) -> bytes:
+    """
+    Return the segment identifier (e.g. b"NM1") of a raw segment.
+
+    Args:
+        segment: Raw segment bytes
+
+    Returns:
+        Segment identifier bytes
+    """
+    return segment.partition(ELEMENT_SEPARATOR)[0]
+
+
+def split_elements(segment: bytes, separator: bytes = ELEMENT_SEPARATOR) -> List[str]:
+    """
+    Decode a raw segment and split it into elements.
+
+    The segment is decoded once as a whole and the string is split, rather
+    than decoding each element; the default separator is not re-decoded.
+
+    Args:
+        segment: Raw segment bytes
+        separator: Element separator byte (default: *)
+
+    Returns:
+        List of element strings, segment identifier first
+    """
+    if separator != ELEMENT_SEPARATOR:
+        return decode_segment(segment).split(separator.decode("ascii"))
+    return decode_segment(segment).split(_ELEMENT_SEPARATOR_STR)
+
+
+def decode_segment(segment: bytes) -> str:
+    """
+    Decode a raw segment to a string.
+
+    Args:
+        segment: Raw segment bytes
+
+    Returns:
+        Decoded segment
+    """
+    return segment.decode("utf-8")
@@ -8,15 +8,26 @@ from .base_parser import BaseX12Parser
 
 logger = get_logger(__name__)
 
+# Key path of the ST control number in a transaction header model
+_CONTROL_NUMBER_PATH = ("st_segment", "transaction_set_control_number")
+
 
 class X12_277_Parser(BaseX12Parser):
     """Parser for X12 277 Claims Status (005010X212) transactions."""
 
-    def __init__(self):
-        """Initialize 277 parser."""
+    def __init__(self, keep_raw: bool = False):
+        """
+        Initialize 277 parser.
+
+        Args:
+            keep_raw: Include the full LinuxForHealth model of each transaction
+                as "raw_data". Off by default, so the model can be collected
+                as soon as its fields are extracted.
+        """
         super().__init__()
         self.transaction_type = "277"
         self.version = "005010X212"
+        self.keep_raw = keep_raw
 
     def parse(self, x12_content: str) -> Dict[str, Any]:
         """
@@ -26,7 +37,7 @@ class X12_277_Parser(BaseX12Parser):
             x12_content: Raw X12 277 EDI content
 
         Returns:
-            Parsed 277 data structure
+            Parsed 277 data structure (including the _summary response fields)
 
         Raises:
             X12ParseError: If parsing fails
@@ -47,6 +58,7 @@ class X12_277_Parser(BaseX12Parser):
                 transaction = self._extract_277_data(model)
                 result["transactions"].append(transaction)
 
+            self.attach_summary(result)
             logger.info(f"Successfully parsed {len(models)} 277 transaction(s)")
             return result
 
@@ -62,35 +74,26 @@ class X12_277_Parser(BaseX12Parser):
             model: Parsed X12 model dictionary
 
         Returns:
-            Structured 277 data
+            Structured 277 data, with the model itself as "raw_data" if keep_raw
         """
         header = model.get("header", {})
 
-        return {
-            "control_number": self._safe_get(header, "st_segment.transaction_set_control_number"),
+        data = {
+            "control_number": self._safe_get(header, _CONTROL_NUMBER_PATH),
             "information_source": self._extract_information_source(model),
             "information_receiver": self._extract_information_receiver(model),
             "service_providers": self._extract_service_providers(model),
             "claim_status": self._extract_claim_status(model),
-            "raw_data": model,
         }
+        if self.keep_raw:
+            data["raw_data"] = model
+        return data
 
     def _extract_information_source(self, model: Dict[str, Any]) -> Dict[str, str]:
         """Extract information source (payer) details."""
-        # Navigate to Loop 2000A (Information Source)
-        loop_2000a = model.get("loop_2000a", [])
-
-        # Handle both list and dict structures
-        if isinstance(loop_2000a, list) and loop_2000a:
-            loop_2000a = loop_2000a[0]
-
-        if isinstance(loop_2000a, dict):
-            loop_2100a = loop_2000a.get("loop_2100a", {})
-            if isinstance(loop_2100a, list) and loop_2100a:
-                loop_2100a = loop_2100a[0]
-            nm1_segment = loop_2100a.get("nm1_segment", {}) if isinstance(loop_2100a, dict) else {}
-        else:
-            nm1_segment = {}
+        # Navigate to Loop 2000A (Information Source); loops may be a dict or a list
+        loop_2100a = self._first(self._first(model.get("loop_2000a")).get("loop_2100a"))
+        nm1_segment = loop_2100a.get("nm1_segment", {})
 
         return {
             "name": nm1_segment.get("name_last_or_organization_name", ""),
@@ -100,19 +103,9 @@ class X12_277_Parser(BaseX12Parser):
 
     def _extract_information_receiver(self, model: Dict[str, Any]) -> Dict[str, str]:
         """Extract information receiver (provider) details."""
-        loop_2000b = model.get("loop_2000b", [])
-
-        # Handle both list and dict structures
-        if isinstance(loop_2000b, list) and loop_2000b:
-            loop_2000b = loop_2000b[0]
-
-        if isinstance(loop_2000b, dict):
-            loop_2100b = loop_2000b.get("loop_2100b", {})
-            if isinstance(loop_2100b, list) and loop_2100b:
-                loop_2100b = loop_2100b[0]
-            nm1_segment = loop_2100b.get("nm1_segment", {}) if isinstance(loop_2100b, dict) else {}
-        else:
-            nm1_segment = {}
+        # Loops may be a dict or a list
+        loop_2100b = self._first(self._first(model.get("loop_2000b")).get("loop_2100b"))
+        nm1_segment = loop_2100b.get("nm1_segment", {})
 
         return {
             "name": nm1_segment.get("name_last_or_organization_name", ""),
@@ -123,17 +116,8 @@ class X12_277_Parser(BaseX12Parser):
     def _extract_service_providers(self, model: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract service provider information."""
         providers = []
-        loop_2000c = model.get("loop_2000c", [])
-
-        if isinstance(loop_2000c, dict):
-            loop_2000c = [loop_2000c]
-
-        for provider in loop_2000c:
-            loop_2100c = provider.get("loop_2100c", {})
-            if isinstance(loop_2100c, list) and loop_2100c:
-                loop_2100c = loop_2100c[0]
-
-            nm1_segment = loop_2100c.get("nm1_segment", {}) if isinstance(loop_2100c, dict) else {}
+        for provider in self._as_list(model.get("loop_2000c")):
+            nm1_segment = self._first(provider.get("loop_2100c")).get("nm1_segment", {})
 
             providers.append(
                 {
@@ -148,17 +132,9 @@ class X12_277_Parser(BaseX12Parser):
     def _extract_claims(self, provider_loop: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract claim status information."""
         claims = []
-        loop_2200c = provider_loop.get("loop_2200c", [])
-
-        if isinstance(loop_2200c, dict):
-            loop_2200c = [loop_2200c]
-
-        for claim in loop_2200c:
+        for claim in self._as_list(provider_loop.get("loop_2200c")):
             trn_segment = claim.get("loop_2200c", {}).get("trn_segment", {})
-            stc_segments = claim.get("stc_segment", [])
-
-            if isinstance(stc_segments, dict):
-                stc_segments = [stc_segments]
+            stc_segments = self._as_list(claim.get("stc_segment"))
 
             claims.append(
                 {
@@ -209,15 +185,3 @@ class X12_277_Parser(BaseX12Parser):
                 errors.append(f"Transaction {idx}: Missing information source")
 
         return errors
-
-    @staticmethod
-    def _safe_get(dictionary: Dict, key_path: str, default: Any = "") -> Any:
-        """Safely get nested dictionary value using dot notation."""
-        keys = key_path.split(".")
-        value = dictionary
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key, default)
-            else:
-                return default
-        return value if value is not None else default
@@ -6,9 +6,22 @@ rejected BEFORE adjudication due to formatting errors, invalid IDs, etc.
 This is CRITICAL for revenue cycle management because rejected claims will NEVER
 appear in the 835 remittance. Cross-referencing 277CA rejections with 835 payments
 identifies the "black hole" of unsubmitted claims.
+
+Parsing is a single pass: a compiled regex yields segments in place, only the
+segments parse() reads are split into elements, a dict dispatches them by ID,
+and each claim is collected in a slots dataclass until it is emitted. Parser
+generators (PLY, Lark, pyparsing) and JIT-compiled byte scanners were
+considered; the former add per-token Python overhead, and the latter would
+add numpy/llvmlite to the Lambda package for little gain over C-level
+str methods (see src.parsers.tokenizer).
 """
 
-from typing import Any, Dict, List
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from operator import attrgetter
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
 from ..core.exceptions import X12ParseError
 from ..core.logging_config import get_logger
@@ -16,6 +29,59 @@ from .base_parser import BaseX12Parser
 
 logger = get_logger(__name__)
 
+# Runs of non-terminator characters, i.e. raw segments before stripping
+_SEGMENT_RE = re.compile(r"[^~]+")
+
+
+@dataclass(slots=True)
+class ClaimAcknowledgment:
+    """
+    Claim-level (HL 22) data collected while parsing a 277CA.
+
+    Stored with __slots__ instead of a per-claim dict while segments are
+    processed; converted with to_dict() when the claim is complete, so the
+    parse() output keeps its dict records.
+
+    Attributes:
+        claim_id: Patient account number (REF D9)
+        patient_id: Patient identifier (NM1 IL, or REF EA)
+        patient_name: Patient name as "FIRST LAST"
+        date_of_service: Service period (DTP 472)
+        billed_amount: Total claim charge amount (STC04)
+        status_category: Claim status category code, e.g. A7 (STC01-1)
+        status_code: Claim status code (STC01-2)
+        rejection_reason: Rejection message text (MSG)
+        provider_npi: Provider NPI (NM1 1P)
+        payer_claim_control_number: Payer claim control number
+        trace_number: Claim trace number (TRN)
+    """
+
+    claim_id: Optional[str] = None
+    patient_id: Optional[str] = None
+    patient_name: Optional[str] = None
+    date_of_service: Optional[str] = None
+    billed_amount: Optional[float] = None
+    status_category: Optional[str] = None
+    status_code: Optional[str] = None
+    rejection_reason: Optional[str] = None
+    provider_npi: Optional[str] = None
+    payer_claim_control_number: Optional[str] = None
+    trace_number: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the claim as a dict keyed by field name, in field order."""
+        return dict(zip(_ACK_FIELD_NAMES, _ack_values(self)))
+
+
+# Claim status categories (STC01-1) counted as rejections and acceptances
+REJECTED_CATEGORIES = frozenset({"A7", "A3"})  # Invalid information, returned unprocessable
+ACCEPTED_CATEGORIES = frozenset({"A1", "A2"})  # Acknowledged, accepted into adjudication
+
+# Record keys for ClaimAcknowledgment.to_dict(). Field names are identifiers,
+# which CPython interns, so every claim dict shares one key object per name
+_ACK_FIELD_NAMES = tuple(field.name for field in fields(ClaimAcknowledgment))
+_ack_values = attrgetter(*_ACK_FIELD_NAMES)
+
 
 class X12_277CA_Parser(BaseX12Parser):
     """
@@ -27,8 +93,13 @@ class X12_277CA_Parser(BaseX12Parser):
 
     Key Status Codes:
     - Category A7: Rejected at gateway (most critical for revenue tracking)
+    - Category A3: Returned as unprocessable claim
     - Category A1: Accepted for processing
+    - Category A2: Accepted into the adjudication system
     - Category A6: Rejected - resubmission allowed
+
+    Rejections and acceptances are the categories in REJECTED_CATEGORIES and
+    ACCEPTED_CATEGORIES.
     """
 
     def __init__(self):
@@ -52,14 +123,30 @@ class X12_277CA_Parser(BaseX12Parser):
             Parsed 277CA data structure with rejection/acceptance status
 
         Raises:
-            X12ParseError: If parsing fails
+            X12ParseError: If parsing fails, or the ST segment identifies a
+                transaction other than 277CA (a 277 ST without a version is
+                accepted)
         """
+        # Reject other transactions (e.g. 277CS, 835) from their ST segment
+        # before tokenizing the whole document; content without an ST segment
+        # (e.g. claim-level fragments), or a 277 ST without ST03, is parsed as is
+        info = self.get_transaction_info(x12_content)
+        code, version = info["transaction_code"], info["version"]
+        if code != "unknown" and (
+            code != "277" or (version != "unknown" and "X214" not in version)
+        ):
+            raise X12ParseError(
+                "Not a 277CA document: ST {code} {version}", code=code, version=version
+            )
+
         try:
             logger.info("Parsing X12 277CA Claim Acknowledgment document (manual parsing)")
 
             # Manual segment parsing for 277CA
             # LinuxForHealth doesn't support 005010X214, so we parse segments directly
-            segments = self._parse_segments(x12_content)
+            # (single pass, so segments are consumed as they are produced)
+            # Only HL and claim-level segments are split into elements
+            segments = self._iter_segments(x12_content, self._PARSED_SEGMENTS)
 
             # Extract key information
             result = {
@@ -72,11 +159,9 @@ class X12_277CA_Parser(BaseX12Parser):
 
             # Process segments hierarchically
             current_transaction = None
+            handlers = self._SEGMENT_HANDLERS
 
-            for segment in segments:
-                segment_id = segment["id"]
-                elements = segment["elements"]
-
+            for segment_id, elements in segments:
                 # HL segments define hierarchy
                 # Level 22 (Information Source Detail) = individual claim
                 if segment_id == "HL" and len(elements) >= 3:
@@ -85,36 +170,21 @@ class X12_277CA_Parser(BaseX12Parser):
 
                     if level_code == "22":  # Information Source Detail = Claim level
                         # Save previous transaction
-                        if current_transaction and current_transaction.get("trace_number"):
-                            result["acknowledgments"].append(current_transaction)
+                        if current_transaction is not None:
+                            self._finalize_claim(current_transaction, result)
                         # Start new transaction
                         current_transaction = self._init_transaction()
 
-                # Process segment data into current transaction
-                if current_transaction:
-                    if segment_id == "NM1":
-                        self._process_nm1(segment, current_transaction)
-                    elif segment_id == "TRN":
-                        self._process_trn(segment, current_transaction)
-                    elif segment_id == "STC":
-                        self._process_stc(segment, current_transaction)
-                    elif segment_id == "REF":
-                        self._process_ref(segment, current_transaction)
-                    elif segment_id == "DTP":
-                        self._process_dtp(segment, current_transaction)
-                    elif segment_id == "MSG":
-                        self._process_msg(segment, current_transaction)
+                # Process segment data into current transaction; one dict
+                # lookup dispatches the segment (most IDs have no handler)
+                if current_transaction is not None:
+                    handler = handlers.get(segment_id)
+                    if handler is not None:
+                        handler(self, elements, current_transaction)
 
             # Add last transaction
-            if current_transaction and current_transaction.get("trace_number"):
-                result["acknowledgments"].append(current_transaction)
-
-            # Categorize by status for easy revenue tracking
-            for ack in result["acknowledgments"]:
-                if ack.get("status_category") == "A7":  # Rejected
-                    result["rejections"].append(ack)
-                elif ack.get("status_category") == "A1":  # Accepted
-                    result["acceptances"].append(ack)
+            if current_transaction is not None:
+                self._finalize_claim(current_transaction, result)
 
             # Add summary statistics for monitoring
             result["summary"] = {
@@ -128,6 +198,8 @@ class X12_277CA_Parser(BaseX12Parser):
                 ),
             }
 
+            self.attach_summary(result)
+
             logger.info(
                 f"Parsed 277CA with {result['summary']['total_claims']} claims, "
                 f"{result['summary']['rejected_count']} rejections"
@@ -139,6 +211,33 @@ class X12_277CA_Parser(BaseX12Parser):
             logger.error(f"Failed to parse 277CA: {str(e)}")
             raise X12ParseError(f"277CA parsing failed: {str(e)}") from e
 
+    @classmethod
+    def parse_batch(
+        cls, paths: Iterable[str], max_workers: Optional[int] = None, chunksize: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Parse many 277CA files in parallel worker processes.
+
+        Files are independent and parsing is CPU-bound Python, so worker
+        processes scale with cores where threads would contend for the GIL.
+        Meant for bulk jobs such as parsing a directory of files; not for
+        Lambda, which lacks the /dev/shm that process pools require.
+
+        Args:
+            paths: Paths of the 277CA files to parse
+            max_workers: Number of worker processes (default: CPU count)
+            chunksize: Paths handed to a worker at a time
+
+        Returns:
+            Parse results in the order of paths
+
+        Raises:
+            X12ParseError: If any file fails to parse
+            OSError: If any file cannot be read
+        """
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(_parse_file, paths, chunksize=chunksize))
+
     def _extract_transaction_data(self, model: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract relevant data from a 277CA transaction model.
@@ -221,98 +320,139 @@ class X12_277CA_Parser(BaseX12Parser):
 
         return transaction
 
-    def _parse_segments(self, x12_content: str) -> List[Dict[str, Any]]:
+    def _iter_segments(
+        self, x12_content: str, segment_ids: Optional[FrozenSet[str]] = None
+    ) -> Iterator[Tuple[str, List[str]]]:
         """
-        Parse X12 content into segments.
+        Lazily parse X12 content into segments.
+
+        Segments are produced one at a time, so callers that stop early (or
+        make a single pass) never hold the full segment list, and as plain
+        tuples rather than per-segment dicts.
+        Segment identifiers are interned, so the dispatch comparisons against
+        literal IDs ("HL", "NM1", ...) succeed on identity.
+
+        Segments are matched in place with a compiled regex instead of copying
+        the document to drop line breaks and splitting it into a list of every
+        segment; line breaks are removed per segment, and only when present.
+        With segment_ids, other segments are skipped after reading their ID,
+        so they are never split into elements.
 
         Args:
             x12_content: Raw X12 content
+            segment_ids: Segment IDs to yield (default: all segments)
 
-        Returns:
-            List of segment dictionaries
+        Yields:
+            (segment ID, elements) tuples; elements exclude the segment ID
         """
-        segments = []
-        lines = x12_content.replace("\n", "").split("~")
-
-        for line in lines:
-            line = line.strip()
+        for match in _SEGMENT_RE.finditer(x12_content):
+            line = match.group().strip()
             if not line:
                 continue
+            if "\n" in line:
+                line = line.replace("\n", "")
+            if segment_ids is not None:
+                end = line.find("*")
+                if (line if end == -1 else line[:end]) not in segment_ids:
+                    continue
 
             elements = line.split("*")
-            if elements:
-                segments.append(
-                    {"id": elements[0], "elements": elements[1:] if len(elements) > 1 else []}
-                )
+            yield sys.intern(elements[0]), elements[1:]
 
-        return segments
+    def _parse_segments(self, x12_content: str) -> List[Tuple[str, List[str]]]:
+        """
+        Parse X12 content into segments.
 
-    def _init_transaction(self) -> Dict[str, Any]:
-        """Initialize empty transaction dictionary."""
-        return {
-            "claim_id": None,
-            "patient_id": None,
-            "patient_name": None,
-            "date_of_service": None,
-            "billed_amount": None,
-            "status_category": None,
-            "status_code": None,
-            "rejection_reason": None,
-            "provider_npi": None,
-            "payer_claim_control_number": None,
-            "trace_number": None,
-        }
+        Args:
+            x12_content: Raw X12 content
 
-    def _process_nm1(self, segment: Dict[str, Any], transaction: Dict[str, Any]) -> None:
+        Returns:
+            List of (segment ID, elements) tuples
+        """
+        return list(self._iter_segments(x12_content))
+
+    def _finalize_claim(self, claim: ClaimAcknowledgment, result: Dict[str, Any]) -> None:
+        """
+        Add a completed claim to the result.
+
+        Claims without a trace number are dropped. The claim is categorized by
+        status as it is added, for easy revenue tracking, rather than in a
+        second pass over all acknowledgments.
+
+        Args:
+            claim: Completed claim acknowledgment
+            result: parse() result with acknowledgments/rejections/acceptances lists
+        """
+        if not claim.trace_number:
+            return
+
+        record = claim.to_dict()
+        result["acknowledgments"].append(record)
+        if claim.status_category in REJECTED_CATEGORIES:
+            result["rejections"].append(record)
+        elif claim.status_category in ACCEPTED_CATEGORIES:
+            result["acceptances"].append(record)
+
+    def _init_transaction(self) -> ClaimAcknowledgment:
+        """Initialize an empty claim acknowledgment."""
+        return ClaimAcknowledgment()
+
+    def _nm1_patient(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
+        """Fill patient name and ID from an NM1*IL (Insured/Patient) segment."""
+        count = len(elements)
+        if count >= 3:
+            transaction.patient_name = f"{elements[2]} {elements[1]}"
+            if count >= 9:
+                transaction.patient_id = elements[8]
+
+    def _nm1_provider(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
+        """Fill provider NPI from an NM1*1P (Provider) segment."""
+        if len(elements) >= 9:
+            transaction.provider_npi = elements[8]
+
+    # NM1 handlers by entity identifier code (NM101)
+    _NM1_HANDLERS = {"IL": _nm1_patient, "1P": _nm1_provider}
+
+    def _process_nm1(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
         """Process NM1 (Name) segment."""
-        elements = segment["elements"]
         if len(elements) < 2:
             return
 
-        entity_code = elements[0]  # Entity identifier code
-
-        if entity_code == "IL":  # Insured/Patient
-            if len(elements) >= 3:
-                transaction["patient_name"] = (
-                    f"{elements[2]} {elements[1]}" if len(elements) >= 3 else elements[1]
-                )
-            if len(elements) >= 9:
-                transaction["patient_id"] = elements[8]
-        elif entity_code == "1P":  # Provider
-            if len(elements) >= 9:
-                transaction["provider_npi"] = elements[8]
+        handler = self._NM1_HANDLERS.get(elements[0])  # Entity identifier code
+        if handler is not None:
+            handler(self, elements, transaction)
 
-    def _process_trn(self, segment: Dict[str, Any], transaction: Dict[str, Any]) -> None:
+    def _process_trn(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
         """Process TRN (Trace Number) segment."""
-        elements = segment["elements"]
         if len(elements) >= 2:
-            transaction["trace_number"] = elements[1]
+            transaction.trace_number = elements[1]
 
-    def _process_stc(self, segment: Dict[str, Any], transaction: Dict[str, Any]) -> None:
+    def _process_stc(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
         """Process STC (Status Information) segment - THE CRITICAL SEGMENT."""
-        elements = segment["elements"]
         if len(elements) < 1:
             return
 
         # First element is Status Information composite
         # Format: CATEGORY:CODE (e.g., "A7:42" = Rejected, reason 42)
-        status_info = elements[0]
-        if ":" in status_info:
-            parts = status_info.split(":")
-            transaction["status_category"] = parts[0]
-            transaction["status_code"] = parts[1] if len(parts) > 1 else None
+        # Both come from small code lists and are repeated on every claim, so
+        # they are interned to share one string object across the result.
+        # partition() avoids building a list per claim; the code ends at an
+        # optional third (entity) component
+        category, separator, rest = elements[0].partition(":")
+        if separator:
+            transaction.status_category = sys.intern(category)
+            transaction.status_code = sys.intern(rest.partition(":")[0])
 
         # STC segment format: STC*Status*Date*ActionCode*TotalClaimChargeAmount
         # Element 4 (index 3) = Total Claim Charge Amount (not index 2!)
         if len(elements) >= 4 and elements[3]:
             try:
-                transaction["billed_amount"] = float(elements[3])
+                transaction.billed_amount = float(elements[3])
             except (ValueError, TypeError):
                 pass
 
-    def _process_ref(self, segment: Dict[str, Any], transaction: Dict[str, Any]) -> None:
+    def _process_ref(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
         """Process REF (Reference) segment."""
-        elements = segment["elements"]
         if len(elements) < 2:
             return
 
@@ -320,27 +460,38 @@ class X12_277CA_Parser(BaseX12Parser):
         ref_value = elements[1]
 
         if ref_qualifier == "D9":  # Patient Account Number / Claim ID
-            transaction["claim_id"] = ref_value
+            transaction.claim_id = ref_value
         elif ref_qualifier == "EA":  # Member ID (alternative patient identifier)
-            if not transaction.get("patient_id"):
-                transaction["patient_id"] = ref_value
+            if not transaction.patient_id:
+                transaction.patient_id = ref_value
 
-    def _process_dtp(self, segment: Dict[str, Any], transaction: Dict[str, Any]) -> None:
+    def _process_dtp(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
         """Process DTP (Date/Time Period) segment."""
-        elements = segment["elements"]
         if len(elements) < 3:
             return
 
         date_qualifier = elements[0]
         if date_qualifier == "472":  # Service Period
-            transaction["date_of_service"] = elements[2]
+            transaction.date_of_service = elements[2]
 
-    def _process_msg(self, segment: Dict[str, Any], transaction: Dict[str, Any]) -> None:
+    def _process_msg(self, elements: List[str], transaction: ClaimAcknowledgment) -> None:
         """Process MSG (Message Text) segment - contains rejection reason text."""
-        elements = segment["elements"]
         if elements:
             # MSG contains human-readable rejection reason
-            transaction["rejection_reason"] = elements[0]
+            transaction.rejection_reason = elements[0]
+
+    # Claim-level segment handlers by segment ID, called as handler(self, ...)
+    _SEGMENT_HANDLERS = {
+        "NM1": _process_nm1,
+        "TRN": _process_trn,
+        "STC": _process_stc,
+        "REF": _process_ref,
+        "DTP": _process_dtp,
+        "MSG": _process_msg,
+    }
+
+    # Segments parse() reads: HL for the claim hierarchy plus the handlers above
+    _PARSED_SEGMENTS = frozenset(_SEGMENT_HANDLERS).union({"HL"})
 
     def _format_name(self, nm1_segment: Dict[str, Any]) -> str:
         """
@@ -385,9 +536,17 @@ class X12_277CA_Parser(BaseX12Parser):
                 )
 
             # Rejections must have a reason
-            if ack.get("status_category") == "A7" and not ack.get("rejection_reason"):
+            rejected = ack.get("status_category") in REJECTED_CATEGORIES
+            if rejected and not ack.get("rejection_reason"):
                 errors.append(
                     f"Rejection for patient {ack.get('patient_id')} " "missing rejection reason"
                 )
 
         return errors
+
+
+def _parse_file(path: str) -> Dict[str, Any]:
+    """Read and parse one 277CA file; parse_batch worker entry point."""
+    with open(path, encoding="utf-8") as f:
+        content = f.read()
+    return X12_277CA_Parser().parse(content)
@@ -1,6 +1,19 @@
-"""X12 835 Payment/Remittance parser implementation."""
+"""X12 835 Payment/Remittance parser implementation.
 
-from typing import Any, Dict, List
+One extractor serves every 835 flavor (e.g. Medicare Part A and managed
+care). Optional loops and segments a flavor leaves out are absent from the
+model, so they cost a single .get() and an empty _as_list() result rather
+than a per-flavor code path; segment data that is present is always
+extracted, whatever the envelope says.
+
+Claims are kept as one dict per claim rather than column-wise lists (one
+list per field). validate() only checks transaction-level fields and never
+iterates claims, so a columnar view would speed nothing up; handlers,
+output JSON and reconciliation all consume per-claim dicts, so the rows
+would have to be rebuilt for them anyway. numpy is not a dependency.
+"""
+
+from typing import Any, Dict, List, Tuple
 
 
 from ..core.exceptions import X12ParseError
@@ -9,15 +22,115 @@ from .base_parser import BaseX12Parser
 
 logger = get_logger(__name__)
 
+# Output field, source segment field and default for each mapped segment;
+# extraction iterates these tables instead of spelling out one .get() per field.
+# Source names are identifier literals, which CPython interns, and model keys
+# are pydantic attribute names (also interned), so lookups match by identity.
+# Defaults are constants held by the tables, so a missing field returns the
+# same shared 0.0/"" object rather than allocating one per lookup.
+_BPR_FIELDS = (
+    ("transaction_handling_code", "transaction_handling_code", ""),
+    ("total_actual_provider_payment", "monetary_amount", 0.0),
+    ("credit_debit_flag", "credit_debit_flag_code", ""),
+    ("payment_method", "payment_method_code", ""),
+    ("payment_format", "payment_format_code", ""),
+    ("check_or_eft_number", "originating_company_supplemental_code", ""),
+    ("payment_date", "effective_date", ""),
+)
+_NM1_FIELDS = (
+    ("name", "name_last_or_organization_name", ""),
+    ("identifier", "identification_code", ""),
+    ("identifier_type", "identification_code_qualifier", ""),
+)
+_N3_FIELDS = (("street", "address_information", ""),)
+_N4_FIELDS = (
+    ("city", "city_name", ""),
+    ("state", "state_or_province_code", ""),
+    ("zip", "postal_code", ""),
+)
+_CLP_FIELDS = (
+    ("claim_identifier", "claim_submitters_identifier", ""),
+    ("status_code", "claim_status_code", ""),
+    ("total_charge", "total_claim_charge_amount", 0.0),
+    ("payment_amount", "claim_payment_amount", 0.0),
+    ("patient_responsibility", "patient_responsibility_amount", 0.0),
+    ("payer_claim_control_number", "payer_claim_control_number", ""),
+)
+_SVC_FIELDS = (
+    ("line_item_charge", "line_item_charge_amount", 0.0),
+    ("line_item_payment", "line_item_provider_payment_amount", 0.0),
+    ("units", "units_of_service_paid_count", 0.0),
+)
+_CAS_FIELDS = (
+    ("group_code", "claim_adjustment_group_code", ""),
+    ("reason_code", "adjustment_reason_code", ""),
+    ("amount", "monetary_amount", 0.0),
+)
+
+# Required transaction fields checked by validate(), as (_safe_get key path,
+# error message) in reporting order
+_REQUIRED_FIELDS = (
+    (("control_number",), "Missing control number"),
+    (("financial_information", "total_actual_provider_payment"), "Missing payment amount"),
+    (("payer", "name"), "Missing payer information"),
+    (("payee", "name"), "Missing payee information"),
+)
+
+
+def _nested_get(container: Dict[str, Any], segment_key: str, field: str) -> Any:
+    """
+    Read one field of a nested segment, or "" if either level is missing.
+
+    A specialized form of BaseX12Parser._safe_get for the fixed two-level
+    lookups in this parser, without the generic key-path loop.
+
+    Args:
+        container: Dictionary holding the segment
+        segment_key: Key of the segment dict
+        field: Field to read from the segment
+
+    Returns:
+        The field value, or "" if absent or None
+    """
+    segment = container.get(segment_key)
+    if type(segment) is not dict:
+        return ""
+    value = segment.get(field)
+    return "" if value is None else value
+
+
+def _map_fields(
+    segment: Dict[str, Any], fields: Tuple[Tuple[str, str, Any], ...]
+) -> Dict[str, Any]:
+    """
+    Map a segment dict onto output fields using a field table.
+
+    Args:
+        segment: Segment dictionary from the parsed model
+        fields: (output field, segment field, default) tuples
+
+    Returns:
+        Dictionary of output fields in table order
+    """
+    return {name: segment.get(source, default) for name, source, default in fields}
+
 
 class X12_835_Parser(BaseX12Parser):
     """Parser for X12 835 Payment/Remittance (005010X221A1) transactions."""
 
-    def __init__(self):
-        """Initialize 835 parser."""
+    def __init__(self, keep_raw: bool = False):
+        """
+        Initialize 835 parser.
+
+        Args:
+            keep_raw: Include the full LinuxForHealth model of each transaction
+                as "raw_data". Off by default, so the model can be collected
+                as soon as its fields are extracted.
+        """
         super().__init__()
         self.transaction_type = "835"
         self.version = "005010X221A1"
+        self.keep_raw = keep_raw
 
     def parse(self, x12_content: str) -> Dict[str, Any]:
         """
@@ -27,7 +140,7 @@ class X12_835_Parser(BaseX12Parser):
             x12_content: Raw X12 835 EDI content
 
         Returns:
-            Parsed 835 data structure
+            Parsed 835 data structure (including the _summary response fields)
 
         Raises:
             X12ParseError: If parsing fails
@@ -48,6 +161,7 @@ class X12_835_Parser(BaseX12Parser):
                 transaction = self._extract_835_data(model)
                 result["transactions"].append(transaction)
 
+            self.attach_summary(result)
             logger.info(f"Successfully parsed {len(models)} 835 transaction(s)")
             return result
 
@@ -63,180 +177,110 @@ class X12_835_Parser(BaseX12Parser):
             model: Parsed X12 model dictionary
 
         Returns:
-            Structured 835 data
+            Structured 835 data, with the model itself as "raw_data" if keep_raw
         """
         header = model.get("header", {})
+        claims = self._extract_claim_payments(model)
 
-        return {
-            "control_number": self._safe_get(header, "st_segment.transaction_set_control_number"),
+        data = {
+            "control_number": _nested_get(header, "st_segment", "transaction_set_control_number"),
             "financial_information": self._extract_financial_info(model),
             "payer": self._extract_payer_info(model),
             "payee": self._extract_payee_info(model),
-            "claims": self._extract_claim_payments(model),
-            "summary": self._extract_payment_summary(model),
-            "raw_data": model,
+            "claims": claims,
+            "summary": self._extract_payment_summary(model, claims),
         }
+        if self.keep_raw:
+            data["raw_data"] = model
+        return data
 
     def _extract_financial_info(self, model: Dict[str, Any]) -> Dict[str, Any]:
         """Extract financial information from BPR segment."""
         header = model.get("header", {})
-        bpr_segment = header.get("bpr_segment", {})
-
-        return {
-            "transaction_handling_code": bpr_segment.get("transaction_handling_code", ""),
-            "total_actual_provider_payment": bpr_segment.get("monetary_amount", 0.0),
-            "credit_debit_flag": bpr_segment.get("credit_debit_flag_code", ""),
-            "payment_method": bpr_segment.get("payment_method_code", ""),
-            "payment_format": bpr_segment.get("payment_format_code", ""),
-            "check_or_eft_number": bpr_segment.get("originating_company_supplemental_code", ""),
-            "payment_date": bpr_segment.get("effective_date", ""),
-        }
+        return _map_fields(header.get("bpr_segment", {}), _BPR_FIELDS)
 
     def _extract_payer_info(self, model: Dict[str, Any]) -> Dict[str, str]:
         """Extract payer identification information."""
         loop_1000a = model.get("loop_1000a", {})
-        nm1_segment = loop_1000a.get("nm1_segment", {})
-
-        return {
-            "name": nm1_segment.get("name_last_or_organization_name", ""),
-            "identifier": nm1_segment.get("identification_code", ""),
-            "identifier_type": nm1_segment.get("identification_code_qualifier", ""),
-            "address": self._extract_address(loop_1000a),
-        }
+        payer = _map_fields(loop_1000a.get("nm1_segment", {}), _NM1_FIELDS)
+        payer["address"] = self._extract_address(loop_1000a)
+        return payer
 
     def _extract_payee_info(self, model: Dict[str, Any]) -> Dict[str, str]:
         """Extract payee identification information."""
         loop_1000b = model.get("loop_1000b", {})
-        nm1_segment = loop_1000b.get("nm1_segment", {})
-
-        return {
-            "name": nm1_segment.get("name_last_or_organization_name", ""),
-            "identifier": nm1_segment.get("identification_code", ""),
-            "identifier_type": nm1_segment.get("identification_code_qualifier", ""),
-            "address": self._extract_address(loop_1000b),
-        }
+        payee = _map_fields(loop_1000b.get("nm1_segment", {}), _NM1_FIELDS)
+        payee["address"] = self._extract_address(loop_1000b)
+        return payee
 
     def _extract_address(self, loop: Dict[str, Any]) -> Dict[str, str]:
         """Extract address information from N3 and N4 segments."""
-        n3_segment = loop.get("n3_segment", {})
-        n4_segment = loop.get("n4_segment", {})
-
-        return {
-            "street": n3_segment.get("address_information", ""),
-            "city": n4_segment.get("city_name", ""),
-            "state": n4_segment.get("state_or_province_code", ""),
-            "zip": n4_segment.get("postal_code", ""),
-        }
+        address = _map_fields(loop.get("n3_segment", {}), _N3_FIELDS)
+        address.update(_map_fields(loop.get("n4_segment", {}), _N4_FIELDS))
+        return address
 
     def _extract_claim_payments(self, model: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Extract claim payment information."""
-        claims = []
-        loop_2000 = model.get("loop_2000", [])
-
-        if isinstance(loop_2000, dict):
-            loop_2000 = [loop_2000]
-
-        for claim_loop in loop_2000:
-            clp_segment = claim_loop.get("clp_segment", {})
-
-            claim_data = {
-                "claim_identifier": clp_segment.get("claim_submitters_identifier", ""),
-                "status_code": clp_segment.get("claim_status_code", ""),
-                "total_charge": clp_segment.get("total_claim_charge_amount", 0.0),
-                "payment_amount": clp_segment.get("claim_payment_amount", 0.0),
-                "patient_responsibility": clp_segment.get("patient_responsibility_amount", 0.0),
-                "payer_claim_control_number": clp_segment.get("payer_claim_control_number", ""),
-                "service_lines": self._extract_service_lines(claim_loop),
-                "adjustments": self._extract_claim_adjustments(claim_loop),
-            }
+        """
+        Extract claim payment information.
 
-            claims.append(claim_data)
+        Called once per model by _extract_835_data; the payment summary and
+        validate() reuse the returned list through the transaction's
+        "claims" entry instead of walking loop_2000 again.
+        """
+        return [
+            self._extract_claim(claim_loop) for claim_loop in self._as_list(model.get("loop_2000"))
+        ]
 
-        return claims
+    def _extract_claim(self, claim_loop: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract one claim payment from a loop_2000 entry."""
+        claim_data = _map_fields(claim_loop.get("clp_segment", {}), _CLP_FIELDS)
+        claim_data["service_lines"] = self._extract_service_lines(claim_loop)
+        claim_data["adjustments"] = self._extract_claim_adjustments(claim_loop)
+        return claim_data
 
     def _extract_service_lines(self, claim_loop: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract service line details."""
-        service_lines = []
-        loop_2100 = claim_loop.get("loop_2100", [])
-
-        if isinstance(loop_2100, dict):
-            loop_2100 = [loop_2100]
-
-        for service_loop in loop_2100:
-            svc_segment = service_loop.get("svc_segment", {})
-
-            service_lines.append(
-                {
-                    "procedure_code": self._safe_get(
-                        svc_segment, "composite_medical_procedure.procedure_code"
-                    ),
-                    "line_item_charge": svc_segment.get("line_item_charge_amount", 0.0),
-                    "line_item_payment": svc_segment.get("line_item_provider_payment_amount", 0.0),
-                    "units": svc_segment.get("units_of_service_paid_count", 0.0),
-                    "adjustments": self._extract_service_adjustments(service_loop),
-                }
-            )
-
-        return service_lines
+        return [
+            self._extract_service_line(service_loop)
+            for service_loop in self._as_list(claim_loop.get("loop_2100"))
+        ]
+
+    def _extract_service_line(self, service_loop: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract one service line from a loop_2100 entry."""
+        svc_segment = service_loop.get("svc_segment", {})
+
+        service_line = {
+            "procedure_code": _nested_get(
+                svc_segment, "composite_medical_procedure", "procedure_code"
+            ),
+            **_map_fields(svc_segment, _SVC_FIELDS),
+        }
+        service_line["adjustments"] = self._extract_service_adjustments(service_loop)
+        return service_line
 
     def _extract_claim_adjustments(self, claim_loop: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract claim level adjustments."""
-        adjustments = []
-        cas_segments = claim_loop.get("cas_segment", [])
-
-        if isinstance(cas_segments, dict):
-            cas_segments = [cas_segments]
-
-        for cas in cas_segments:
-            adjustments.append(
-                {
-                    "group_code": cas.get("claim_adjustment_group_code", ""),
-                    "reason_code": cas.get("adjustment_reason_code", ""),
-                    "amount": cas.get("monetary_amount", 0.0),
-                }
-            )
-
-        return adjustments
+        return [
+            _map_fields(cas, _CAS_FIELDS) for cas in self._as_list(claim_loop.get("cas_segment"))
+        ]
 
     def _extract_service_adjustments(self, service_loop: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Extract service line level adjustments."""
-        adjustments = []
-        cas_segments = service_loop.get("cas_segment", [])
-
-        if isinstance(cas_segments, dict):
-            cas_segments = [cas_segments]
-
-        for cas in cas_segments:
-            adjustments.append(
-                {
-                    "group_code": cas.get("claim_adjustment_group_code", ""),
-                    "reason_code": cas.get("adjustment_reason_code", ""),
-                    "amount": cas.get("monetary_amount", 0.0),
-                }
-            )
-
-        return adjustments
-
-    def _extract_payment_summary(self, model: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract payment summary totals."""
+        return [
+            _map_fields(cas, _CAS_FIELDS) for cas in self._as_list(service_loop.get("cas_segment"))
+        ]
+
+    def _extract_payment_summary(
+        self, model: Dict[str, Any], claims: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Extract payment summary totals from the already-extracted claims."""
         footer = model.get("footer", {})
 
-        # Calculate totals from claims
-        total_claims = 0
-        total_charged = 0.0
-        total_paid = 0.0
-
-        claims = self._extract_claim_payments(model)
-        for claim in claims:
-            total_claims += 1
-            total_charged += claim.get("total_charge", 0.0)
-            total_paid += claim.get("payment_amount", 0.0)
-
         return {
-            "total_claims": total_claims,
-            "total_charged_amount": total_charged,
-            "total_paid_amount": total_paid,
-            "control_number": self._safe_get(footer, "se_segment.transaction_set_control_number"),
+            "total_claims": len(claims),
+            "total_charged_amount": sum((claim["total_charge"] for claim in claims), 0.0),
+            "total_paid_amount": sum((claim["payment_amount"] for claim in claims), 0.0),
+            "control_number": _nested_get(footer, "se_segment", "transaction_set_control_number"),
         }
 
     def validate(self, parsed_data: Dict[str, Any]) -> List[str]:
@@ -259,29 +303,8 @@ class X12_835_Parser(BaseX12Parser):
             errors.append("No transactions found in 835 document")
 
         for idx, transaction in enumerate(transactions):
-            if not transaction.get("control_number"):
-                errors.append(f"Transaction {idx}: Missing control number")
-
-            financial_info = transaction.get("financial_information", {})
-            if not financial_info.get("total_actual_provider_payment"):
-                errors.append(f"Transaction {idx}: Missing payment amount")
-
-            if not transaction.get("payer", {}).get("name"):
-                errors.append(f"Transaction {idx}: Missing payer information")
-
-            if not transaction.get("payee", {}).get("name"):
-                errors.append(f"Transaction {idx}: Missing payee information")
+            for key_path, message in _REQUIRED_FIELDS:
+                if not self._safe_get(transaction, key_path):
+                    errors.append(f"Transaction {idx}: {message}")
 
         return errors
-
-    @staticmethod
-    def _safe_get(dictionary: Dict, key_path: str, default: Any = "") -> Any:
-        """Safely get nested dictionary value using dot notation."""
-        keys = key_path.split(".")
-        value = dictionary
-        for key in keys:
-            if isinstance(value, dict):
-                value = value.get(key, default)
-            else:
-                return default
-        return value if value is not None else default
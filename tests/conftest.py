@@ -1,30 +1,44 @@
-"""Test configuration and fixtures."""
+"""Test configuration and fixtures.
+
+Fixture file contents are immutable strings, so they are session-scoped
+and each file is read at most once per test run.
+"""
 
 import pytest
 from pathlib import Path
 
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-@pytest.fixture
+# Print-only scripts run directly with python, not test modules; they would
+# otherwise be imported (and test_with_parser mis-collected) by pytest
+collect_ignore = [
+    "integration/test_277ca.py",
+    "integration/test_277_hdi_files.py",
+    "integration/test_simple.py",
+]
+
+
+@pytest.fixture(scope="session")
 def fixtures_dir():
     """Return path to fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_277_content(fixtures_dir):
     """Load valid X12 277 Claims Status Response from LinuxForHealth test suite."""
     file_path = fixtures_dir / "277_claim_level_status.x12"
     return file_path.read_text(encoding='utf-8')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_835_medicare(fixtures_dir):
     """Load valid X12 835 Medicare Part A Payment from LinuxForHealth test suite."""
     file_path = fixtures_dir / "835_medicare_part_a.x12"
     return file_path.read_text(encoding='utf-8')
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_835_managed_care(fixtures_dir):
     """Load valid X12 835 Managed Care Payment from LinuxForHealth test suite."""
     file_path = fixtures_dir / "835_managed_care.x12"
@@ -32,7 +46,7 @@ def sample_835_managed_care(fixtures_dir):
 
 
 # Legacy fixture for backward compatibility
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_835_content(sample_835_medicare):
     """Alias for sample_835_medicare for backward compatibility."""
     return sample_835_medicare
@@ -1,36 +1,40 @@
 """Debug 277CA parsing."""
 
-from src.parsers.x12_277ca_parser import X12_277CA_Parser
+from collections import Counter
+from itertools import islice
 
-# Read the test file
-with open("tests/fixtures/277ca_rejections.x12", "r") as f:
-    x12_content = f.read()
-
-# Parse it
-parser = X12_277CA_Parser()
+from src.parsers.tokenizer import iter_segments, segment_id, split_elements
 
-# Test segment parsing
-segments = parser._parse_segments(x12_content)
-print(f"Total segments found: {len(segments)}\n")
+# Read the test file as raw bytes; segments are decoded only when displayed
+with open("tests/fixtures/277ca_rejections.x12", "rb") as f:
+    x12_content = f.read()
 
-# Show first 20 segments
-for i, seg in enumerate(segments[:20]):
-    print(f"{i+1}. {seg['id']}: {seg['elements'][:5]}")  # First 5 elements only
+# Show first 20 segments (only these are tokenized for the preview)
+for i, seg in enumerate(islice(iter_segments(x12_content), 20)):
+    elements = split_elements(seg)
+    print(f"{i+1}. {elements[0]}: {elements[1:6]}")  # First 5 elements only
+
+# Count and collect HL/NM1/STC segments in a single pass
+counts = Counter()
+found = {b"HL": [], b"NM1": [], b"STC": []}
+for seg in iter_segments(x12_content):
+    seg_id = segment_id(seg)
+    counts[seg_id] += 1
+    if seg_id in found:
+        found[seg_id].append(seg)
+print(f"\nTotal segments found: {sum(counts.values())}")
 
 # Look for HL segments specifically
-hl_segments = [s for s in segments if s['id'] == 'HL']
-print(f"\n\nHL segments found: {len(hl_segments)}")
-for hl in hl_segments:
-    print(f"  HL: {hl['elements']}")
+print(f"\n\nHL segments found: {counts[b'HL']}")
+for hl in found[b"HL"]:
+    print(f"  HL: {split_elements(hl)[1:]}")
 
 # Look for NM1 segments
-nm1_segments = [s for s in segments if s['id'] == 'NM1']
-print(f"\n\nNM1 segments found: {len(nm1_segments)}")
-for nm1 in nm1_segments[:5]:
-    print(f"  NM1: {nm1['elements'][:4]}")
+print(f"\n\nNM1 segments found: {counts[b'NM1']}")
+for nm1 in found[b"NM1"][:5]:
+    print(f"  NM1: {split_elements(nm1)[1:5]}")
 
 # Look for STC segments
-stc_segments = [s for s in segments if s['id'] == 'STC']
-print(f"\n\nSTC segments found: {len(stc_segments)}")
-for stc in stc_segments:
-    print(f"  STC: {stc['elements']}")
+print(f"\n\nSTC segments found: {counts[b'STC']}")
+for stc in found[b"STC"]:
+    print(f"  STC: {split_elements(stc)[1:]}")
@@ -10,25 +10,30 @@ with open('tests/fixtures/277ca_rejections.x12', 'r') as f:
 # Parse
 parser = X12_277CA_Parser()
 
-# Get segments
-segments = parser._parse_segments(content)
+# Group HL/NM1/STC segments in a single pass over the lazy segment iterator
+total = 0
+found = {'HL': [], 'NM1': [], 'STC': []}
+for segment_id, elements in parser._iter_segments(content):
+    total += 1
+    if segment_id in found:
+        found[segment_id].append(elements)
 
-print(f"Total segments parsed: {len(segments)}\n")
+print(f"Total segments parsed: {total}\n")
 
 # Show HL segments
-hl_segments = [s for s in segments if s['id'] == 'HL']
+hl_segments = found['HL']
 print(f"HL segments found: {len(hl_segments)}")
 for hl in hl_segments:
     print(f"  {hl}")
 
 # Show NM1 segments
-nm1_segments = [s for s in segments if s['id'] == 'NM1']
+nm1_segments = found['NM1']
 print(f"\nNM1 segments found: {len(nm1_segments)}")
 for nm1 in nm1_segments:
     print(f"  {nm1}")
 
 # Show STC segments
-stc_segments = [s for s in segments if s['id'] == 'STC']
+stc_segments = found['STC']
 print(f"\nSTC segments found: {len(stc_segments)}")
 for stc in stc_segments:
     print(f"  {stc}")
@@ -44,5 +49,4 @@ print(f"Acceptances: {len(result['acceptances'])}")
 
 if result['acknowledgments']:
     print("\nAcknowledgment details:")
-    import json
-    print(json.dumps(result['acknowledgments'], indent=2))
+    print(parser.to_json(result['acknowledgments'], indent=True).decode())
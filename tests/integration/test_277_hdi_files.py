@@ -2,52 +2,57 @@
 """Test HDI 277CA sample files with detailed analysis."""
 
 import json
+from collections import Counter
+from itertools import islice
+
+from src.parsers.tokenizer import decode_segment, iter_file_segments
 from src.parsers.x12_277ca_parser import X12_277CA_Parser
 
+# Segments inspected by analyze_file_segments, with the split limit needed to
+# reach the element read from each (HL03, NM101, STC01)
+INSPECTED_SPLITS = {b'HL': 4, b'NM1': 2, b'STC': 2}
+
 def analyze_file_segments(filepath):
     """Read and analyze raw segments in a 277 file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    # Split by segment terminator
-    segments = [s.strip() for s in content.replace('\n', '').split('~') if s.strip()]
-    
-    print(f"\n{'='*80}")
-    print(f"File: {filepath}")
-    print(f"{'='*80}")
-    print(f"Total segments: {len(segments)}\n")
-    
-    # Count segment types
-    segment_counts = {}
+    # Segments are streamed from disk and counted by ID as they arrive; only
+    # the HL, NM1 and STC segments inspected below are split, and only up to
+    # the element that is read
+    segment_counts = Counter()
     hl_levels = []
     nm1_qualifiers = []
     stc_categories = []
     
-    for seg in segments:
-        elements = seg.split('*')
-        seg_type = elements[0]
+    for seg in iter_file_segments(filepath):
+        seg_type = seg.partition(b'*')[0]
+        segment_counts[seg_type] += 1
         
-        segment_counts[seg_type] = segment_counts.get(seg_type, 0) + 1
+        maxsplit = INSPECTED_SPLITS.get(seg_type)
+        if maxsplit is None:
+            continue
+        elements = decode_segment(seg).split('*', maxsplit)
         
-        if seg_type == 'HL' and len(elements) >= 4:
+        if seg_type == b'HL' and len(elements) >= 4:
             hl_levels.append(elements[3])
-        elif seg_type == 'NM1' and len(elements) >= 2:
+        elif seg_type == b'NM1' and len(elements) >= 2:
             nm1_qualifiers.append(elements[1])
-        elif seg_type == 'STC' and len(elements) >= 2:
+        elif seg_type == b'STC' and len(elements) >= 2:
             # STC01 format: CategoryCode:StatusCode:EntityCode
-            stc_parts = elements[1].split(':')
-            if stc_parts:
-                stc_categories.append(stc_parts[0])
+            stc_categories.append(elements[1].partition(':')[0])
+    
+    print(f"\n{'='*80}")
+    print(f"File: {filepath}")
+    print(f"{'='*80}")
+    print(f"Total segments: {segment_counts.total()}\n")
     
     print("Segment Type Counts:")
     for seg_type in sorted(segment_counts.keys()):
-        print(f"  {seg_type}: {segment_counts[seg_type]}")
+        print(f"  {seg_type.decode()}: {segment_counts[seg_type]}")
     
     print(f"\nHL Hierarchy Levels: {set(hl_levels)}")
     print(f"NM1 Entity Qualifiers: {set(nm1_qualifiers)}")
     print(f"STC Status Categories: {set(stc_categories)}")
     
-    return segments
+    return segment_counts
 
 def test_with_parser(filepath):
     """Test file with our 277CA parser."""
@@ -80,17 +85,13 @@ def test_with_parser(filepath):
 
 def show_sample_segments(filepath, count=20):
     """Show first N segments of the file."""
-    with open(filepath, 'r') as f:
-        content = f.read()
-    
-    segments = [s.strip() for s in content.replace('\n', '').split('~') if s.strip()]
-    
     print(f"\n{'='*80}")
     print(f"Sample Segments (first {count}):")
     print(f"{'='*80}")
     
-    for i, seg in enumerate(segments[:count], 1):
-        print(f"{i:3}. {seg}")
+    # Stop reading once the first N segments have been shown
+    for i, seg in enumerate(islice(iter_file_segments(filepath), count), 1):
+        print(f"{i:3}. {decode_segment(seg)}")
 
 if __name__ == '__main__':
     files_to_test = [
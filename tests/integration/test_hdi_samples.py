@@ -1,7 +1,6 @@
 #!/usr/bin/env python3
 """Test HDI sample files with our parsers."""
 
-import json
 from src.parsers.x12_277ca_parser import X12_277CA_Parser
 from src.parsers.x12_835_parser import X12_835_Parser
 
@@ -48,7 +47,7 @@ def test_277ca_receiver_rejected():
         status = ack.get('status_category', 'Unknown')
         print(f"\n  Acknowledgment #{i}:")
         print(f"    Status: {status}")
-        print(f"    Details: {json.dumps(ack, indent=6)}")
+        print(f"    Details: {parser.to_json(ack, indent=True).decode()}")
     
     return result
 
@@ -0,0 +1,25 @@
+"""Unit tests for application settings."""
+
+import pickle
+
+from src.core.config import Settings
+
+
+class TestSettings:
+    """Tests for derived settings values."""
+
+    def test_derived_values_survive_copy_and_pickle(self):
+        """Test copies and unpickled settings keep working derived values."""
+        settings = Settings(MAX_FILE_SIZE_MB=2)
+
+        assert settings.copy().max_file_size_bytes == 2 * 1024 * 1024
+        assert pickle.loads(pickle.dumps(settings)).max_file_size_bytes == 2 * 1024 * 1024
+
+    def test_copy_with_update_recomputes_derived_values(self):
+        """Test overriding a field through copy(update=...) updates derived values."""
+        settings = Settings(MAX_FILE_SIZE_MB=2).copy(
+            update={"MAX_FILE_SIZE_MB": 3, "ENVIRONMENT": "production"}
+        )
+
+        assert settings.max_file_size_bytes == 3 * 1024 * 1024
+        assert settings.is_production
@@ -0,0 +1,30 @@
+"""Unit tests for X12 processing exceptions."""
+
+import pickle
+
+from src.core.exceptions import X12ParseError
+
+
+class TestX12ProcessingError:
+    """Tests for lazily formatted exception messages."""
+
+    def test_message_formatted_from_ctx(self):
+        """Test the template is formatted with its keyword context."""
+        error = X12ParseError(
+            "Not a 277CA document: ST {code} {version}", code="277", version="X212"
+        )
+
+        assert str(error) == "Not a 277CA document: ST 277 X212"
+        assert repr(error) == "X12ParseError('Not a 277CA document: ST 277 X212')"
+
+    def test_pickle_round_trip_keeps_ctx(self):
+        """Test errors crossing a process boundary keep their formatted message."""
+        error = X12ParseError(
+            "Not a 277CA document: ST {code} {version}", code="277", version="X212"
+        )
+
+        copy = pickle.loads(pickle.dumps(error))
+
+        assert type(copy) is X12ParseError
+        assert copy.ctx == {"code": "277", "version": "X212"}
+        assert str(copy) == "Not a 277CA document: ST 277 X212"
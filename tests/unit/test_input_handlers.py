@@ -1,8 +1,15 @@
 """Unit tests for input handlers."""
 
+import io
+
 import pytest
 from src.input.local_input import LocalInput
-from src.core.exceptions import InputError
+from src.input.s3_input import S3Input
+from src.input import upload_input
+from src.input.upload_input import StreamingUploadInput
+from src.core.config import Settings
+from src.core.exceptions import FileSizeError, InputError, S3Error
+from botocore.exceptions import ClientError
 
 
 class TestLocalInput:
@@ -17,6 +24,15 @@ class TestLocalInput:
         assert len(content) > 0
         assert "ISA" in content
     
+    def test_read_bytes_normalizes_line_endings(self, tmp_path):
+        """Test raw read keeps bytes and converts CRLF to LF."""
+        file_path = tmp_path / "windows.x12"
+        file_path.write_bytes(b"ISA*00~\r\nST*277~\r\n")
+        handler = LocalInput(str(file_path))
+        
+        assert handler.read_bytes() == b"ISA*00~\nST*277~\n"
+        assert handler.read() == "ISA*00~\nST*277~\n"
+    
     def test_validate_existing_file(self, temp_x12_file):
         """Test validation of existing file."""
         handler = LocalInput(str(temp_x12_file))
@@ -29,6 +45,32 @@ class TestLocalInput:
         with pytest.raises(InputError):
             handler.validate_source()
     
+    def test_validate_oversized_file(self, tmp_path):
+        """Test oversized files raise FileSizeError with structured context."""
+        file_path = tmp_path / "large.x12"
+        file_path.write_bytes(b"ISA*00~")
+        handler = LocalInput(str(file_path))
+        handler.settings = Settings(MAX_FILE_SIZE_MB=0)
+        
+        with pytest.raises(FileSizeError) as exc_info:
+            handler.validate_source()
+        
+        assert exc_info.value.ctx == {"size": 7, "max_size": 0}
+        assert str(exc_info.value) == "File size (7 bytes) exceeds maximum (0 bytes)"
+    
+    def test_read_after_prefix_validates_once(self, tmp_path, monkeypatch):
+        """Test read_bytes() after read_prefix() does not re-validate the file."""
+        file_path = tmp_path / "claims.x12"
+        file_path.write_bytes(b"ISA*00~\nST*835~\n")
+        handler = LocalInput(str(file_path))
+        calls = []
+        validate = handler.validate_source
+        monkeypatch.setattr(handler, "validate_source", lambda: calls.append(1) or validate())
+        
+        assert handler.read_prefix(4) == b"ISA*"
+        assert handler.read_bytes() == b"ISA*00~\nST*835~\n"
+        assert len(calls) == 1
+    
     def test_get_metadata(self, temp_x12_file):
         """Test getting file metadata."""
         handler = LocalInput(str(temp_x12_file))
@@ -37,3 +79,143 @@ class TestLocalInput:
         assert "path" in metadata
         assert "size" in metadata
         assert metadata["size"] > 0
+
+
+class FakeS3Client:
+    """Minimal in-memory stand-in for the boto3 S3 client calls S3Input makes."""
+    
+    def __init__(self, body):
+        self.body = body
+        self.etag = '"v1"'
+        self.ranges = []
+        self.if_match = []
+    
+    def head_object(self, Bucket, Key):
+        return {"ContentLength": len(self.body)}
+    
+    def get_object(self, Bucket, Key, Range=None, IfMatch=None):
+        if IfMatch is not None and IfMatch != self.etag:
+            raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "GetObject")
+        if Range is None:
+            return {"Body": io.BytesIO(self.body), "ETag": self.etag}
+        self.ranges.append(Range)
+        self.if_match.append(IfMatch)
+        first, last = map(int, Range[len("bytes="):].split("-"))
+        last = min(last, len(self.body) - 1)
+        return {
+            "Body": io.BytesIO(self.body[first:last + 1]),
+            "ContentRange": f"bytes {first}-{last}/{len(self.body)}",
+            "ETag": self.etag,
+        }
+
+
+class TestS3Input:
+    """Tests for S3 input handler."""
+    
+    def test_read_bytes_reassembles_byte_ranges(self):
+        """Test large objects are fetched as ranged GETs and reassembled in order."""
+        body = b"ISA*00~\r\n" + b"NM1*IL*1*DOE~\r\n" * 10
+        client = FakeS3Client(body)
+        handler = S3Input("bucket", "input/claims.x12", part_size=16, client=client)
+        
+        assert handler.read_bytes() == body.replace(b"\r\n", b"\n")
+        assert len(client.ranges) == -(-len(body) // 16)
+        assert client.ranges[-1].endswith(f"-{len(body) - 1}")
+    
+    def test_read_bytes_small_object_single_get(self):
+        """Test objects within one part are fetched with a single GET and no HEAD."""
+        client = FakeS3Client(b"ISA*00~")
+        client.head_object = None
+        handler = S3Input("bucket", "input/claims.x12", client=client)
+        
+        assert handler.read_bytes() == b"ISA*00~"
+        assert len(client.ranges) == 1
+    
+    def test_read_bytes_after_prefix_skips_prefix(self):
+        """Test the prefix GET is not repeated when the full object is read."""
+        body = b"ISA*00~\r\n" + b"NM1*IL*1*DOE~\r\n" * 10
+        client = FakeS3Client(body)
+        handler = S3Input("bucket", "input/claims.x12", part_size=64, client=client)
+        
+        assert handler.read_prefix(8) == b"ISA*00~\n"
+        assert handler.read_bytes() == body.replace(b"\r\n", b"\n")
+        assert client.ranges[0] == "bytes=0-7"
+        assert client.ranges[1].startswith("bytes=8-")
+    
+    def test_read_bytes_later_part_invalid_range_raises(self):
+        """Test an unsatisfiable later part fails the read instead of returning b''."""
+        body = b"ISA*00~\r\n" + b"NM1*IL*1*DOE~\r\n" * 10
+        client = FakeS3Client(body)
+        get_object = client.get_object
+        
+        def truncated_after_first_part(Bucket, Key, Range=None, **kwargs):
+            if client.ranges:
+                raise ClientError({"Error": {"Code": "InvalidRange"}}, "GetObject")
+            return get_object(Bucket, Key, Range=Range, **kwargs)
+        
+        client.get_object = truncated_after_first_part
+        handler = S3Input("bucket", "input/claims.x12", part_size=16, client=client)
+        
+        with pytest.raises(S3Error):
+            handler.read_bytes()
+    
+    def test_read_bytes_pins_parts_to_first_etag(self):
+        """Test later parts use IfMatch, so an overwrite mid-read fails."""
+        body = b"ISA*00~\r\n" + b"NM1*IL*1*DOE~\r\n" * 10
+        client = FakeS3Client(body)
+        handler = S3Input("bucket", "input/claims.x12", part_size=16, client=client)
+        
+        assert handler.read_bytes() == body.replace(b"\r\n", b"\n")
+        assert client.if_match == [None] + ['"v1"'] * (len(client.ranges) - 1)
+        
+        get_object = client.get_object
+        
+        def overwritten_after_first_part(Bucket, Key, Range=None, IfMatch=None):
+            if client.ranges:
+                client.etag = '"v2"'
+            return get_object(Bucket, Key, Range=Range, IfMatch=IfMatch)
+        
+        client.ranges = []
+        client.get_object = overwritten_after_first_part
+        handler = S3Input("bucket", "input/claims.x12", part_size=16, client=client)
+        
+        with pytest.raises(S3Error):
+            handler.read_bytes()
+    
+    def test_read_bytes_rejects_wrong_length_part(self):
+        """Test a part body of the wrong length raises instead of resizing the buffer."""
+        body = b"ISA*00~\r\n" + b"NM1*IL*1*DOE~\r\n" * 10
+        client = FakeS3Client(body)
+        get_object = client.get_object
+        
+        def short_later_parts(Bucket, Key, Range=None, IfMatch=None):
+            response = get_object(Bucket, Key, Range=Range, IfMatch=IfMatch)
+            if len(client.ranges) > 1:
+                response["Body"] = io.BytesIO(response["Body"].read()[:-1])
+            return response
+        
+        client.get_object = short_later_parts
+        handler = S3Input("bucket", "input/claims.x12", part_size=16, client=client)
+        
+        with pytest.raises(S3Error):
+            handler.read_bytes()
+    
+    def test_get_size_uses_object_metadata(self):
+        """Test size comes from a single HEAD, never a download."""
+        client = FakeS3Client(b"ISA*00~")
+        client.get_object = None
+        handler = S3Input("bucket", "input/claims.x12", client=client)
+        
+        assert handler.get_size() == 7
+
+
+class TestStreamingUploadInput:
+    """Tests for streaming upload input handler."""
+    
+    def test_read_decodes_characters_split_across_chunks(self, monkeypatch):
+        """Test multi-byte characters spanning chunk boundaries decode intact."""
+        monkeypatch.setattr(upload_input, "STREAM_CHUNK_SIZE", 3)
+        content = "NM1*IL*1*MUÑOZ*JOSÉ~"
+        handler = StreamingUploadInput(io.BytesIO(content.encode("utf-8")), "claims.x12")
+        
+        assert handler.read() == content
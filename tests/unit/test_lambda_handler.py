@@ -0,0 +1,123 @@
+"""Unit tests for the Lambda handler helpers."""
+
+import json
+from datetime import date
+
+from src.handlers import lambda_handler
+from src.handlers.lambda_handler import (
+    _create_summary,
+    _detect_transaction_type,
+    _write_output,
+)
+
+
+class TestLambdaHandler:
+    """Tests for Lambda handler helper functions."""
+
+    def test_write_output_local(self, tmp_path):
+        """Test local output is written as JSON, including date values."""
+        output_path = tmp_path / "result.json"
+        data = {"transaction_type": "835", "payment_date": date(2022, 1, 1)}
+
+        location = _write_output(
+            {"output_destination": "local", "output_path": str(output_path)}, data
+        )
+
+        assert location == str(output_path)
+        assert json.loads(output_path.read_bytes()) == {
+            "transaction_type": "835",
+            "payment_date": "2022-01-01",
+        }
+
+    def test_write_output_local_validation_errors(self, tmp_path):
+        """Test validation errors are written to a sibling errors file."""
+        output_path = tmp_path / "result.json"
+
+        _write_output(
+            {"output_destination": "local", "output_path": str(output_path)},
+            {"transaction_type": "835"},
+            ["Missing payer"],
+        )
+
+        assert json.loads(output_path.read_bytes()) == {"transaction_type": "835"}
+        assert json.loads((tmp_path / "result_errors.json").read_bytes()) == {
+            "validation_errors": ["Missing payer"]
+        }
+
+    def test_write_output_s3_keys_distinct_across_prefixes(self, monkeypatch):
+        """Test same-named source objects under different prefixes get distinct keys."""
+
+        class FakeS3Client:
+            def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+                pass
+
+        monkeypatch.setattr(lambda_handler, "get_s3_client", lambda region: FakeS3Client())
+        monkeypatch.setattr(lambda_handler.time, "gmtime", lambda: (2022, 1, 1, 0, 0, 0, 5, 1, 0))
+
+        locations = [
+            _write_output({"output_bucket": "out", "key": key}, {"transaction_type": "835"})
+            for key in ("input/a/claims.x12", "input/b/claims.x12")
+        ]
+
+        assert locations[0] != locations[1]
+        assert all(location.startswith("s3://out/output/claims_") for location in locations)
+        assert all(location.endswith("_20220101_000000.json") for location in locations)
+
+    def test_process_document_keeps_summary_out_of_output(self, tmp_path, monkeypatch):
+        """Test the precomputed _summary feeds the response but is not written."""
+        input_path = tmp_path / "claims.x12"
+        input_path.write_bytes(b"ISA*00~\nST*835*0001~\n")
+        output_path = tmp_path / "result.json"
+
+        class FakeParser:
+            def parse(self, content):
+                summary = {"transaction_type": "835", "version": "005010", "transaction_count": 1}
+                return {"transaction_type": "835", "transactions": [{}], "_summary": summary}
+
+            def validate(self, parsed_data):
+                return []
+
+        monkeypatch.setattr(lambda_handler, "_get_parser", lambda transaction_type: FakeParser())
+
+        status_code, body = lambda_handler._process_document(
+            {
+                "input_source": "local",
+                "file_path": str(input_path),
+                "transaction_type": "835",
+                "output_destination": "local",
+                "output_path": str(output_path),
+            }
+        )
+
+        assert status_code == 200
+        assert body["summary"]["transaction_count"] == 1
+        assert "_summary" not in json.loads(output_path.read_bytes())
+
+    def test_create_summary_counts_validation_errors(self):
+        """Test the summary carries an error count rather than the errors."""
+        parsed = {"_summary": {"transaction_type": "835"}}
+
+        summary = _create_summary(parsed, ["a", "b"])
+
+        assert summary == {
+            "transaction_type": "835",
+            "has_validation_errors": True,
+            "validation_error_count": 2,
+        }
+        assert "has_validation_errors" not in parsed["_summary"]
+
+    def test_detect_transaction_type(self):
+        """Test 277CA is distinguished from 277 by the ST version."""
+        assert _detect_transaction_type(b"ISA*00~\nST*277*0001*005010X214~") == "277CA"
+        assert _detect_transaction_type(b"ISA*00~\nST*277*0001*005010X212~") == "277"
+        assert _detect_transaction_type(b"ISA*00~\nGS*HP~") == "unknown"
+
+    def test_detect_transaction_type_prefix_cut_mid_st(self):
+        """Test an ST segment truncated by the prefix is not trusted."""
+        content = b"ISA*00~\nST*277*0001*005010X214~"
+
+        # Prefixes ending in "...~ST*277*00" and "...~ST*27"
+        assert _detect_transaction_type(content[:-14], partial=True) == "unknown"
+        assert _detect_transaction_type(content[:-18], partial=True) == "unknown"
+        assert _detect_transaction_type(content[:-14]) == "277"
+        assert _detect_transaction_type(content, partial=True) == "277CA"
@@ -1,7 +1,12 @@
 """Unit tests for X12 parsers."""
 
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch
+
 import pytest
 from src.parsers.x12_277_parser import X12_277_Parser
+from src.parsers.x12_277ca_parser import X12_277CA_Parser
 from src.parsers.x12_835_parser import X12_835_Parser
 from src.core.exceptions import X12ParseError
 
@@ -25,6 +30,113 @@ class TestX12_277_Parser:
         
         errors = parser.validate(parsed_data)
         assert isinstance(errors, list)
+    
+    def test_raw_data_is_opt_in(self):
+        """Test the LinuxForHealth model is only kept when requested."""
+        model = {"header": {"st_segment": {"transaction_set_control_number": "0001"}}}
+        
+        assert "raw_data" not in X12_277_Parser()._extract_277_data(model)
+        assert X12_277_Parser(keep_raw=True)._extract_277_data(model)["raw_data"] is model
+    
+    def test_extract_loops_as_dict_or_list(self):
+        """Test loops are read the same whether given as a dict or a list."""
+        parser = X12_277_Parser()
+        nm1 = {"name_last_or_organization_name": "PAYER", "identification_code": "123"}
+        claim = {"stc_segment": {"status_code": "20"}}
+        
+        as_dict = {
+            "loop_2000a": {"loop_2100a": {"nm1_segment": nm1}},
+            "loop_2000c": {"loop_2100c": {"nm1_segment": nm1}, "loop_2200c": claim},
+        }
+        as_list = {
+            "loop_2000a": [{"loop_2100a": [{"nm1_segment": nm1}]}],
+            "loop_2000c": [{"loop_2100c": [{"nm1_segment": nm1}], "loop_2200c": [claim]}],
+        }
+        
+        assert parser._extract_277_data(as_dict) == parser._extract_277_data(as_list)
+        assert parser._extract_information_source(as_dict)["name"] == "PAYER"
+        assert parser._extract_information_receiver({"loop_2000b": []})["name"] == ""
+        providers = parser._extract_service_providers(as_dict)
+        assert providers[0]["claims"][0]["status_codes"][0]["code"] == "20"
+    
+    def test_first_takes_first_loop_entry(self):
+        """Test dict-or-list loops yield their first dict, with absent loops empty."""
+        loop = {"nm1_segment": {}}
+        
+        assert X12_277_Parser._first(loop) == loop
+        assert X12_277_Parser._first([loop, {}]) == loop
+        assert X12_277_Parser._first([]) == {}
+        assert X12_277_Parser._first(None) == {}
+
+
+class TestX12_277CA_Parser:
+    """Tests for X12 277CA parser."""
+    
+    def test_status_codes_are_shared(self):
+        """Test repeated status codes reference one interned string."""
+        content = "".join(
+            f"HL*{n}*1*22*0~TRN*2*TRACE{n}~STC*A7:42*20230101~"
+            for n in (2, 3)
+        )
+        
+        rejections = X12_277CA_Parser().parse(content)["rejections"]
+        
+        assert len(rejections) == 2
+        assert rejections[0]["status_category"] is rejections[1]["status_category"]
+        assert rejections[0]["status_code"] is rejections[1]["status_code"] == "42"
+    
+    def test_status_categories(self):
+        """Test A3 counts as a rejection and A2 as an acceptance."""
+        content = (
+            "HL*2*1*22*0~TRN*2*TRACE1~STC*A3:21~"
+            "HL*3*1*22*0~TRN*2*TRACE2~STC*A2:20~"
+            "HL*4*1*22*0~TRN*2*TRACE3~STC*A4:35~"
+        )
+        
+        result = X12_277CA_Parser().parse(content)
+        
+        assert [r["trace_number"] for r in result["rejections"]] == ["TRACE1"]
+        assert [a["trace_number"] for a in result["acceptances"]] == ["TRACE2"]
+        assert result["summary"]["total_claims"] == 3
+        # Category lists reference the acknowledgment records, not copies
+        assert result["rejections"][0] is result["acknowledgments"][0]
+        assert result["acceptances"][0] is result["acknowledgments"][1]
+    
+    def test_parse_rejects_other_transactions(self):
+        """Test a non-277CA ST segment fails before the document is tokenized."""
+        with pytest.raises(X12ParseError, match="ST 277 005010X212"):
+            X12_277CA_Parser().parse("ST*277*0001*005010X212~HL*2*1*22*0~")
+        with pytest.raises(X12ParseError, match="ST 835"):
+            X12_277CA_Parser().parse("ST*835*0001*005010X221A1~")
+    
+    def test_parse_accepts_277_st_without_version(self):
+        """Test a 277 ST segment lacking ST03 is parsed rather than rejected."""
+        result = X12_277CA_Parser().parse("ST*277*0001~HL*2*1*22*0~TRN*2*TRACE1~")
+        
+        assert result["acknowledgments"][0]["trace_number"] == "TRACE1"
+    
+    def test_claim_keys_are_shared(self):
+        """Test claim records reuse the interned field-name key objects."""
+        content = "HL*2*1*22*0~TRN*2*TRACE1~HL*3*1*22*0~TRN*2*TRACE2~"
+        
+        first, second = X12_277CA_Parser().parse(content)["acknowledgments"]
+        
+        assert list(first) == list(second)
+        assert all(a is b for a, b in zip(first, second))
+    
+    def test_parse_batch_preserves_order(self, tmp_path):
+        """Test files parsed in worker processes come back in input order."""
+        paths = []
+        for n in (1, 2, 3):
+            path = tmp_path / f"claims{n}.x12"
+            path.write_text(f"HL*2*1*22*0~TRN*2*TRACE{n}~STC*A7:42*20230101~")
+            paths.append(str(path))
+        
+        results = X12_277CA_Parser.parse_batch(paths, max_workers=2, chunksize=1)
+        
+        assert [r["rejections"][0]["trace_number"] for r in results] == [
+            "TRACE1", "TRACE2", "TRACE3"
+        ]
 
 
 class TestX12_835_Parser:
@@ -46,3 +158,68 @@ class TestX12_835_Parser:
         
         errors = parser.validate(parsed_data)
         assert isinstance(errors, list)
+    
+    def test_get_transaction_info(self):
+        """Test only an ST segment at a segment boundary is reported."""
+        parser = X12_835_Parser()
+        content = "ISA*00~\nGS*HP*ST*1~\nST*835*0001*005010X221A1~CLP*1~"
+        
+        assert parser.get_transaction_info(content) == {
+            "transaction_code": "835",
+            "version": "005010X221A1",
+        }
+        assert parser.get_transaction_info("ISA*00~GS*HP*ST*1~")["transaction_code"] == "unknown"
+    
+    def test_to_json(self):
+        """Test parse results serialize with dates and decimals."""
+        result = {"payment_date": date(2022, 1, 1), "total": Decimal("10.50")}
+        
+        assert X12_835_Parser.to_json(result) == b'{"payment_date":"2022-01-01","total":"10.50"}'
+        assert X12_835_Parser.to_json({"a": 1}, indent=True) == b'{\n  "a": 1\n}'
+    
+    def test_claims_extracted_once_per_model(self):
+        """Test the summary reuses the extracted claims instead of re-walking loop_2000."""
+        parser = X12_835_Parser()
+        model = {"loop_2000": {"clp_segment": {
+            "total_claim_charge_amount": 100.0, "claim_payment_amount": 80.0
+        }}}
+        
+        with patch.object(
+            parser, "_extract_claim_payments", wraps=parser._extract_claim_payments
+        ) as extract:
+            transaction = parser._extract_835_data(model)
+        
+        extract.assert_called_once_with(model)
+        assert transaction["summary"]["total_charged_amount"] == 100.0
+        assert transaction["summary"]["total_paid_amount"] == 80.0
+    
+    def test_as_list_normalizes_loops(self):
+        """Test dict-or-list loops normalize to lists, with absent loops empty."""
+        loop = {"clp_segment": {}}
+        
+        assert X12_835_Parser._as_list(loop) == [loop]
+        assert X12_835_Parser._as_list([loop]) == [loop]
+        assert X12_835_Parser._as_list(None) == []
+    
+    def test_raw_data_is_opt_in(self):
+        """Test the LinuxForHealth model is only kept when requested."""
+        model = {"header": {}}
+        
+        assert "raw_data" not in X12_835_Parser()._extract_835_data(model)
+        assert X12_835_Parser(keep_raw=True)._extract_835_data(model)["raw_data"] is model
+    
+    def test_validate_reports_missing_fields_in_order(self):
+        """Test each missing required field is reported per transaction."""
+        valid = {
+            "control_number": "0001",
+            "financial_information": {"total_actual_provider_payment": 500},
+            "payer": {"name": "PAYER"},
+            "payee": {"name": "PAYEE"},
+        }
+        parsed = {"transaction_type": "835", "transactions": [valid, {"payer": {"name": "PAYER"}}]}
+        
+        assert X12_835_Parser().validate(parsed) == [
+            "Transaction 1: Missing control number",
+            "Transaction 1: Missing payment amount",
+            "Transaction 1: Missing payee information",
+        ]
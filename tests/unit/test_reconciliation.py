@@ -0,0 +1,226 @@
+"""Unit tests for claim reconciliation."""
+
+from datetime import date, datetime, timedelta
+
+from src.core.reconciliation import (
+    _ENGINE_POOL,
+    ClaimReconciliationEngine,
+    _date_ordinal,
+    generate_reconciliation_report,
+)
+
+
+def _days_ago(days):
+    """Return a YYYYMMDD date string `days` days in the past."""
+    return (datetime.now() - timedelta(days=days)).strftime("%Y%m%d")
+
+
+def _rejection(patient_id, days_ago, amount="150.00", date_of_service="20221201-20221205"):
+    """Build a 277CA rejection record."""
+    return {
+        "patient_id": patient_id,
+        "patient_name": f"PATIENT {patient_id}",
+        "date_of_service": date_of_service,
+        "billed_amount": amount,
+        "rejection_reason": "Invalid subscriber ID",
+        "status_code": "42",
+        "trace_number": f"TRN-{patient_id}",
+        "transaction_date": _days_ago(days_ago),
+    }
+
+
+class TestClaimReconciliationEngine:
+    """Tests for 277CA/835 reconciliation."""
+
+    def test_unsubmitted_claims_sorted_oldest_first(self):
+        """Test only old, unmatched rejections are alerted, oldest first."""
+        engine = ClaimReconciliationEngine()
+        engine.add_277ca_rejections(
+            {
+                "rejections": [
+                    _rejection("PAT1", 35),
+                    _rejection("PAT2", 60),
+                    _rejection("PAT3", 5),
+                ]
+            }
+        )
+
+        alerts = engine.find_unsubmitted_claims(days_threshold=30)
+
+        assert [a["patient_id"] for a in alerts] == ["PAT2", "PAT1"]
+        assert [a["severity"] for a in alerts] == ["HIGH", "MEDIUM"]
+        assert alerts[0]["match_key"] == "PAT2|20221201|150"
+        assert alerts[0]["billed_amount"] == "150.00"
+        assert engine.find_unsubmitted_claims(limit=1) == alerts[:1]
+
+    def test_unsubmitted_claims_with_explicit_now(self):
+        """Test alert ages are computed from the supplied clock reading."""
+        engine = ClaimReconciliationEngine()
+        rejection = _rejection("PAT1", 0)
+        rejection["transaction_date"] = "20230101"
+        engine.add_277ca_rejections({"rejections": [rejection]})
+
+        alerts = engine.find_unsubmitted_claims(now=datetime(2023, 3, 2, 12, 0))
+
+        assert alerts[0]["days_since_rejection"] == 60
+        assert engine.find_unsubmitted_claims(now=datetime(2023, 1, 15)) == []
+
+    def test_matched_835_payment_resolves_rejection(self):
+        """Test a matching 835 claim marks the rejection as resubmitted."""
+        engine = ClaimReconciliationEngine()
+        engine.add_277ca_rejections(
+            {
+                "rejections": [
+                    _rejection("PAT1", 40, amount="100.50"),
+                    _rejection("PAT2", 40, amount="200.25"),
+                ]
+            }
+        )
+        engine.add_835_payments(
+            {
+                "claims": [
+                    {"patient_id": "PAT1", "date_of_service": "20221201", "charged_amount": "100"},
+                ]
+            }
+        )
+
+        alerts = engine.find_unsubmitted_claims()
+        summary = engine.get_reconciliation_summary()
+
+        assert [a["patient_id"] for a in alerts] == ["PAT2"]
+        assert summary["total_rejections_tracked"] == 2
+        assert summary["successfully_resubmitted"] == 1
+        assert summary["still_unsubmitted"] == 1
+        assert summary["resubmission_rate"] == 50
+        assert summary["potential_revenue_at_risk"] == 200.25
+
+    def test_zero_billed_amount_falls_back_to_charged_on_both_sides(self):
+        """Test a "0.00" billed amount matches on the charged amount for 277CA and 835."""
+        engine = ClaimReconciliationEngine()
+        rejection = _rejection("PAT1", 40, amount="0.00")
+        rejection["charged_amount"] = "100.00"
+        engine.add_277ca_rejections({"rejections": [rejection]})
+        engine.add_835_payments(
+            {
+                "claims": [
+                    {
+                        "patient_id": "PAT1",
+                        "date_of_service": "20221201",
+                        "billed_amount": "0.00",
+                        "charged_amount": "100.00",
+                    },
+                ]
+            }
+        )
+
+        assert engine.get_reconciliation_summary()["successfully_resubmitted"] == 1
+
+    def test_reingested_rejection_reopens_claim(self):
+        """Test a repeated rejection replaces the earlier one and reopens it."""
+        engine = ClaimReconciliationEngine()
+        engine.add_277ca_rejections({"rejections": [_rejection("PAT1", 40, amount="100.10")]})
+        engine.add_835_payments(
+            {
+                "claims": [
+                    {"patient_id": "PAT1", "date_of_service": "20221201", "charged_amount": "100"},
+                ]
+            }
+        )
+        assert engine.get_reconciliation_summary()["potential_revenue_at_risk"] == 0
+
+        engine.add_277ca_rejections({"rejections": [_rejection("PAT1", 40, amount="100.20")]})
+        summary = engine.get_reconciliation_summary()
+
+        assert summary["total_rejections_tracked"] == 1
+        assert summary["still_unsubmitted"] == 1
+        assert summary["potential_revenue_at_risk"] == 100.2
+
+    def test_batch_ingest_matches_row_ingest(self):
+        """Test column-wise ingest tracks the same rejections as row-wise ingest."""
+        rejections = [_rejection("PAT1", 40), _rejection("PAT2", 50), _rejection(None, 60)]
+        by_row = ClaimReconciliationEngine()
+        by_row.add_277ca_rejections({"rejections": rejections})
+        by_column = ClaimReconciliationEngine()
+        by_column.add_277ca_rejections_batch(
+            {name: [r[name] for r in rejections] for name in rejections[0]}
+        )
+
+        assert by_column.rejections_cache == by_row.rejections_cache
+        assert by_column.find_unsubmitted_claims() == by_row.find_unsubmitted_claims()
+        assert by_column.get_reconciliation_summary() == by_row.get_reconciliation_summary()
+
+    def test_reset_clears_tracked_claims(self):
+        """Test a reset engine behaves like a new one."""
+        engine = ClaimReconciliationEngine()
+        engine.add_277ca_rejections({"rejections": [_rejection("PAT1", 40)]})
+
+        assert engine.reset(lookback_days=90) is engine
+        assert engine.find_unsubmitted_claims() == []
+        assert engine.get_reconciliation_summary() == (
+            ClaimReconciliationEngine(lookback_days=90).get_reconciliation_summary()
+        )
+
+    def test_records_without_patient_or_valid_date_are_not_alerted(self):
+        """Test incomplete rejections are skipped."""
+        engine = ClaimReconciliationEngine()
+        bad_date = _rejection("PAT1", 40)
+        bad_date["transaction_date"] = "not-a-date"
+        engine.add_277ca_rejections(
+            {
+                "rejections": [
+                    bad_date,
+                    _rejection(None, 40),
+                    _rejection("PAT3", 40, date_of_service=None, amount=None),
+                ]
+            }
+        )
+
+        assert engine.find_unsubmitted_claims() == []
+        assert engine.get_reconciliation_summary()["total_rejections_tracked"] == 1
+
+    def test_date_ordinal_formats(self):
+        """Test both rejection date formats parse to the same day."""
+        expected = date(2023, 1, 31).toordinal()
+
+        assert _date_ordinal("20230131") == expected
+        assert _date_ordinal("2023-01-31") == expected
+        assert _date_ordinal("20230231") == 0
+        assert _date_ordinal(None) == 0
+
+    def test_generate_reconciliation_report(self):
+        """Test the convenience report combines alerts and summary."""
+        report = generate_reconciliation_report(
+            [_rejection("PAT1", 50), _rejection("PAT2", 31)],
+            [],
+        )
+
+        assert report["alert_count"] == 2
+        assert report["high_severity_count"] == 1
+        assert report["summary"]["potential_revenue_at_risk"] == 300.0
+
+        # A second report reuses the pooled engine without carrying over claims
+        report = generate_reconciliation_report([_rejection("PAT3", 40)], [])
+
+        assert report["alert_count"] == 1
+        assert report["summary"]["total_rejections_tracked"] == 1
+
+    def test_pooled_engine_holds_no_claims_between_reports(self):
+        """Test an engine is emptied when it returns to the pool."""
+        generate_reconciliation_report([_rejection("PAT1", 50)], [])
+
+        assert _ENGINE_POOL
+        assert all(not engine.rejections_cache for engine in _ENGINE_POOL)
+
+    def test_generate_reconciliation_report_streams_alerts(self):
+        """Test alerts are handed to the callback instead of collected."""
+        received = []
+        report = generate_reconciliation_report(
+            [_rejection("PAT1", 50), _rejection("PAT2", 31)],
+            [],
+            on_alert=received.append,
+        )
+
+        assert [a["patient_id"] for a in received] == ["PAT1", "PAT2"]
+        assert report["unsubmitted_claims"] == []
+        assert report["alert_count"] == 2
+        assert report["high_severity_count"] == 1
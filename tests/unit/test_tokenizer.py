@@ -0,0 +1,72 @@
+"""Unit tests for the X12 segment tokenizer."""
+
+from src.parsers.tokenizer import (
+    decode_segment,
+    find_segment,
+    iter_file_segments,
+    iter_segments,
+    segment_id,
+    sniff_delimiters,
+    split_elements,
+)
+
+SAMPLE = b"ST*277*0001*005010X214~\nHL*1**20*1~\r\nNM1*IL*1*DOE*JOHN~\n"
+
+ISA = (
+    b"ISA|00|          |00|          |ZZ|SENDER         |ZZ|RECEIVER       "
+    b"|230101|1200|^|00501|000000001|0|P|:!"
+)
+
+
+class TestTokenizer:
+    """Tests for byte-level segment tokenization."""
+
+    def test_iter_segments_strips_line_breaks(self):
+        """Test segments are split on ~ with line breaks removed."""
+        segments = list(iter_segments(SAMPLE))
+
+        assert segments == [b"ST*277*0001*005010X214", b"HL*1**20*1", b"NM1*IL*1*DOE*JOHN"]
+
+    def test_iter_file_segments_across_chunks(self, tmp_path):
+        """Test chunked file reading yields the same segments as iter_segments."""
+        content = SAMPLE * 4 + b"SE*13*0001"
+        path = tmp_path / "sample.x12"
+        path.write_bytes(content)
+
+        expected = list(iter_segments(content))
+
+        assert list(iter_file_segments(str(path), chunk_size=7)) == expected
+        assert list(iter_file_segments(str(path))) == expected
+
+    def test_segment_id(self):
+        """Test segment identifier extraction."""
+        assert segment_id(b"NM1*IL*1*DOE") == b"NM1"
+        assert segment_id(b"SE") == b"SE"
+
+    def test_split_elements(self):
+        """Test decoding and splitting a segment into elements."""
+        assert split_elements(b"HL*1**20*1") == ["HL", "1", "", "20", "1"]
+        assert decode_segment(b"TRN*2*CLAIM001") == "TRN*2*CLAIM001"
+
+    def test_find_segment_at_segment_boundary(self):
+        """Test only segments starting with the identifier are matched."""
+        content = b"ISA*00*TEST~\nGS*HN*ST*1~\nST*835*0001~SE*2*0001~"
+
+        assert find_segment(content, b"ST") == b"ST*835*0001"
+        assert find_segment(content, b"NM1") is None
+
+    def test_find_segment_complete_rejects_truncated_segment(self):
+        """Test a segment without its terminator is only returned when allowed."""
+        content = b"ISA*00*TEST~\nST*277*00"
+
+        assert find_segment(content, b"ST") == b"ST*277*00"
+        assert find_segment(content, b"ST", complete=True) is None
+
+    def test_sniff_delimiters_from_isa(self):
+        """Test delimiters are read from the fixed-width ISA header."""
+        content = ISA + b"\nST|835|0001!"
+
+        assert sniff_delimiters(content) == (b"|", b"!")
+        assert find_segment(content, b"ST", b"!", b"|") == b"ST|835|0001"
+        assert split_elements(b"ST|835|0001", b"|") == ["ST", "835", "0001"]
+        assert sniff_delimiters(b"ST*835~") == (b"*", b"~")